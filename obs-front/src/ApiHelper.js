@@ -39,6 +39,10 @@ export function getOperationUrl(operationId) {
     return `${MASTER_API_ADDRESS}/api/v1/operations/${operationId}`
 }
 
+export function getOperationEventsUrl(operationId) {
+    return `${MASTER_API_ADDRESS}/api/v1/operations/${operationId}/events`
+}
+
 const OPERATION_STATUS_LABELS = {
     pending: 'Queued',
     running: 'In progress',
@@ -66,6 +70,24 @@ export async function pollOperation(
         return `Bearer ${token}`;
     };
 
+    // Prefer the server-sent events stream; fall back to polling if it is
+    // unavailable or drops before the operation finishes.
+    let streamed = null;
+    try {
+        streamed = await streamOperation(operationId, await resolveAuthHeader(), { timeoutMs, onProgress });
+    } catch (error) {
+        if (error.message === 'Operation not found') {
+            throw error;
+        }
+        console.warn('Operation stream unavailable, polling instead.', error);
+    }
+    if (streamed?.status === 'succeeded') {
+        return streamed;
+    }
+    if (streamed?.status === 'failed') {
+        throw new Error(streamed.error || 'Operation failed');
+    }
+
     while (Date.now() - startedAt < timeoutMs) {
         const response = await fetch(getOperationUrl(operationId), {
             headers: {
@@ -98,6 +120,61 @@ export async function pollOperation(
     throw new Error('Operation timed out');
 }
 
+async function streamOperation(operationId, authHeader, { timeoutMs, onProgress }) {
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), timeoutMs);
+    try {
+        const response = await fetch(getOperationEventsUrl(operationId), {
+            headers: {
+                Accept: 'text/event-stream',
+                Authorization: authHeader,
+            },
+            signal: controller.signal,
+        });
+        if (response.status === 404) {
+            throw new Error('Operation not found');
+        }
+        if (!response.ok || !response.body) {
+            throw new Error(`Failed to open operation stream (${response.status})`);
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let operation = null;
+        for (;;) {
+            const { value, done } = await reader.read();
+            if (done) {
+                return operation;
+            }
+            buffer += decoder.decode(value, { stream: true });
+            let separator = buffer.indexOf('\n\n');
+            while (separator !== -1) {
+                const message = buffer.slice(0, separator);
+                buffer = buffer.slice(separator + 2);
+                const data = message
+                    .split('\n')
+                    .filter((line) => line.startsWith('data:'))
+                    .map((line) => line.slice(5).trim())
+                    .join('\n');
+                if (data) {
+                    operation = JSON.parse(data);
+                    if (onProgress) {
+                        onProgress(operation);
+                    }
+                    if (operation.status === 'succeeded' || operation.status === 'failed') {
+                        controller.abort();
+                        return operation;
+                    }
+                }
+                separator = buffer.indexOf('\n\n');
+            }
+        }
+    } finally {
+        clearTimeout(timer);
+    }
+}
+
 //Root console address
 export let globalRootConsole = 'N/A';
 
@@ -0,0 +1,168 @@
+import http.client
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+
+DEFAULT_AGENT_PORT = 8080
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+DEFAULT_MAX_IDLE_PER_HOST = 4
+# Agents run on Node.js, whose HTTP server drops idle keep-alive sockets after 5s.
+DEFAULT_IDLE_TIMEOUT_SECONDS = 4.0
+
+# Errors raised when a pooled socket was closed by the agent while idle.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+# Methods safe to send again when a stale socket fails after the request went out.
+_RETRYABLE_METHODS = frozenset(("GET", "HEAD"))
+
+
+class AgentConnectionPool:
+    """Thread-safe pool of keep-alive HTTP connections to the agents.
+
+    Connections are kept per host and reused across calls, so metric polling
+    and edge wiring do not pay a TCP handshake and DNS lookup per request.
+    The number of simultaneous connections per host is bounded, and sockets
+    left idle longer than 'idle_timeout_seconds' are closed. Hosts with no
+    request in flight and no idle socket are forgotten, as agent IPs change
+    with every rollout.
+    """
+
+    def __init__(
+        self,
+        port: int = DEFAULT_AGENT_PORT,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        max_idle_per_host: int = DEFAULT_MAX_IDLE_PER_HOST,
+        idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+    ):
+        self._port = port
+        self._max_connections_per_host = max_connections_per_host
+        self._max_idle_per_host = max_idle_per_host
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._idle: Dict[str, Deque[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_users: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        host: str,
+        method: str,
+        path: str,
+        body: str | None = None,
+        headers: Dict[str, str] | None = None,
+        timeout: float = 1,
+    ) -> Tuple[int, bytes]:
+        """Sends a request to 'host' and returns the response status and body."""
+        slot = self.__acquire_host_slot(host)
+        try:
+            if not slot.acquire(timeout=timeout):
+                raise TimeoutError(f"No free connection to {host} after {timeout}s")
+            try:
+                conn, reused = self.__checkout(host, timeout)
+                sent = False
+                try:
+                    self.__write(conn, method, path, body, headers)
+                    sent = True
+                    return self.__read(host, conn)
+                except _STALE_CONNECTION_ERRORS:
+                    # The agent closed the idle socket. Retry once on a new one,
+                    # unless the agent may already have acted on the request.
+                    if not reused or (sent and method.upper() not in _RETRYABLE_METHODS):
+                        raise
+                    conn = self.__new_connection(host, timeout)
+                    self.__write(conn, method, path, body, headers)
+                    return self.__read(host, conn)
+            finally:
+                slot.release()
+        finally:
+            self.__release_host_slot(host)
+
+    def evict_idle(self):
+        now = time.monotonic()
+        with self._lock:
+            for host in list(self._idle):
+                connections = self._idle[host]
+                while connections and now - connections[0][1] > self._idle_timeout_seconds:
+                    connections.popleft()[0].close()
+                if not connections:
+                    del self._idle[host]
+                    if not self._host_users.get(host):
+                        self._host_slots.pop(host, None)
+
+    def close(self):
+        with self._lock:
+            for connections in self._idle.values():
+                for conn, _ in connections:
+                    conn.close()
+            self._idle.clear()
+
+    def __acquire_host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self._max_connections_per_host)
+                self._host_slots[host] = slot
+            self._host_users[host] = self._host_users.get(host, 0) + 1
+            return slot
+
+    def __release_host_slot(self, host: str):
+        with self._lock:
+            users = self._host_users[host] - 1
+            if users:
+                self._host_users[host] = users
+                return
+            del self._host_users[host]
+            if host not in self._idle:
+                self._host_slots.pop(host, None)
+
+    def __new_connection(self, host: str, timeout: float) -> http.client.HTTPConnection:
+        return http.client.HTTPConnection(host=host, port=self._port, timeout=timeout)
+
+    def __checkout(self, host: str, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        self.evict_idle()
+        with self._lock:
+            connections = self._idle.get(host)
+            if connections:
+                # Most recently used first: it is the least likely to be stale.
+                conn, _ = connections.pop()
+                if not connections:
+                    del self._idle[host]
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                conn.timeout = timeout
+                return conn, True
+        return self.__new_connection(host, timeout), False
+
+    def __checkin(self, host: str, conn: http.client.HTTPConnection):
+        with self._lock:
+            connections = self._idle.setdefault(host, deque())
+            if len(connections) < self._max_idle_per_host:
+                connections.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def __write(self, conn, method, path, body, headers):
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+        except BaseException:
+            conn.close()
+            raise
+
+    def __read(self, host, conn) -> Tuple[int, bytes]:
+        try:
+            response = conn.getresponse()
+            data = response.read()
+        except BaseException:
+            conn.close()
+            raise
+        if response.will_close:
+            conn.close()
+        else:
+            self.__checkin(host, conn)
+        return response.status, data
@@ -2,6 +2,11 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 
 class AgentManagerInterface(ABC): 
+    """
+    Agent interaction contract. Implementations may define the methods either
+    as plain functions or as coroutines; main.py awaits coroutines and runs
+    plain functions in a worker thread.
+    """
 
     @abstractmethod
     def get_agent_metrics(self, user_id, id): 
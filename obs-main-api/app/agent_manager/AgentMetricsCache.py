@@ -0,0 +1,86 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+
+DEFAULT_AGENT_METRICS_CACHE_TTL_SECONDS = 2.0
+
+MetricsKey = Tuple[str, str]
+
+
+class AgentMetricsCache:
+    """
+    Short-lived cache of agent metrics, keyed by (user, agent).
+
+    Concurrent requests for the same agent share a single scrape: the first
+    caller starts the load and the others await the same future. Results are
+    reused for 'ttl_seconds'. invalidate() drops an entry and detaches any
+    scrape in flight, so a user sees their own metric changes right away.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_AGENT_METRICS_CACHE_TTL_SECONDS):
+        self._ttl_seconds = ttl_seconds
+        self._entries: Dict[MetricsKey, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._in_flight: Dict[MetricsKey, asyncio.Future] = {}
+        self._generations: Dict[MetricsKey, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    async def get(
+        self,
+        user_id: str,
+        agent_id: str,
+        loader: Callable[[], Awaitable[List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        key = (user_id, agent_id)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._hits += 1
+            return self.__copy(entry[1])
+
+        future = self._in_flight.get(key)
+        if future is None:
+            self._misses += 1
+            future = asyncio.ensure_future(self.__load(key, loader, self._generations.get(key, 0)))
+            self._in_flight[key] = future
+        else:
+            self._coalesced += 1
+        # Shielded: a caller hitting its own deadline must not cancel the
+        # scrape other callers are waiting for.
+        return self.__copy(await asyncio.shield(future))
+
+    async def __load(self, key: MetricsKey, loader, generation: int) -> List[Dict[str, Any]]:
+        try:
+            metrics = await loader()
+            if self._generations.get(key, 0) == generation and self._ttl_seconds > 0:
+                self._entries[key] = (time.monotonic() + self._ttl_seconds, metrics)
+            return metrics
+        finally:
+            if self._in_flight.get(key) is asyncio.current_task():
+                del self._in_flight[key]
+
+    def invalidate(self, user_id: str, agent_id: str | None = None):
+        """Drops the cached metrics of one agent, or of every agent of the user."""
+        keys = {key for key in list(self._entries) + list(self._in_flight) if key[0] == user_id}
+        if agent_id is not None:
+            keys = {(user_id, agent_id)}
+        for key in keys:
+            self._entries.pop(key, None)
+            self._in_flight.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "inFlight": len(self._in_flight),
+            "ttlSeconds": self._ttl_seconds,
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+        }
+
+    @staticmethod
+    def __copy(metrics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Callers decorate the metric dicts (e.g. with alerts); keep ours intact.
+        return [dict(metric) for metric in metrics]
@@ -0,0 +1,153 @@
+import urllib.parse
+import json
+import os
+
+import httpx  # type: ignore
+
+from agent_manager.AgentManagerInterface import AgentManagerInterface
+from agent_manager.AgentConnectionPool import (
+    DEFAULT_AGENT_PORT,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_IDLE_TIMEOUT_SECONDS,
+)
+from agent_manager.OpenShiftAgentManager import AgentRequestError
+from typing import Any
+
+
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+class AsyncOpenShiftAgentManager(AgentManagerInterface):
+    """
+    Coroutine-based variant of OpenShiftAgentManager. All the agent calls go
+    through one pooled httpx.AsyncClient, so no agent I/O runs on (or blocks)
+    the event loop thread. Selected with AGENT_MANAGER=async.
+    """
+
+    def __init__(self):
+        print("... Starting OpenShift Agent Manager (async)")
+        self.__port = DEFAULT_AGENT_PORT
+        self.__client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("AGENT_POOL_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)),
+                max_keepalive_connections=int(os.getenv(
+                    "AGENT_POOL_MAX_CONNECTIONS_PER_HOST", DEFAULT_MAX_CONNECTIONS_PER_HOST)),
+                keepalive_expiry=float(os.getenv(
+                    "AGENT_POOL_IDLE_TIMEOUT_SECONDS", DEFAULT_IDLE_TIMEOUT_SECONDS)),
+            ),
+        )
+
+    async def aclose(self):
+        await self.__client.aclose()
+
+    def __url(self, host: str, path: str) -> str:
+        return f"http://{host}:{self.__port}{path}"
+
+    def __raise_for_status(self, response: httpx.Response):
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise AgentRequestError(response.status_code, response.text) from e
+
+    async def get_agent_metrics(self, user_id, id):
+        print(f"Agent {id}. Getting metrics")
+        try:
+            response = await self.__client.get(self.__url(id, "/metrics"), timeout=1)
+            self.__raise_for_status(response)
+            result = response.text
+            json_result = json.loads(result)
+            print("Response received successfully:")
+            print(result)
+        except httpx.TimeoutException as e:
+            print(f"Connection error occurred: timeout ({e!r})")
+            raise TimeoutError(f"Timed out getting metrics from {id}") from e
+        except httpx.TransportError as e:
+            print(f"Connection error occurred: {e!r}")
+            raise ConnectionError(f"Cannot reach agent {id}: {e}") from e
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            raise
+        return json_result
+
+    async def set_agent_metrics(self, method: str, user_id: str, payload: dict[str, Any]):
+        print("set_agent_metric")
+        print(payload)
+        print("----------------")
+
+        try:
+            agent_dns = payload['dns']
+            agent_id = payload['id']
+            metricInfo = payload['metric']
+
+            path = "/metrics/" + metricInfo['name']
+            params = {
+                "name": metricInfo['name'],
+                "value": metricInfo['value']
+            }
+            full_path = f"{path}?{urllib.parse.urlencode(params)}"
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            raise
+
+        print(f"Agent {agent_id}. Setting metric {metricInfo['name']}[{method}]")
+
+        response = await self.__request_agent_metric(agent_dns, method, full_path)
+        if method == "PUT" and response.status_code == 404:
+            print(
+                f"Metric {metricInfo['name']} not found on agent; creating with POST instead."
+            )
+            response = await self.__request_agent_metric(agent_dns, "POST", full_path)
+
+        if response.status_code >= 400:
+            raise AgentRequestError(response.status_code, response.text)
+
+        return response.text
+
+    async def __request_agent_metric(self, agent_dns: str, method: str, full_path: str) -> httpx.Response:
+        try:
+            response = await self.__client.request(method, self.__url(agent_dns, full_path), timeout=1)
+            print(f"Requested: {method} {full_path}")
+            print("Response received successfully:")
+            print(response.text)
+            return response
+        except httpx.HTTPError as e:
+            print(f"HTTP error occurred: {e!r}")
+            raise
+
+    async def kick(self, user_id, agent_id, agent_dns, kick_initial_count):
+        print(f"Agent {agent_id}[{agent_dns}] kicking (count={kick_initial_count})...")
+        try:
+            response = await self.__client.post(
+                self.__url(agent_dns, "/operations/order"),
+                json={"count": kick_initial_count},
+                timeout=2,
+            )
+            print(response.text)
+            self.__raise_for_status(response)
+        except httpx.TimeoutException:
+            print("The request timed out.")
+            raise
+        except Exception as e:
+            print(f"Request failed: {e!r}")
+            raise
+        return True
+
+    async def set_agent_communication_path(self, user_id, sourceAgent, targetAgent):
+        print(f"Calling POST http://{sourceAgent}:{self.__port}/agents/{targetAgent}")
+        try:
+            response = await self.__client.post(
+                self.__url(sourceAgent, "/agents/" + targetAgent),
+                json={"ip": targetAgent, "port": self.__port},
+                timeout=2,
+            )
+            print(response.text)
+            self.__raise_for_status(response)
+        except httpx.TimeoutException:
+            print("The request timed out.")
+            raise
+        except Exception as e:
+            print(f"Request failed: {e!r}")
+            raise
+
+    async def delete_metrics_definitions(self, user_id):
+        pass
@@ -1,9 +1,15 @@
 import http.client
 import urllib.parse
 import json
+import os
 import socket
 
 from agent_manager.AgentManagerInterface import AgentManagerInterface
+from agent_manager.AgentConnectionPool import (
+    AgentConnectionPool,
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    DEFAULT_IDLE_TIMEOUT_SECONDS,
+)
 from typing import Any
 
 
@@ -18,17 +24,19 @@ class OpenShiftAgentManager(AgentManagerInterface):
 
     def __init__(self):
         print("... Starting OpenShift Agent Manager")
+        self.__pool = AgentConnectionPool(
+            max_connections_per_host=int(os.getenv(
+                "AGENT_POOL_MAX_CONNECTIONS_PER_HOST", DEFAULT_MAX_CONNECTIONS_PER_HOST)),
+            idle_timeout_seconds=float(os.getenv(
+                "AGENT_POOL_IDLE_TIMEOUT_SECONDS", DEFAULT_IDLE_TIMEOUT_SECONDS)),
+        )
     
     def get_agent_metrics(self, user_id, id):
         print(f"Agent {id}. Getting metrics")
         
         json_result = []
         try:
-            conn = http.client.HTTPConnection(host=id, port=8080, timeout=1)
-            conn.request("GET", "/metrics")
-            
-            response = conn.getresponse()
-            data = response.read()        
+            _, data = self.__pool.request(id, "GET", "/metrics", timeout=1)
             try:
                 # Try to decode the response content
                 result = data.decode("utf-8")
@@ -50,9 +58,6 @@ class OpenShiftAgentManager(AgentManagerInterface):
             # General exception handler for other potential errors
             print(f"An error occurred: {e}")
             raise
-        finally:
-            # Ensure the connection is closed
-            conn.close()
         return json_result
 
     def set_agent_metrics(self, method: str, user_id:str, payload: dict[str, Any]):
@@ -95,14 +100,10 @@ class OpenShiftAgentManager(AgentManagerInterface):
         return result["body"]
 
     def __request_agent_metric(self, agent_dns: str, method: str, full_path: str) -> dict:
-        conn = http.client.HTTPConnection(host=agent_dns, port=8080, timeout=1)
         try:
-            conn.request(method, full_path)
+            status, data = self.__pool.request(agent_dns, method, full_path, timeout=1)
             print(f"Requested: {method} {full_path}")
 
-            response = conn.getresponse()
-            data = response.read()
-
             try:
                 body = data.decode("utf-8")
             except UnicodeDecodeError:
@@ -110,7 +111,7 @@ class OpenShiftAgentManager(AgentManagerInterface):
 
             print("Response received successfully:")
             print(body)
-            return {"status": response.status, "body": body}
+            return {"status": status, "body": body}
         except http.client.HTTPException as e:
             print(f"HTTP error occurred: {e}")
             raise
@@ -120,8 +121,6 @@ class OpenShiftAgentManager(AgentManagerInterface):
         except Exception as e:
             print(f"An error occurred: {e}")
             raise
-        finally:
-            conn.close()
     
     def kick(self, user_id, agent_id, agent_dns, kick_initial_count):
         #agent_dns = payload['ip']
@@ -133,16 +132,14 @@ class OpenShiftAgentManager(AgentManagerInterface):
         }
         json_agent_kick_payload = json.dumps(agent_kick_payload)
         try:
-            conn = http.client.HTTPConnection(agent_dns, 8080, timeout=2)
             headers = {
                 'Content-Type': 'application/json'
             }
             # Make the POST request, attaching the JSON body
             print(f"Agent {agent_id}[{agent_dns}] kicking (count={kick_initial_count})...")
-            conn.request("POST", "/operations/order", body=json_agent_kick_payload, headers=headers)
-            # Get the response
-            response = conn.getresponse()
-            data = response.read()
+            _, data = self.__pool.request(
+                agent_dns, "POST", "/operations/order",
+                body=json_agent_kick_payload, headers=headers, timeout=2)
 
             # Print the response data
             print(data.decode("utf-8"))
@@ -154,10 +151,6 @@ class OpenShiftAgentManager(AgentManagerInterface):
             # Handle other possible exceptions
             print(f"Request failed: {e}")
             raise
-
-        finally:
-            # Close the connection
-            conn.close()
         return True
     
     def set_agent_communication_path(self, user_id, sourceAgent, targetAgent):
@@ -169,15 +162,13 @@ class OpenShiftAgentManager(AgentManagerInterface):
         }
         json_next_hop_address = json.dumps(next_hop_address)
         try:
-            conn = http.client.HTTPConnection(sourceAgent, 8080, timeout=2)
             headers = {
                 'Content-Type': 'application/json'
             }
             # Make the POST request, attaching the JSON body
-            conn.request("POST", "/agents/" + targetAgent, body=json_next_hop_address, headers=headers)
-            # Get the response
-            response = conn.getresponse()
-            data = response.read()
+            _, data = self.__pool.request(
+                sourceAgent, "POST", "/agents/" + targetAgent,
+                body=json_next_hop_address, headers=headers, timeout=2)
 
             # Print the response data
             print(data.decode("utf-8"))
@@ -190,9 +181,5 @@ class OpenShiftAgentManager(AgentManagerInterface):
             print(f"Request failed: {e}")
             raise
 
-        finally:
-            # Close the connection
-            conn.close()
-
     async def delete_metrics_definitions(self, user_id):
         pass
\ No newline at end of file
@@ -0,0 +1,43 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+
+MetricsFetcher = Callable[[asyncio.Semaphore, Dict[str, Any]], Awaitable[List[Dict[str, Any]]]]
+
+
+async def collect_agent_metrics(
+    agents: List[Dict[str, Any]],
+    fetch: MetricsFetcher,
+    concurrency: int,
+    deadline_seconds: float,
+):
+    """
+    Fetches the metrics of all the agents concurrently with fetch(semaphore,
+    agent), bounded by a semaphore of 'concurrency' slots and by
+    'deadline_seconds' overall, and stores them in each agent's 'metrics'.
+    Agents that fail or do not answer in time get an empty metric list and a
+    'metricsError' marker instead of failing the whole simulation.
+    """
+    if not agents:
+        return
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    tasks = {asyncio.create_task(fetch(semaphore, item)): item for item in agents}
+    _, pending = await asyncio.wait(tasks, timeout=deadline_seconds)
+    for task in pending:
+        task.cancel()
+
+    for task, item in tasks.items():
+        if task in pending:
+            print(f"WARNING[metrics]: Agent {item['id']} did not answer in {deadline_seconds}s")
+            item["metrics"] = []
+            item["metricsError"] = "Timed out fetching agent metrics"
+            continue
+        if task.exception() is not None:
+            print(f"WARNING[metrics]: Agent {item['id']} metrics unavailable: {task.exception()}")
+            item["metrics"] = []
+            item["metricsError"] = str(task.exception()) or type(task.exception()).__name__
+            continue
+        metrics = task.result()
+        for metric in metrics:
+            metric["alerts"] = []
+        print(f"Pod: {item.get('pod')}. Metrics: {metrics}")
+        item["metrics"] = metrics
@@ -0,0 +1,43 @@
+from typing import Any, Dict, List, Set, Tuple
+
+
+def attach_alerts_to_metrics(agents: List[Dict[str, Any]], alerts: List[Dict[str, Any]]):
+    """
+    Appends every 'metricAgent' alert definition to the 'alerts' list of the
+    metric it watches, in place. Alerts already present on the metric (by
+    name) are not added twice.
+
+    Agents and metrics are indexed once by (agent id, metric name), so the
+    join is linear in the number of agents, metrics and alerts.
+    """
+    agent_ids: Set[str] = set()
+    metrics_by_key: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for agent in agents:
+        # Only the first agent with a given id is considered.
+        if agent["id"] in agent_ids:
+            continue
+        agent_ids.add(agent["id"])
+        for metric in agent.get("metrics", []):
+            metrics_by_key.setdefault((agent["id"], metric["name"]), metric)
+
+    alert_names_by_key: Dict[Tuple[str, str], Set[str]] = {}
+    for alert in alerts:
+        if alert["scope"] != "metricAgent":
+            continue
+        agent_id = alert["definition"]["agent"]
+        metric_name = alert["definition"]["metric"]
+        if agent_id not in agent_ids:
+            print(f"WARNING[alerts]: Agent {agent_id} Not found")
+            continue
+        key = (agent_id, metric_name)
+        metric = metrics_by_key.get(key)
+        if metric is None:
+            print(f"WARNING[alerts]: Metric {metric_name} for the agent {agent_id} not found")
+            continue
+        alert_names = alert_names_by_key.get(key)
+        if alert_names is None:
+            alert_names = {item["name"] for item in metric.get("alerts", [])}
+            alert_names_by_key[key] = alert_names
+        if alert["name"] not in alert_names:
+            alert_names.add(alert["name"])
+            metric.setdefault("alerts", []).append(alert)
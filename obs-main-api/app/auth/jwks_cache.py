@@ -0,0 +1,109 @@
+import asyncio
+import time
+from typing import Any, Dict
+
+import httpx  # type: ignore
+
+
+DEFAULT_JWKS_CACHE_TTL_SECONDS = 300
+DEFAULT_JWKS_NEGATIVE_TTL_SECONDS = 60
+DEFAULT_JWKS_MIN_REFRESH_INTERVAL_SECONDS = 10
+DEFAULT_JWKS_FETCH_TIMEOUT_SECONDS = 5
+
+
+class JwksFetchError(RuntimeError):
+    pass
+
+
+class JwksCache:
+    """In-process cache of the IdP signing keys (JWKS), keyed by 'kid'.
+
+    Keys are refreshed when the TTL expires or when a token arrives with an
+    unknown 'kid' (key rotation). Only one coroutine performs a refresh at a
+    time; concurrent callers wait for it and reuse the result. Unknown kids are
+    remembered for a while so bogus tokens cannot force a JWKS download each.
+    The JWKS is fetched with a pooled async client, so a slow IdP only delays
+    the requests that actually miss the cache.
+    """
+
+    def __init__(
+        self,
+        certs_url: str,
+        ttl_seconds: int = DEFAULT_JWKS_CACHE_TTL_SECONDS,
+        negative_ttl_seconds: int = DEFAULT_JWKS_NEGATIVE_TTL_SECONDS,
+        min_refresh_interval_seconds: int = DEFAULT_JWKS_MIN_REFRESH_INTERVAL_SECONDS,
+        fetch_timeout_seconds: int = DEFAULT_JWKS_FETCH_TIMEOUT_SECONDS,
+    ):
+        self._certs_url = certs_url
+        self._ttl_seconds = ttl_seconds
+        self._negative_ttl_seconds = negative_ttl_seconds
+        self._min_refresh_interval_seconds = min_refresh_interval_seconds
+        self._fetch_timeout_seconds = fetch_timeout_seconds
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at = 0.0
+        self._unknown_kids: Dict[str, float] = {}
+        self._refresh_lock = asyncio.Lock()
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self._fetch_timeout_seconds)
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_key(self, kid: str) -> Dict[str, Any] | None:
+        """Return the JWK for 'kid', or None when the IdP does not publish it."""
+        now = time.monotonic()
+        key = self._keys.get(kid)
+        if key is not None and now - self._fetched_at < self._ttl_seconds:
+            return key
+
+        if key is None:
+            negative_until = self._unknown_kids.get(kid)
+            if negative_until is not None and now < negative_until:
+                return None
+            # A kid miss on a fresh key set only triggers a refresh once the
+            # minimum interval has passed, otherwise it is a plain miss.
+            if self._keys and now - self._fetched_at < self._min_refresh_interval_seconds:
+                return None
+
+        try:
+            await self._refresh(requested_at=now)
+        except JwksFetchError as e:
+            if key is not None:
+                print(f"WARNING[jwks]: Refresh failed, serving cached key '{kid}': {e}")
+                return key
+            raise
+
+        key = self._keys.get(kid)
+        if key is None:
+            self._remember_unknown_kid(kid)
+        return key
+
+    def _remember_unknown_kid(self, kid: str):
+        self._unknown_kids[kid] = time.monotonic() + self._negative_ttl_seconds
+
+    async def _refresh(self, requested_at: float):
+        async with self._refresh_lock:
+            # Another caller refreshed while this one was waiting for the lock.
+            if self._fetched_at > requested_at:
+                return
+            try:
+                response = await self._get_client().get(self._certs_url)
+                response.raise_for_status()
+                jwks = response.json()
+            except (httpx.HTTPError, ValueError) as e:
+                raise JwksFetchError(f"Error fetching public keys: {e}") from e
+
+            self._keys = {key["kid"]: key for key in jwks.get("keys", []) if "kid" in key}
+            self._fetched_at = time.monotonic()
+            now = self._fetched_at
+            self._unknown_kids = {
+                kid: until for kid, until in self._unknown_kids.items()
+                if until > now and kid not in self._keys
+            }
+            print(f"... JWKS refreshed from {self._certs_url}: {len(self._keys)} key(s)")
@@ -0,0 +1,65 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+
+DEFAULT_TOKEN_CACHE_MAX_ENTRIES = 1024
+
+
+class VerifiedTokenCache:
+    """Bounded LRU of already verified bearer tokens.
+
+    Entries are keyed by the SHA-256 digest of the raw token (the token itself
+    is never kept) and hold the authenticated username and the token 'exp'.
+    An entry stops being served, and is dropped, once the token expires.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_TOKEN_CACHE_MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def _digest(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> str | None:
+        digest = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(digest)
+                self._hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._entries[digest]
+            self._misses += 1
+            return None
+
+    def put(self, token: str, username: str, expires_at: float):
+        if self._max_entries <= 0 or expires_at <= time.time():
+            return
+        digest = self._digest(token)
+        with self._lock:
+            self._entries[digest] = (username, expires_at)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "maxEntries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hitRatio": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
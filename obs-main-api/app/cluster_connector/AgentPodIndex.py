@@ -0,0 +1,148 @@
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Iterable, NamedTuple
+
+from kubernetes import watch  # type: ignore
+
+from cluster_connector.ResourceInformer import ResourceInformer
+from cluster_connector.NamespaceInformers import (
+    NamespaceInformers,
+    DEFAULT_MAX_NAMESPACES,
+    DEFAULT_IDLE_SECONDS,
+)
+
+
+AGENT_LABEL_SELECTOR = "observability-demo-framework=agent"
+DEFAULT_SYNC_TIMEOUT_SECONDS = 5.0
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
+class AgentPod(NamedTuple):
+    name: str
+    phase: str
+
+
+def _is_ready(pod) -> bool:
+    conditions = (pod.status.conditions if pod.status else None) or []
+    return any(condition.type == "Ready" and condition.status == "True" for condition in conditions)
+
+
+def _rank(pod):
+    # Pods that are not being deleted, then ready ones, then the newest.
+    return (
+        pod.metadata.deletion_timestamp is None,
+        _is_ready(pod),
+        pod.metadata.creation_timestamp or _EPOCH,
+    )
+
+
+def _current_pod(pods: Iterable) -> AgentPod:
+    best = max(pods, key=_rank)
+    phase = best.status.phase if best.status else None
+    if best.metadata.deletion_timestamp is not None:
+        phase = "Terminating"
+    return AgentPod(best.metadata.name, phase or "Unknown")
+
+
+def _app(pod) -> str | None:
+    return (pod.metadata.labels or {}).get("app")
+
+
+class AgentPodIndex:
+    """
+    Index of the current pod of each agent Deployment, per namespace, kept up
+    to date by a label-filtered pod watch. Pods are grouped by their 'app'
+    label (the Deployment name).
+
+    During a rollout, several pods of the same agent exist for a while; the
+    one reported is the pod not being deleted, ready, and newest, in that
+    order of preference. The watches are bounded and stopped when idle (see
+    NamespaceInformers); until a namespace's watch has synced, its pods are
+    listed directly.
+    """
+
+    def __init__(
+        self,
+        core_v1_api,
+        sync_timeout_seconds: float = DEFAULT_SYNC_TIMEOUT_SECONDS,
+        max_namespaces: int = DEFAULT_MAX_NAMESPACES,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        watch_factory=watch.Watch,
+    ):
+        self._core_v1_api = core_v1_api
+        self._watch_factory = watch_factory
+        self._sync_timeout_seconds = sync_timeout_seconds
+        self._lock = threading.Lock()
+        self._informers = NamespaceInformers(
+            self.__create_informer,
+            max_namespaces=max_namespaces,
+            idle_seconds=idle_seconds,
+            on_evict=lambda namespace, informer: self.__forget(namespace),
+        )
+        # namespace -> app -> pod name -> pod
+        self._pods: Dict[str, Dict[str, Dict[str, object]]] = {}
+        # namespace -> app -> current pod
+        self._current: Dict[str, Dict[str, AgentPod]] = {}
+
+    def __create_informer(self, namespace: str) -> ResourceInformer:
+        informer = ResourceInformer(
+            self._core_v1_api.list_namespaced_pod,
+            namespace,
+            AGENT_LABEL_SELECTOR,
+            name=f"pods-{namespace}",
+            watch_factory=self._watch_factory,
+        )
+        informer.add_listener(
+            lambda event_type, pod: self._on_pod(informer, namespace, event_type, pod))
+        return informer
+
+    def __forget(self, namespace: str):
+        with self._lock:
+            self._pods.pop(namespace, None)
+            self._current.pop(namespace, None)
+
+    def _on_pod(self, informer: ResourceInformer, namespace: str, event_type: str, pod):
+        app = _app(pod)
+        if not app:
+            return
+        with self._lock:
+            if self._informers.peek(namespace) is not informer:
+                # Late event of an evicted informer.
+                return
+            pods = self._pods.setdefault(namespace, {}).setdefault(app, {})
+            if event_type == "DELETED":
+                pods.pop(pod.metadata.name, None)
+            else:
+                pods[pod.metadata.name] = pod
+            current = self._current.setdefault(namespace, {})
+            if not pods:
+                del self._pods[namespace][app]
+                current.pop(app, None)
+                return
+            current[app] = _current_pod(pods.values())
+
+    def __list_pods(self, namespace: str) -> Dict[str, AgentPod]:
+        pods = self._core_v1_api.list_namespaced_pod(namespace, label_selector=AGENT_LABEL_SELECTOR)
+        by_app: Dict[str, list] = {}
+        for pod in pods.items:
+            app = _app(pod)
+            if app:
+                by_app.setdefault(app, []).append(pod)
+        return {app: _current_pod(app_pods) for app, app_pods in by_app.items()}
+
+    def pods(self, namespace: str) -> Dict[str, AgentPod]:
+        """Returns the current pod of every agent in the namespace, by Deployment name."""
+        informer = self._informers.get(namespace)
+        if not informer.wait_for_sync(self._sync_timeout_seconds):
+            print(f"WARNING[pods]: Pod index of '{namespace}' not synced yet, listing its pods.")
+            return self.__list_pods(namespace)
+        with self._lock:
+            return dict(self._current.get(namespace, {}))
+
+    def evict(self, namespace: str):
+        """Stops watching a namespace being torn down and forgets its pods."""
+        self._informers.evict(namespace)
+        self.__forget(namespace)
+
+    def close(self):
+        self._informers.close()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any
 
 
 class ClusterConnectorInterface(ABC):
@@ -9,7 +9,7 @@ class ClusterConnectorInterface(ABC):
         pass
 
     @abstractmethod
-    def create_simulation_resources(self, user, payload: List[Dict[str, Any]], stack):
+    def create_simulation_resources(self, user, payload: List[Dict[str, Any]], stack, progress_callback=None):
         pass
 
     @abstractmethod
@@ -56,6 +56,14 @@ class ClusterConnectorInterface(ABC):
     def get_users_json(self):
         pass
 
+    @abstractmethod
+    def update_users(self, mutate: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def release_user(self, user):
+        pass
+
     @abstractmethod
     def sync_users(self):
         pass
@@ -78,3 +86,15 @@ class ClusterConnectorInterface(ABC):
         metadata: Dict[str, Any] | None = None,
     ):
         pass
+
+    @abstractmethod
+    def get_simulation_storage_stats(self) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def add_operation_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        pass
+
+    @abstractmethod
+    def compact_operations(self, policy) -> int:
+        pass
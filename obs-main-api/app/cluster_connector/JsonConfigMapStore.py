@@ -0,0 +1,167 @@
+import copy
+import json
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from kubernetes import watch  # type: ignore
+from kubernetes.client.rest import ApiException  # type: ignore
+
+from cluster_connector.ResourceInformer import ResourceInformer
+from cluster_connector.NamespaceInformers import (
+    NamespaceInformers,
+    DEFAULT_MAX_NAMESPACES,
+    DEFAULT_IDLE_SECONDS,
+)
+
+
+STORAGE_LABEL_SELECTOR = "observability-demo-framework=storage"
+DEFAULT_SYNC_TIMEOUT_SECONDS = 5.0
+DEFAULT_MAX_UPDATE_ATTEMPTS = 5
+
+
+class ConfigMapConflictError(RuntimeError):
+    pass
+
+
+class JsonConfigMapStore:
+    """
+    JSON documents stored under one key of the framework ConfigMaps
+    (label observability-demo-framework=storage).
+
+    Each namespace read through the store gets a ResourceInformer on those
+    ConfigMaps, so reads are served from memory; the parsed document is kept
+    per resourceVersion and handed out as a copy. The informers are bounded
+    and stopped when idle (see NamespaceInformers); an evicted namespace is
+    simply watched again on its next read. Writes are compare-and-swap
+    on the ConfigMap resourceVersion: update() applies a mutator to the
+    current document and retries it against a fresh read on conflict.
+    """
+
+    def __init__(
+        self,
+        core_v1_api,
+        sync_timeout_seconds: float = DEFAULT_SYNC_TIMEOUT_SECONDS,
+        max_update_attempts: int = DEFAULT_MAX_UPDATE_ATTEMPTS,
+        max_namespaces: int = DEFAULT_MAX_NAMESPACES,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        watch_factory=watch.Watch,
+    ):
+        self._core_v1_api = core_v1_api
+        self._watch_factory = watch_factory
+        self._sync_timeout_seconds = sync_timeout_seconds
+        self._max_update_attempts = max_update_attempts
+        self._lock = threading.Lock()
+        self._informers = NamespaceInformers(
+            self.__create_informer,
+            max_namespaces=max_namespaces,
+            idle_seconds=idle_seconds,
+            on_evict=lambda namespace, informer: self.__drop_parsed(namespace),
+        )
+        self._parsed: Dict[Tuple[str, str, str], Tuple[str, Any]] = {}
+
+    def __create_informer(self, namespace: str) -> ResourceInformer:
+        return ResourceInformer(
+            self._core_v1_api.list_namespaced_config_map,
+            namespace,
+            STORAGE_LABEL_SELECTOR,
+            name=f"storage-{namespace}",
+            watch_factory=self._watch_factory,
+        )
+
+    def __drop_parsed(self, namespace: str):
+        with self._lock:
+            for cache_key in [cache_key for cache_key in self._parsed if cache_key[0] == namespace]:
+                del self._parsed[cache_key]
+
+    def _informer(self, namespace: str) -> ResourceInformer | None:
+        informer = self._informers.get(namespace)
+        if informer.wait_for_sync(self._sync_timeout_seconds):
+            return informer
+        return None
+
+    def _read_configmap(self, name: str, namespace: str, cached: bool = True):
+        informer = self._informer(namespace) if cached else None
+        if informer is not None:
+            return informer.get(name)
+        try:
+            return self._core_v1_api.read_namespaced_config_map(name, namespace)
+        except ApiException as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def _parse(self, configmap, name: str, key: str, namespace: str, default: Any) -> Any:
+        if configmap is None or not configmap.data or key not in configmap.data:
+            return copy.deepcopy(default)
+        cache_key = (namespace, name, key)
+        resource_version = configmap.metadata.resource_version
+        with self._lock:
+            entry = self._parsed.get(cache_key)
+        if entry is None or entry[0] != resource_version:
+            entry = (resource_version, json.loads(configmap.data[key]))
+            with self._lock:
+                self._parsed[cache_key] = entry
+        return copy.deepcopy(entry[1])
+
+    def read(self, name: str, key: str, namespace: str, default: Any = None) -> Any:
+        configmap = self._read_configmap(name, namespace)
+        return self._parse(configmap, name, key, namespace, default)
+
+    def update(
+        self,
+        name: str,
+        key: str,
+        namespace: str,
+        mutate: Callable[[Any], Any],
+        default: Any = None,
+    ) -> Any:
+        """
+        Writes mutate(current document) if the ConfigMap did not change since
+        it was read, creating the ConfigMap when missing. Returns the written
+        document.
+        """
+        cached = True
+        for _ in range(self._max_update_attempts):
+            configmap = self._read_configmap(name, namespace, cached)
+            document = mutate(self._parse(configmap, name, key, namespace, default))
+            body = {
+                "metadata": {
+                    "name": name,
+                    "namespace": namespace,
+                    "labels": {"observability-demo-framework": "storage"},
+                },
+                "data": {key: json.dumps(document)},
+            }
+            try:
+                if configmap is None:
+                    written = self._core_v1_api.create_namespaced_config_map(namespace, body)
+                else:
+                    body["metadata"]["resourceVersion"] = configmap.metadata.resource_version
+                    # Keep the other keys of the ConfigMap.
+                    body["data"] = {**(configmap.data or {}), key: body["data"][key]}
+                    written = self._core_v1_api.replace_namespaced_config_map(name, namespace, body)
+            except ApiException as e:
+                if e.status != 409:
+                    raise
+                print(f"Conflict updating ConfigMap '{name}' in namespace '{namespace}', retrying.")
+                cached = False
+                continue
+            informer = self._informers.peek(namespace)
+            if informer is not None:
+                informer.upsert(written)
+            return document
+        raise ConfigMapConflictError(
+            f"Could not update ConfigMap '{name}' in namespace '{namespace}' "
+            f"after {self._max_update_attempts} attempts"
+        )
+
+    def evict(self, namespace: str):
+        """Stops watching a namespace whose documents are gone, e.g. a deleted simulation."""
+        self._informers.evict(namespace)
+        self.__drop_parsed(namespace)
+
+    def stats(self) -> Dict[str, Any]:
+        return self._informers.stats()
+
+    def close(self):
+        self._informers.close()
@@ -1,7 +1,7 @@
 from cluster_connector.ClusterConnectorInterface import ClusterConnectorInterface
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any
 from utils import JSONUtils
-from operations.operation_store import new_operation, utc_now_iso
+from operations.operation_store import new_operation, apply_operation_update
 
 import secrets, os, json 
 
@@ -14,6 +14,7 @@ class MockClusterConnector(ClusterConnectorInterface):
 
     def __init__(self): 
         print("... Starting Mock Cluster connector.")
+        self.__operation_listeners: List[Callable[[Dict[str, Any]], None]] = []
         if not os.path.exists(self.PATH_USERS_DEF):
             JSONUtils.save_json_to_file([], self.PATH_USERS_DEF)
         if not os.path.exists(self.PATH_OPERATIONS_DEF):
@@ -42,11 +43,13 @@ class MockClusterConnector(ClusterConnectorInterface):
         pod_suffix = f"{first_part}-{second_part}"
         return pod_suffix
     
-    def create_simulation_resources(self, user, payload: List[Dict[str, Any]]):
+    def create_simulation_resources(self, user, payload: List[Dict[str, Any]], stack=None, progress_callback=None):
         print("create simulation resources")
-        for item in payload:            
+        for index, item in enumerate(payload, start=1):            
                 item["ip"] = "1.2.3.4"
                 item["pod"] = item["id"] + "-" + self.__generate_pod_suffix()                
+                if progress_callback is not None:
+                    progress_callback(index, len(payload), "Creating agent resources")
         return payload
 
     def save_simulation(self, user, json_simulation):
@@ -110,6 +113,14 @@ class MockClusterConnector(ClusterConnectorInterface):
     def get_users_json(self):
         return JSONUtils.load_json_from_file(self.PATH_USERS_DEF) or []
 
+    def update_users(self, mutate: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        users = mutate(self.get_users_json())
+        self.update_users_json(users)
+        return users
+
+    def release_user(self, user):
+        pass
+
     def sync_users(self):
         return True
 
@@ -125,6 +136,7 @@ class MockClusterConnector(ClusterConnectorInterface):
         operation = new_operation(operation_type, metadata)
         operations[operation["id"]] = operation
         self.__save_operations(operations)
+        self.__notify_operation(operation)
         return operation["id"]
 
     def get_operation(self, operation_id: str) -> Dict[str, Any] | None:
@@ -142,14 +154,26 @@ class MockClusterConnector(ClusterConnectorInterface):
         operation = operations.get(operation_id)
         if operation is None:
             raise KeyError(f"Operation '{operation_id}' not found")
-        if status is not None:
-            operation["status"] = status
-        if error is not None:
-            operation["error"] = error
-        if result is not None:
-            operation["result"] = result
-        if metadata is not None:
-            operation["metadata"] = metadata
-        operation["updatedAt"] = utc_now_iso()
-        operations[operation_id] = operation
-        self.__save_operations(operations)
\ No newline at end of file
+        operations[operation_id] = apply_operation_update(operation, status, error, result, metadata)
+        self.__save_operations(operations)
+        self.__notify_operation(operations[operation_id])
+
+    def get_simulation_storage_stats(self) -> Dict[str, Any]:
+        size = os.path.getsize(self.PATH_SIMULATION_DEF) if os.path.exists(self.PATH_SIMULATION_DEF) else 0
+        return {"users": {}, "totalStoredBytes": size}
+
+    def add_operation_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        self.__operation_listeners.append(listener)
+
+    def __notify_operation(self, operation: Dict[str, Any]):
+        for listener in self.__operation_listeners:
+            listener(operation)
+
+    def compact_operations(self, policy) -> int:
+        operations = self.__load_operations()
+        expired = policy.select_expired(operations.values())
+        if expired:
+            for operation_id in expired:
+                operations.pop(operation_id, None)
+            self.__save_operations(operations)
+        return len(expired)
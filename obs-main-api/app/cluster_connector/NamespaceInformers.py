@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Tuple
+
+from cluster_connector.ResourceInformer import ResourceInformer
+
+
+DEFAULT_MAX_NAMESPACES = 64
+DEFAULT_IDLE_SECONDS = 600.0
+
+
+class NamespaceInformers:
+    """
+    ResourceInformers keyed by namespace, created and started on first use
+    with create(namespace). Each one holds a watch connection and a thread,
+    so at most 'max_namespaces' are kept: the least recently used one is
+    stopped to make room, and those not used for 'idle_seconds' are stopped
+    on the next access. on_evict(namespace, informer) is called for every
+    informer stopped this way, outside the lock, so the owner can drop what
+    it derived from it.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[str], ResourceInformer],
+        max_namespaces: int = DEFAULT_MAX_NAMESPACES,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        on_evict: Callable[[str, ResourceInformer], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._create = create
+        self._max_namespaces = max(1, max_namespaces)
+        self._idle_seconds = idle_seconds
+        self._on_evict = on_evict
+        self._clock = clock
+        self._lock = threading.Lock()
+        # namespace -> (informer, last use), least recently used first.
+        self._informers: "OrderedDict[str, Tuple[ResourceInformer, float]]" = OrderedDict()
+        self._created = 0
+        self._evicted = 0
+
+    def get(self, namespace: str) -> ResourceInformer:
+        """Returns the namespace's informer, started but maybe not synced yet."""
+        now = self._clock()
+        with self._lock:
+            evicted = self.__expire(now)
+            entry = self._informers.get(namespace)
+            if entry is None:
+                while len(self._informers) >= self._max_namespaces:
+                    evicted.append(self._informers.popitem(last=False))
+                informer = self._create(namespace)
+                informer.start()
+                self._created += 1
+            else:
+                informer = entry[0]
+            self._informers[namespace] = (informer, now)
+            self._informers.move_to_end(namespace)
+        self.__stop(evicted)
+        return informer
+
+    def peek(self, namespace: str) -> ResourceInformer | None:
+        """Returns the namespace's informer if there is one, without creating it."""
+        with self._lock:
+            entry = self._informers.get(namespace)
+        return entry[0] if entry is not None else None
+
+    def evict(self, namespace: str):
+        with self._lock:
+            entry = self._informers.pop(namespace, None)
+        if entry is not None:
+            self.__stop([(namespace, entry)])
+
+    def close(self):
+        with self._lock:
+            evicted = list(self._informers.items())
+            self._informers.clear()
+        self.__stop(evicted)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "namespaces": len(self._informers),
+                "maxNamespaces": self._max_namespaces,
+                "idleSeconds": self._idle_seconds,
+                "created": self._created,
+                "evicted": self._evicted,
+            }
+
+    def __expire(self, now: float) -> List[Tuple[str, Tuple[ResourceInformer, float]]]:
+        expired = []
+        if self._idle_seconds <= 0:
+            return expired
+        while self._informers:
+            namespace, entry = next(iter(self._informers.items()))
+            if now - entry[1] <= self._idle_seconds:
+                break
+            expired.append((namespace, self._informers.pop(namespace)))
+        return expired
+
+    def __stop(self, evicted: List[Tuple[str, Tuple[ResourceInformer, float]]]):
+        for namespace, (informer, _) in evicted:
+            informer.stop()
+            with self._lock:
+                self._evicted += 1
+            if self._on_evict is not None:
+                try:
+                    self._on_evict(namespace, informer)
+                except Exception as e:
+                    print(f"WARNING[informer]: Eviction callback for '{namespace}' failed: {e}")
@@ -1,19 +1,63 @@
 from cluster_connector.ClusterConnectorInterface import ClusterConnectorInterface
-from typing import Dict, List, Any
+from cluster_connector.SimulationReadinessTracker import SimulationReadinessTracker
+from cluster_connector.SimulationDiff import SimulationDiff
+from cluster_connector.ResourceInformer import ResourceInformer
+from cluster_connector.JsonConfigMapStore import JsonConfigMapStore
+from cluster_connector.NamespaceInformers import DEFAULT_MAX_NAMESPACES, DEFAULT_IDLE_SECONDS
+from cluster_connector.SimulationStateCodec import SimulationStateCodec
+from cluster_connector.SimulationStateCache import SimulationStateCache, SIMULATION_SECRET
+from cluster_connector.AgentPodIndex import AgentPodIndex
+from typing import Callable, Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from kubernetes import config, client, watch       # type: ignore
 from kubernetes.client.rest import ApiException    # type: ignore
 from utils import JSONUtils
-from operations.operation_store import new_operation, utc_now_iso
+from operations.operation_store import new_operation, apply_operation_update
+from operations.configmap_operation_store import ConfigMapOperationStore, OPERATION_LABEL
 from operations.lease_lock import user_sync_lease, LeaseLockError
 import sys
 
 import os, time, json, http.client, socket, base64
 
+DEFAULT_SIMULATION_CREATE_CONCURRENCY = 8
+DEFAULT_SIMULATION_READY_TIMEOUT_SECONDS = 300
+# Connections kept on top of the create workers for request handlers and
+# other background tasks sharing the same API client.
+KUBERNETES_CONNECTION_POOL_HEADROOM = 8
+# "apply": server-side apply, "replace": legacy create and replace on conflict.
+DEFAULT_SIMULATION_APPLY_MODE = "apply"
+# 0 returns as soon as the deletions are accepted; otherwise delete_simulation
+# waits up to this many seconds for the agent pods to be gone.
+DEFAULT_SIMULATION_DELETE_WAIT_SECONDS = 0
+AGENT_LABEL_SELECTOR = "observability-demo-framework=agent"
+# Kubernetes rejects objects over 1 MiB; leave room for the base64 encoding
+# and the object metadata.
+MAX_SIMULATION_STATE_BYTES = 700 * 1024
+FIELD_MANAGER = "obs-main-api"
+APPLY_PATCH_CONTENT_TYPE = "application/apply-patch+yaml"
+
+ProgressCallback = Callable[[int, int, str], None]
+
+
+def _describe_api_error(e: Exception) -> str:
+    if isinstance(e, ApiException):
+        return f"{e.status} {e.reason}"
+    return str(e) or type(e).__name__
+
+
+class SimulationResourcesError(RuntimeError):
+    """Raised when some of the simulation resources could not be created or deleted."""
+
+    def __init__(self, errors: Dict[str, Exception], action: str = "create"):
+        self.errors = errors
+        details = "; ".join(f"{name}: {_describe_api_error(e)}" for name, e in errors.items())
+        super().__init__(f"Failed to {action} {len(errors)} simulation resource(s): {details}")
+
+
 class OpenShiftClusterConnector(ClusterConnectorInterface):
 
     ALERTS_CONFIGMAP = "obs-demo-fwk-alerts"
     USERS_CONFIGMAP = "obs-demo-fwk-users"
-    OPERATIONS_CONFIGMAP = "obs-demo-fwk-operations"
 
     def __init__(self):        
         # Load Kubernetes configuration depending on the environment        
@@ -25,12 +69,55 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
             # Fallback to local kubeconfig if running outside the cluster
             config.load_kube_config()
             print("... Running out-of-cluster. Local kubeconfig loaded.")
-        
+
+        self.__create_concurrency = int(os.getenv(
+            "SIMULATION_CREATE_CONCURRENCY", DEFAULT_SIMULATION_CREATE_CONCURRENCY))
+        # The client's urllib3 pool is sized from the CPU count (5 per core).
+        # With more create workers than pooled connections, the extra ones
+        # are opened and discarded on every call.
+        configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = max(
+            configuration.connection_pool_maxsize or 0,
+            self.__create_concurrency + KUBERNETES_CONNECTION_POOL_HEADROOM)
+        client.Configuration.set_default(configuration)
+
         self.__core_v1_api = client.CoreV1Api()
         self.__apps_v1_api = client.AppsV1Api()
         self.__custom_v1_api = client.CustomObjectsApi()
         self.__batch_v1_api = client.BatchV1Api()
         self.__coordination_v1_api = client.CoordinationV1Api()
+        self.__ready_timeout = int(os.getenv(
+            "SIMULATION_READY_TIMEOUT_SECONDS", DEFAULT_SIMULATION_READY_TIMEOUT_SECONDS))
+        self.__server_side_apply = os.getenv(
+            "SIMULATION_APPLY_MODE", DEFAULT_SIMULATION_APPLY_MODE) == "apply"
+        self.__delete_wait = int(os.getenv(
+            "SIMULATION_DELETE_WAIT_SECONDS", DEFAULT_SIMULATION_DELETE_WAIT_SECONDS))
+        # The namespace of the API cannot change during the process lifetime,
+        # so it is resolved once instead of on every request.
+        self.namespace = self.__get_current_namespace()
+        print(f"... API namespace: {self.namespace}")
+        # Operations are polled every second: serve them from a watched
+        # in-memory copy of the operation ConfigMaps.
+        self.__operations_informer = ResourceInformer(
+            self.__core_v1_api.list_namespaced_config_map,
+            self.namespace,
+            OPERATION_LABEL,
+            name="operations",
+        )
+        self.__operations_informer.start()
+        self.__operation_store = ConfigMapOperationStore(
+            self.__core_v1_api, self.namespace, informer=self.__operations_informer)
+        # Framework ConfigMaps (alert definitions, users) are read from watched
+        # in-memory copies and written with compare-and-swap.
+        max_namespaces = int(os.getenv("NAMESPACE_INFORMERS_MAX", DEFAULT_MAX_NAMESPACES))
+        idle_seconds = float(os.getenv("NAMESPACE_INFORMERS_IDLE_SECONDS", DEFAULT_IDLE_SECONDS))
+        self.__json_store = JsonConfigMapStore(
+            self.__core_v1_api, max_namespaces=max_namespaces, idle_seconds=idle_seconds)
+        self.__simulation_cache = SimulationStateCache(
+            self.__core_v1_api, max_namespaces=max_namespaces, idle_seconds=idle_seconds)
+        self.__agent_pods = AgentPodIndex(
+            self.__core_v1_api, max_namespaces=max_namespaces, idle_seconds=idle_seconds)
+        self.__simulation_sizes: Dict[str, Dict[str, Any]] = {}
     
     def __get_current_namespace(self, context: str = None) -> str | None:
         ns_path = "/var/run/secrets/kubernetes.io/serviceaccount/namespace"
@@ -46,6 +133,35 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
         except (KeyError, StopIteration):
             return "default"
         
+    def close(self):
+        self.__operations_informer.stop()
+        self.__json_store.close()
+        self.__simulation_cache.close()
+        self.__agent_pods.close()
+
+    def user_namespace(self, user: str) -> str:
+        """Returns the namespace of a user's simulation, f"{namespace}-{user}"."""
+        return f"{self.namespace}-{user}"
+
+    def __apply_options(self):
+        # Server-side apply: one request per object, a no-op when unchanged.
+        return {
+            "field_manager": FIELD_MANAGER,
+            "force": True,
+            "_content_type": APPLY_PATCH_CONTENT_TYPE,
+        }
+
+    def __apply_custom_object(self, group, version, namespace, plural, body):
+        return self.__custom_v1_api.patch_namespaced_custom_object(
+            group=group,
+            version=version,
+            namespace=namespace,
+            plural=plural,
+            name=body["metadata"]["name"],
+            body=body,
+            **self.__apply_options(),
+        )
+
     def __get_route_url_by_selector(self, namespace, selector):
 
         # Get the route using the OpenShift API group, version, and resource
@@ -118,13 +234,13 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
 
     def get_cluster_info(self, user) -> Dict[str, str]: 
         # Get namespace
-        api_namespace = self.__get_current_namespace()
+        api_namespace = self.namespace
         allUsers = self.__remove_password_in_place(self.get_users_json())
         if user=="admin":
             user_namespace = api_namespace
             users = allUsers
         else:
-            user_namespace = f"{api_namespace}-{user}"
+            user_namespace = self.user_namespace(user)
             users = [next(
                         (user_item for user_item in allUsers if user_item.get("username") == user),
                         None
@@ -240,6 +356,21 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
         }
 
         deployment_name = item["id"]
+        if self.__server_side_apply:
+            try:
+                self.__apps_v1_api.patch_namespaced_deployment(
+                    name=deployment_name,
+                    namespace=user_namespace,
+                    body=deployment_manifest,
+                    **self.__apply_options(),
+                )
+                print(f"Deployment {deployment_name} applied.")
+                return
+            except client.ApiException as e:
+                print(f"Error applying Deployment {deployment_name}. Exception: ")
+                print(e)
+                print("-------")
+                raise
         try:
             self.__apps_v1_api.create_namespaced_deployment(namespace=user_namespace, body=deployment_manifest)
             print(f"Deployment {deployment_name} successfully created.")
@@ -287,6 +418,21 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
             }
         }
         service_name = item["id"]
+        if self.__server_side_apply:
+            try:
+                self.__core_v1_api.patch_namespaced_service(
+                    name=service_name,
+                    namespace=namespace,
+                    body=service_manifest,
+                    **self.__apply_options(),
+                )
+                print(f"Service {service_name} applied.")
+                return
+            except client.ApiException as e:
+                print(f"Error applying Service {service_name}. Exception: ")
+                print(e)
+                print("-------")
+                raise
         try:
             self.__core_v1_api.create_namespaced_service(namespace=namespace, body=service_manifest)
             print(f"Service {service_name} created successfully.")
@@ -304,73 +450,6 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
                 print("-------")
                 raise
         
-    async def __get_agent_pods_dictionary(self, namespace):
-        try:        
-            pods = self.__core_v1_api.list_namespaced_pod(
-                namespace, 
-                label_selector = 'observability-demo-framework=agent')
-        except Exception as e: 
-            print(f"Exception when retrieving pods: {e}")
-            raise
-        
-        pods_dict = {}
-        for item in pods.items:
-            name_parts = item.metadata.name.split("-")
-            deployment_name = "-".join(name_parts[:-2])
-            pods_dict[deployment_name]=item.metadata.name
-        return pods_dict
-
-    def __wait_for_service_ready_and_get_ip(self, namespace, service_name, timeout=300):
-        w = watch.Watch()
-        start_time = time.time()
-
-        try:
-            for event in w.stream(
-                    self.__core_v1_api.list_namespaced_service, 
-                    namespace=namespace, 
-                    timeout_seconds=timeout):
-                service = event['object']
-                if service.metadata.name == service_name:
-                    print(f"Service {service_name} status: Available")
-                    service_ip = service.spec.cluster_ip
-                    if service_ip:
-                        print(f"Service {service_name} IP: {service_ip}")
-                        w.stop()
-                        return service_ip
-
-                if time.time() - start_time > timeout:
-                    print(f"Timeout waiting for Service {service_name} to be ready.")
-                    w.stop()
-
-        except ApiException as e:
-            print(f"Exception when waiting for Service: {e}")
-            raise
-
-        return None
-        
-    def __wait_for_deployment_ready(self, deployment_name, namespace, timeout=300, interval=5):
-        start_time = time.time()
-
-        while (time.time() - start_time) < timeout:
-            # Get the deployment status
-            deployment = self.__apps_v1_api.read_namespaced_deployment(
-                name=deployment_name, 
-                namespace=namespace)            
-            
-            # Check if the number of ready replicas matches the desired replicas
-            if deployment.status.ready_replicas == deployment.spec.replicas:
-                print(f"All pods for deployment '{deployment_name}' are ready.")
-                return True
-            else:
-                print(f"Waiting for pods of deployment {deployment_name} to become ready. Ready pods: {deployment.status.ready_replicas}/{deployment.spec.replicas}")
-            
-            # Sleep for the defined interval before checking again
-            time.sleep(interval)
-
-        # If we exceed the timeout and not all pods are ready
-        print(f"Timeout: Not all pods for deployment '{deployment_name}' are ready after {timeout} seconds.")
-        return False
-    
     def __create_openshift_route(self, namespace, route_body):
        
         # OpenShift Route API details
@@ -434,13 +513,16 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
         monitoring_stack_name = "."
         try:
             monitoring_stack_name = f"monitoring-stack-{user}"
-            self.__custom_v1_api.create_namespaced_custom_object(
-                group="monitoring.rhobs",
-                version="v1alpha1",
-                namespace=namespace,
-                plural="monitoringstacks",
-                body=monitoring_stack_body
-            )
+            if self.__server_side_apply:
+                self.__apply_custom_object("monitoring.rhobs", "v1alpha1", namespace, "monitoringstacks", monitoring_stack_body)
+            else:
+                self.__custom_v1_api.create_namespaced_custom_object(
+                    group="monitoring.rhobs",
+                    version="v1alpha1",
+                    namespace=namespace,
+                    plural="monitoringstacks",
+                    body=monitoring_stack_body
+                )
             print(f"MonitoringStack {monitoring_stack_name} created successfully.")
         except client.exceptions.ApiException as e:
             print(f"Exception when creating MonitoringStack {monitoring_stack_name}")
@@ -449,7 +531,7 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
             raise
 
         # Define Grafana Datasource
-        main_namespace = self.__get_current_namespace()
+        main_namespace = self.namespace
         grafana_user_datasource = f"ds-grafana-coo-prometheus-{user}"
         grafana_datasource_body = {
             "apiVersion": "grafana.integreatly.org/v1beta1",
@@ -477,13 +559,16 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
             }
         }
         try:            
-            self.__custom_v1_api.create_namespaced_custom_object(
-                group="grafana.integreatly.org",
-                version="v1beta1",
-                namespace=main_namespace,
-                plural="grafanadatasources",
-                body=grafana_datasource_body
-            )
+            if self.__server_side_apply:
+                self.__apply_custom_object("grafana.integreatly.org", "v1beta1", main_namespace, "grafanadatasources", grafana_datasource_body)
+            else:
+                self.__custom_v1_api.create_namespaced_custom_object(
+                    group="grafana.integreatly.org",
+                    version="v1beta1",
+                    namespace=main_namespace,
+                    plural="grafanadatasources",
+                    body=grafana_datasource_body
+                )
             print(f"Grafana Datasource {grafana_user_datasource} created successfully.")
         except client.exceptions.ApiException as e:
             print(f"Exception when creating Grafana Datasource {grafana_user_datasource}")
@@ -564,13 +649,16 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
         service_monitor_name = "."
         try:
             service_monitor_name = item["id"]
-            self.__custom_v1_api.create_namespaced_custom_object(
-                group="monitoring.rhobs",
-                version="v1",
-                namespace=namespace,
-                plural="servicemonitors",
-                body=service_monitor_body
-            )
+            if self.__server_side_apply:
+                self.__apply_custom_object("monitoring.rhobs", "v1", namespace, "servicemonitors", service_monitor_body)
+            else:
+                self.__custom_v1_api.create_namespaced_custom_object(
+                    group="monitoring.rhobs",
+                    version="v1",
+                    namespace=namespace,
+                    plural="servicemonitors",
+                    body=service_monitor_body
+                )
             print(f"ServiceMonitor {service_monitor_name}[COO] created successfully.")
         except client.exceptions.ApiException as e:
             print(f"Exception when creating ServiceMonitor {service_monitor_name}[COO]")
@@ -608,13 +696,16 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
         service_monitor_name = "."
         try:
             service_monitor_name = item["id"]
-            self.__custom_v1_api.create_namespaced_custom_object(
-                group="monitoring.coreos.com",
-                version="v1",
-                namespace=namespace,
-                plural="servicemonitors",
-                body=service_monitor_body
-            )
+            if self.__server_side_apply:
+                self.__apply_custom_object("monitoring.coreos.com", "v1", namespace, "servicemonitors", service_monitor_body)
+            else:
+                self.__custom_v1_api.create_namespaced_custom_object(
+                    group="monitoring.coreos.com",
+                    version="v1",
+                    namespace=namespace,
+                    plural="servicemonitors",
+                    body=service_monitor_body
+                )
             print(f"ServiceMonitor {service_monitor_name} created successfully.")
         except client.exceptions.ApiException as e:
             print(f"Exception when creating ServiceMonitor {service_monitor_name}")
@@ -623,59 +714,152 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
             raise
        
     def save_simulation(self, user, json_data):
-        namespace=f"{self.__get_current_namespace()}-{user}"
-        encoded_data = base64.b64encode(json.dumps(json_data).encode('utf-8')).decode('utf-8')
+        namespace=self.user_namespace(user)
+        state = SimulationStateCodec.encode(json_data)
+        if len(state) > MAX_SIMULATION_STATE_BYTES:
+            raise RuntimeError(
+                f"Simulation of {user} is too large to store ({len(state)} bytes compressed, "
+                f"limit {MAX_SIMULATION_STATE_BYTES})")
+        encoded_data = base64.b64encode(state).decode('utf-8')
 
         secret = client.V1Secret(
-            metadata=client.V1ObjectMeta(name="obs-demo-fw-state", labels={"observability-demo-framework": "storage"}),
+            metadata=client.V1ObjectMeta(name=SIMULATION_SECRET, labels={"observability-demo-framework": "storage"}),
             data={"simulation": encoded_data},
         )
-        secret_name = "obs-demo-fw-state"
+        secret_name = SIMULATION_SECRET
         try:
-            self.__core_v1_api.create_namespaced_secret(namespace, secret)
-            print(f"Simulation saved successfully in the cluster as secret {secret_name}.")
+            saved = self.__core_v1_api.create_namespaced_secret(namespace, secret)
+            print(f"Simulation saved successfully in the cluster as secret {secret_name} ({len(state)} bytes).")
         except client.ApiException as e:
             if e.status == 409:
-                self.__core_v1_api.replace_namespaced_secret(secret_name, namespace, secret)
-                print(f"Simulation secret {secret_name} updated successfully.")
+                saved = self.__core_v1_api.replace_namespaced_secret(secret_name, namespace, secret)
+                print(f"Simulation secret {secret_name} updated successfully ({len(state)} bytes).")
             else:
                 print(f"Exception when saving simulation as a secret[{secret_name}]: {e}")
                 raise
+        self.__simulation_cache.put(namespace, saved)
+        self.__record_simulation_size(user, state)
+
+    def __record_simulation_size(self, user, state: bytes):
+        self.__simulation_sizes[user] = {
+            "storedBytes": len(state),
+            "format": "legacy" if SimulationStateCodec.is_legacy(state) else "compressed",
+        }
+
+    def get_simulation_storage_stats(self) -> Dict[str, Any]:
+        sizes = dict(self.__simulation_sizes)
+        return {
+            "users": sizes,
+            "totalStoredBytes": sum(size["storedBytes"] for size in sizes.values()),
+            "cache": self.__simulation_cache.stats(),
+        }
     
-    def create_simulation_resources(self, user, agents: List[Dict[str, Any]], stack):
+    def __run_concurrently(self, tasks, progress_callback: ProgressCallback | None, message: str) -> Dict[str, Exception]:
+        """
+        Runs (name, function, args) tasks on a bounded thread pool. Every task
+        is attempted; failures are collected by name instead of aborting the
+        remaining ones. progress_callback(completed, total, message) is invoked
+        after each task.
+        """
+        errors: Dict[str, Exception] = {}
+        total = len(tasks)
+        if total == 0:
+            return errors
+        with ThreadPoolExecutor(max_workers=max(1, self.__create_concurrency)) as executor:
+            futures = {executor.submit(function, *args): name for name, function, args in tasks}
+            for completed, future in enumerate(as_completed(futures), start=1):
+                name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Error on {name}: {_describe_api_error(e)}")
+                    errors[name] = e
+                if progress_callback is not None:
+                    progress_callback(completed, total, message)
+        return errors
+
+    def create_simulation_resources(
+        self,
+        user,
+        agents: List[Dict[str, Any]],
+        stack,
+        progress_callback: ProgressCallback | None = None,
+    ):
         
-        image_namespace=self.__get_current_namespace()
-        namespace = f"{image_namespace}-{user}"
+        image_namespace=self.namespace
+        namespace = self.user_namespace(user)
 
-        if stack == "coo":
-            self.__create_monitoring_stack_coo(namespace, user)
-        # Create all deployment and services. 
-        for item in agents:
-            
+        # The stored secret is only a record of what was submitted; the agent
+        # Deployments actually running in the namespace are listed too, so
+        # resources left behind by a failed or interrupted run are not missed.
+        stored = self.__read_simulation_secret(namespace, user)
+        live_ids = self.__list_agent_deployment_ids(namespace)
+        new_ids = {item["id"] for item in agents}
+        previous_stack = stored.get("user", {}).get("monitoringType") if stored else None
+        stale_monitors = []
+        if stored and previous_stack == stack:
+            # Same monitoring stack: only the agents that changed are touched.
+            diff = SimulationDiff(stored.get("agents", []), agents)
+            print(f"Reconciling simulation for {user}: {diff}")
+            missing = [item for item in diff.unchanged if item["id"] not in live_ids]
+            created, updated = diff.created + missing, diff.updated
+            orphan_ids = live_ids - new_ids - {item["id"] for item in diff.deleted}
+            deleted = diff.deleted + [{"id": agent_id} for agent_id in sorted(orphan_ids)]
+        else:
+            # No stored state, or a new monitoring stack: everything is
+            # (re)created, and whatever the new payload drops is removed.
+            if stack == "coo":
+                self.__create_monitoring_stack_coo(namespace, user)
+            stored_ids = {item["id"] for item in stored.get("agents", [])} if stored else set()
+            created, updated = agents, []
+            deleted = [{"id": agent_id} for agent_id in sorted((stored_ids | live_ids) - new_ids)]
+            if previous_stack is not None and previous_stack != stack:
+                # The kept agents get a ServiceMonitor of the new stack; the
+                # one of the old stack would keep scraping them.
+                stale_monitors = [{"id": agent_id} for agent_id in sorted(stored_ids & new_ids)]
+        deleted_stack = previous_stack or stack
+
+        tasks = []
+        for item in created:
             print(f'Agent: {item["id"]}')
-                
-            # Create Deployment
-            self.__create_deployment(namespace, image_namespace, item)
-            print(f"Deployment for {item['id']} created.")
-            
-            # Create Service
-            self.__create_service(namespace, item)
-            print(f"Service for {item['id']} created.")
-            
-            # Create service monitor
+            tasks.append((f"Deployment/{item['id']}", self.__create_deployment, (namespace, image_namespace, item)))
+            tasks.append((f"Service/{item['id']}", self.__create_service, (namespace, item)))
             if stack == "user-workload":
-                self.__create_service_monitor(namespace, item)            
-                print(f"ServiceMonitor[UW] for {item['id']} created.")
+                tasks.append((f"ServiceMonitor[UW]/{item['id']}", self.__create_service_monitor, (namespace, item)))
             else:
-                self.__create_service_monitor_coo(namespace, item, user)
-                print(f"ServiceMonitor[COO] for {item['id']} created.")
-            
+                tasks.append((f"ServiceMonitor[COO]/{item['id']}", self.__create_service_monitor_coo, (namespace, item, user)))
+        # Type and next hops only live in the Deployment.
+        for item in updated:
+            print(f'Agent (updated): {item["id"]}')
+            tasks.append((f"Deployment/{item['id']}", self.__create_deployment, (namespace, image_namespace, item)))
+        for item in deleted:
+            print(f'Agent (deleted): {item["id"]}')
+            tasks.append((f"Deployment/{item['id']}", self.__delete_agent_deployment, (namespace, item)))
+            tasks.append((f"Service/{item['id']}", self.__delete_agent_service, (namespace, item)))
+            tasks.append((f"ServiceMonitor/{item['id']}", self.__delete_agent_service_monitor, (namespace, item, deleted_stack)))
+        for item in stale_monitors:
+            print(f'Agent (monitoring stack changed): {item["id"]}')
+            tasks.append((f"ServiceMonitor[{previous_stack}]/{item['id']}", self.__delete_agent_service_monitor, (namespace, item, previous_stack)))
+        errors = self.__run_concurrently(tasks, progress_callback, "Reconciling agent resources")
+        if errors:
+            raise SimulationResourcesError(errors)
+        print(f"{len(tasks)} resources reconciled for {len(agents)} agents.")
 
-        # Make sure that all pods have started before adding associations
-        # Wait for the Service to be ready and get its IP
-        podNames = self.__get_agent_pods_dictionary(namespace)
-        for item in agents:            
-            service_ip = self.__wait_for_service_ready_and_get_ip(namespace, item["id"])
+        # Make sure that all pods have started before adding associations.
+        # One watch per kind tracks every changed agent's Service IP and rollout.
+        if progress_callback is not None:
+            progress_callback(len(tasks), len(tasks), "Waiting for agents to become ready")
+        changed_ids = {item["id"] for item in created} | {item["id"] for item in updated}
+        tracker = SimulationReadinessTracker(
+            self.__apps_v1_api, self.__core_v1_api, namespace, sorted(changed_ids))
+        if changed_ids:
+            tracker.wait(timeout=self.__ready_timeout)
+        for item in agents:
+            if item["id"] not in changed_ids:
+                item["dns"] = f"{item['id']}.{namespace}.svc"
+                item["port"] = 8080
+                continue
+            service_ip = tracker.service_ips.get(item["id"])
             if service_ip:
                 print(f"The Service IP address of {item['id']} is: {service_ip}")                
                 item["dns"] = f"{item['id']}.{namespace}.svc"
@@ -683,116 +867,99 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
             else:
                 print(f"Failed to retrieve the Service IP address for {item['id']}.")
                 continue
-            
-            self.__wait_for_deployment_ready(item['id'], namespace)
+            if item["id"] not in tracker.ready_deployments:
+                print(f"Timeout: Not all pods for deployment '{item['id']}' are ready after {self.__ready_timeout} seconds.")
         
         # Show result
         print(agents)
         return agents
     
-    def __get_agent_pods_dictionary(self, namespace):
+    def __list_agent_deployment_ids(self, namespace) -> set:
         try:
-            pods = self.__core_v1_api.list_namespaced_pod(
-                namespace, 
-                label_selector='observability-demo-framework=agent')
-            pods_dict = {}
-        except Exception as e:             
-            print(f"Error retrieving pods: {e}")
+            deployments = self.__apps_v1_api.list_namespaced_deployment(
+                namespace=namespace, label_selector="observability-demo-framework=agent")
+        except client.ApiException as e:
+            if e.status == 404:
+                return set()
             raise
+        return {deployment.metadata.name for deployment in deployments.items}
 
-        for item in pods.items:
-            name_parts = item.metadata.name.split("-")
-            deployment_name = "-".join(name_parts[:-2])
-            pods_dict[deployment_name]=item.metadata.name
-        return pods_dict
-
-    def retrieve_simulation(self, user):
-        # Get the secret
-        secret_name="obs-demo-fw-state"
-        user_namespace=f"{self.__get_current_namespace()}-{user}"
-        simulation = []
+    def __delete_agent_deployment(self, namespace, item):
         try:
-            secret = self.__core_v1_api.read_namespaced_secret(secret_name, user_namespace)
-            if 'simulation' in secret.data:
-                encoded_json_data = secret.data['simulation']
-                decoded_json_data = base64.b64decode(encoded_json_data).decode('utf-8')
-                print(decoded_json_data)
-                
-                # Convert the decoded string back into a JSON object
-                simulation = json.loads(decoded_json_data)
-            else:
-                message = f"Secret '{secret_name}' does not contain 'json-file' key."
-                print(message)
-                raise RuntimeError(message)
-                
-        except client.exceptions.ApiException as e:
-            if e.status == 404:
-                print(f"Secret '{secret_name}' not found in namespace '{self.__get_current_namespace()}'.")
-            else:
-                message = f"Failed to read Secret '{secret_name}': {e}"
-                print(message)
-                raise RuntimeError(message)
-            return {}
-        # Update agent pod name
-        pods = self.__get_agent_pods_dictionary(user_namespace)
-        for agent in simulation["agents"]:
-            agent["pod"] = pods[agent["id"]]
+            self.__apps_v1_api.delete_namespaced_deployment(
+                name=item["id"], namespace=namespace, propagation_policy="Background")
+            print(f"Deployment {item['id']} deleted.")
+        except client.ApiException as e:
+            if e.status != 404:
+                raise
 
-        return simulation
+    def __delete_agent_service(self, namespace, item):
+        try:
+            self.__core_v1_api.delete_namespaced_service(name=item["id"], namespace=namespace)
+            print(f"Service {item['id']} deleted.")
+        except client.ApiException as e:
+            if e.status != 404:
+                raise
 
-    def __load_json_from_configmap(self, configmap_name, key, namespace):
+    def __delete_agent_service_monitor(self, namespace, item, stack):
+        group = "monitoring.coreos.com" if stack == "user-workload" else "monitoring.rhobs"
         try:
-            # Get the ConfigMap
-            configmap = self.__core_v1_api.read_namespaced_config_map(configmap_name, namespace)
-            # Extract the JSON string
-            json_str = configmap.data.get(key, "{}")  # Default to an empty JSON object if the key is missing
-            # Parse and return the JSON data
-            return json.loads(json_str)
-        except client.exceptions.ApiException as e:
-            if e.status == 404:
-                print(f"ConfigMap '{configmap_name}' not found in namespace '{namespace}'.")
-                return []
-            else:
+            self.__custom_v1_api.delete_namespaced_custom_object(
+                group=group,
+                version="v1",
+                namespace=namespace,
+                plural="servicemonitors",
+                name=item["id"],
+            )
+            print(f"ServiceMonitor {item['id']} deleted.")
+        except client.ApiException as e:
+            if e.status != 404:
                 raise
- 
-    def __save_json_to_configmap(self, json_data, configmap_name, key, namespace):
-        print(f"CONFIG MAP: '{configmap_name}'. NAMESPACE: '{namespace}'")
-        json_str = json.dumps(json_data)
-        configmap_data = {
-            "metadata": {
-                "name": configmap_name,
-                "namespace": namespace,
-                "labels": {
-                    "observability-demo-framework": "storage"
-                }
-            },
-            "data": {
-                key: json_str,
-            },
-        }
+
+    def __read_simulation_secret(self, user_namespace, user=None):
+        """
+        Returns a copy of the stored simulation of a user namespace, or None
+        if there is none. Served from the watched, parsed cache. Both the
+        compressed and the original JSON format are read; the next save
+        rewrites a legacy secret in the compressed format.
+        """
         try:
-        # Check if the ConfigMap exists
-            self.__core_v1_api.read_namespaced_config_map(configmap_name, namespace)
-            # If it exists, update it
-            self.__core_v1_api.patch_namespaced_config_map(configmap_name, namespace, configmap_data)
-            print(f"Updated ConfigMap '{configmap_name}' in namespace '{namespace}'.")
+            simulation, state = self.__simulation_cache.read(user_namespace)
         except client.exceptions.ApiException as e:
-            if e.status == 404:
-                # If it doesn't exist, create it
-                self.__core_v1_api.create_namespaced_config_map(namespace, configmap_data)
-                print(f"Created ConfigMap '{configmap_name}' in namespace '{namespace}'.")
-            else:
-                raise
+            message = f"Failed to read Secret '{SIMULATION_SECRET}': {e}"
+            print(message)
+            raise RuntimeError(message)
+        if simulation is None:
+            print(f"Secret '{SIMULATION_SECRET}' not found in namespace '{user_namespace}'.")
+            return None
+        if user is not None:
+            self.__record_simulation_size(user, state)
+        return simulation
+
+    def retrieve_simulation(self, user):
+        user_namespace=self.user_namespace(user)
+        simulation = self.__read_simulation_secret(user_namespace, user)
+        if simulation is None:
+            return {}
+        # Update agent pod name and phase from the watched pod index
+        pods = self.__agent_pods.pods(user_namespace)
+        for agent in simulation["agents"]:
+            pod = pods.get(agent["id"])
+            agent["pod"] = pod.name if pod else None
+            agent["podPhase"] = pod.phase if pod else None
+
+        return simulation
 
     def save_alert_definition(self, user, alert):
-        namespace = f"{self.__get_current_namespace()}-{user}"
-        alerts_definition=self.__load_json_from_configmap(self.ALERTS_CONFIGMAP, "alerts", namespace)
-        alerts_definition.append(alert)
-        self.__save_json_to_configmap(alerts_definition, self.ALERTS_CONFIGMAP, "alerts", namespace)
+        namespace = self.user_namespace(user)
+        self.__json_store.update(
+            self.ALERTS_CONFIGMAP, "alerts", namespace,
+            lambda alerts_definition: alerts_definition + [alert],
+            default=[])
 
     def create_alert_resource(self, user, stack, id, name, severity, group, expression, summary):
         # Define the PrometheusRule resource
-        namespace = f"{self.__get_current_namespace()}-{user}"
+        namespace = self.user_namespace(user)
         if stack == "coo":
             api_group = "monitoring.rhobs"
         else:
@@ -836,13 +1003,16 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
             prometheus_rule_body["metadata"]["labels"]["monitoring-stack"] = user
         
         try:
-            response = self.__custom_v1_api.create_namespaced_custom_object(
-                group=api_group,
-                version="v1",
-                namespace=namespace,
-                plural="prometheusrules",
-                body=prometheus_rule_body,
-            )
+            if self.__server_side_apply:
+                self.__apply_custom_object(api_group, "v1", namespace, "prometheusrules", prometheus_rule_body)
+            else:
+                self.__custom_v1_api.create_namespaced_custom_object(
+                    group=api_group,
+                    version="v1",
+                    namespace=namespace,
+                    plural="prometheusrules",
+                    body=prometheus_rule_body,
+                )
             print(f"PrometheusRule '{id}' created successfully.")
             return {"success": True}
         except client.exceptions.ApiException as e:
@@ -910,21 +1080,96 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
         except Exception as e:
             print(f"❌ An unexpected error occurred for Route '{route_name}': {e}", file=sys.stderr)
     
-    def delete_simulation(self, user):        
-        label_selector = "observability-demo-framework=agent"
-
-        namespace = f"{self.__get_current_namespace()}-{user}"
-        # Delete Deployments matching the selector
-        deployments = self.__apps_v1_api.list_namespaced_deployment(namespace=namespace, label_selector=label_selector)
-        for deployment in deployments.items:
-            print(f"Deleting Deployment: {deployment.metadata.name}")
-            self.__apps_v1_api.delete_namespaced_deployment(name=deployment.metadata.name, namespace=deployment.metadata.namespace)
-
-        # Delete Services matching the selector
-        services = self.__core_v1_api.list_namespaced_service(namespace=namespace, label_selector=label_selector)
-        for service in services.items:
-            print(f"Deleting Service: {service.metadata.name}")
-            self.__core_v1_api.delete_namespaced_service(name=service.metadata.name, namespace=service.metadata.namespace)
+    def __ignore_not_found(self, function, *args, **kwargs):
+        try:
+            function(*args, **kwargs)
+        except client.exceptions.ApiException as e:
+            if e.status != 404:
+                raise
+
+    def __delete_collection(self, delete_collection_function, namespace):
+        self.__ignore_not_found(
+            delete_collection_function,
+            namespace,
+            label_selector=AGENT_LABEL_SELECTOR,
+            propagation_policy="Background",
+        )
+        print(f"Deleted {delete_collection_function.__name__} matching {AGENT_LABEL_SELECTOR}")
+
+    def __delete_custom_object_collection(self, group, version, namespace, plural):
+        self.__ignore_not_found(
+            self.__custom_v1_api.delete_collection_namespaced_custom_object,
+            group=group,
+            version=version,
+            namespace=namespace,
+            plural=plural,
+            label_selector=AGENT_LABEL_SELECTOR,
+            propagation_policy="Background",
+        )
+        print(f"Deleted {plural}.{group} matching {AGENT_LABEL_SELECTOR}")
+
+    def __delete_custom_object(self, group, version, namespace, plural, name):
+        self.__ignore_not_found(
+            self.__custom_v1_api.delete_namespaced_custom_object,
+            group=group,
+            version=version,
+            namespace=namespace,
+            plural=plural,
+            name=name,
+            propagation_policy="Background",
+        )
+        print(f"Deleted {plural}.{group} {name}")
+
+    def __wait_for_agent_pods_gone(self, namespace, timeout):
+        """
+        Waits until no agent pod is left in the namespace. A single pod watch,
+        resumed from the list's resourceVersion, observes the deletions.
+        """
+        deadline = time.monotonic() + timeout
+        pods = self.__core_v1_api.list_namespaced_pod(namespace, label_selector=AGENT_LABEL_SELECTOR)
+        remaining = {pod.metadata.name for pod in pods.items}
+        resource_version = pods.metadata.resource_version
+        while remaining:
+            seconds_left = deadline - time.monotonic()
+            if seconds_left <= 0:
+                print(f"Timeout: {len(remaining)} agent pods still present in {namespace} after {timeout} seconds.")
+                return False
+            w = watch.Watch()
+            try:
+                for event in w.stream(
+                        self.__core_v1_api.list_namespaced_pod,
+                        namespace=namespace,
+                        label_selector=AGENT_LABEL_SELECTOR,
+                        resource_version=resource_version,
+                        timeout_seconds=max(1, int(seconds_left))):
+                    pod = event["object"]
+                    resource_version = pod.metadata.resource_version
+                    if event["type"] == "DELETED":
+                        remaining.discard(pod.metadata.name)
+                    elif event["type"] == "ADDED":
+                        remaining.add(pod.metadata.name)
+                    if not remaining:
+                        w.stop()
+            except client.exceptions.ApiException as e:
+                if e.status != 410:
+                    raise
+                # The resourceVersion expired; relist and resume from there.
+                pods = self.__core_v1_api.list_namespaced_pod(namespace, label_selector=AGENT_LABEL_SELECTOR)
+                remaining = {pod.metadata.name for pod in pods.items}
+                resource_version = pods.metadata.resource_version
+        print(f"All agent pods deleted from {namespace}.")
+        return True
+
+    def delete_simulation(self, user):
+        namespace = self.user_namespace(user)
+        # The kinds are independent, so every deletion runs concurrently. Agent
+        # resources go away with one deletecollection call per kind.
+        tasks = [
+            ("Deployments", self.__delete_collection, (
+                self.__apps_v1_api.delete_collection_namespaced_deployment, namespace)),
+            ("Services", self.__delete_collection, (
+                self.__core_v1_api.delete_collection_namespaced_service, namespace)),
+        ]
 
         # User Workload monitoring
         observability_stack = self.__get_namespace_label_value(namespace, "observability-stack")
@@ -933,95 +1178,42 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
         match observability_stack:                
             case "coo":
                 api_group_name = "monitoring.rhobs"
-                # Delete MonitoringStack
-                monitoring_stack_name = f"monitoring-stack-{user}"
-                print (f"Deleting MonitoringStack {monitoring_stack_name}")
-                self.__custom_v1_api.delete_namespaced_custom_object(
-                    group=api_group_name,
-                    version="v1alpha1",
-                    namespace=namespace,
-                    plural="monitoringstacks",
-                    name=monitoring_stack_name)                
-                # Delete Grafana Datasource from current namespace
-                grafana_datasource_name = f"ds-grafana-coo-prometheus-{user}"
-                print (f"Deleting Grafana Datasource {grafana_datasource_name}")
-                self.__custom_v1_api.delete_namespaced_custom_object(
-                    group="grafana.integreatly.org",
-                    version="v1beta1",
-                    namespace=self.__get_current_namespace(),
-                    plural="grafanadatasources",
-                    name=grafana_datasource_name)
-                print ("Deleting routes")
-                self.__delete_openshift_route(namespace, f"prometheus-{user}")
-                self.__delete_openshift_route(namespace, f"alertmanager-{user}")
+                tasks.append(("MonitoringStack", self.__delete_custom_object, (
+                    api_group_name, "v1alpha1", namespace, "monitoringstacks", f"monitoring-stack-{user}")))
+                # Grafana Datasource lives in the current namespace
+                tasks.append(("GrafanaDatasource", self.__delete_custom_object, (
+                    "grafana.integreatly.org", "v1beta1", self.namespace,
+                    "grafanadatasources", f"ds-grafana-coo-prometheus-{user}")))
+                tasks.append(("Route/prometheus", self.__delete_openshift_route, (namespace, f"prometheus-{user}")))
+                tasks.append(("Route/alertmanager", self.__delete_openshift_route, (namespace, f"alertmanager-{user}")))
             case "mesh":
                 #TODO
                 print("Service Mesh handling not implemented.")
-            
-        # Delete ServiceMonitors matching the selector
-        # Assuming ServiceMonitors are custom resources from the Prometheus operator
-        service_monitors = self.__custom_v1_api.list_namespaced_custom_object(
-            group=api_group_name,
-            version="v1",
-            namespace=namespace,
-            plural="servicemonitors",
-            label_selector=label_selector
-        )
-        for sm in service_monitors.get("items", []):
-            print(f"Deleting ServiceMonitor: {sm['metadata']['name']}")
-            self.__custom_v1_api.delete_namespaced_custom_object(
-                group=api_group_name,
-                version="v1",
-                namespace=namespace,
-                plural="servicemonitors",
-                name=sm['metadata']['name']
-            )
-        # Delete prometheus rules. 
-        prometheus_rules = self.__custom_v1_api.list_namespaced_custom_object(
-            group=api_group_name,
-            version="v1", 
-            namespace=namespace, 
-            plural="prometheusrules", 
-            label_selector=label_selector
-        )
-        for pm in prometheus_rules.get("items", []):
-            print(f"Deleting PrometheusRule: {pm['metadata']['name']}")
-            self.__custom_v1_api.delete_namespaced_custom_object(
-                group=api_group_name,
-                version="v1",
-                namespace=namespace,
-                plural="prometheusrules",
-                name=pm['metadata']['name']
-            )
-                
-        # Delete secret 
-        secret_name="obs-demo-fw-state"
-        try:
-            self.__core_v1_api.delete_namespaced_secret(secret_name, namespace)
-            print(f"Secret '{secret_name}' deleted successfully.")
-        except client.exceptions.ApiException as e:
-            if e.status == 404:
-                print(f"Secret '{secret_name}' not found in namespace '{namespace}'. Skipping.")
-            else:
-                print(f"Failed to delete Secret '{secret_name}': {e}")
-                raise
-        
-        # Delete config map
-        config_map = self.ALERTS_CONFIGMAP
-        try:
-            self.__core_v1_api.delete_namespaced_config_map(config_map, namespace)
-            print(f"ConfigMap '{config_map}' deleted successfully.")
-        except client.exceptions.ApiException as e:
-            if e.status == 404:
-                print(f"ConfigMap '{config_map}' not found in namespace '{namespace}'. Skipping.")
-            else:
-                print(f"Failed to delete ConfigMap '{config_map}': {e}")
-                raise
 
+        tasks.append(("ServiceMonitors", self.__delete_custom_object_collection, (
+            api_group_name, "v1", namespace, "servicemonitors")))
+        tasks.append(("PrometheusRules", self.__delete_custom_object_collection, (
+            api_group_name, "v1", namespace, "prometheusrules")))
+        tasks.append((f"Secret/{SIMULATION_SECRET}", self.__ignore_not_found, (
+            self.__core_v1_api.delete_namespaced_secret, SIMULATION_SECRET, namespace)))
+        tasks.append((f"ConfigMap/{self.ALERTS_CONFIGMAP}", self.__ignore_not_found, (
+            self.__core_v1_api.delete_namespaced_config_map, self.ALERTS_CONFIGMAP, namespace)))
+
+        errors = self.__run_concurrently(tasks, None, "Deleting simulation resources")
+        if errors:
+            raise SimulationResourcesError(errors, action="delete")
+
+        if self.__delete_wait > 0:
+            self.__wait_for_agent_pods_gone(namespace, self.__delete_wait)
+        self.__simulation_sizes.pop(user, None)
+        # Stop watching the namespace until the user reads it again.
+        self.__simulation_cache.evict(namespace)
+        self.__json_store.evict(namespace)
+        self.__agent_pods.evict(namespace)
         print("All matching resources deleted successfully.")
 
     def delete_alert(self, user, alert_name):
-        namespace = f"{self.__get_current_namespace()}-{user}"
+        namespace = self.user_namespace(user)
         try:
             self.__custom_v1_api.delete_namespaced_custom_object(
                 group="monitoring.coreos.com",
@@ -1032,60 +1224,58 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
             return {"success": True}
         except client.exceptions.ApiException as e:
             if e.status == 404:
-                print(f"PrometheusRule '{alert_name}' not found in namespace '{self.__get_current_namespace()}'.")                
+                print(f"PrometheusRule '{alert_name}' not found in namespace '{self.namespace}'.")                
             else:
                 print(f"Failed to delete PrometheusRule '{alert_name}': {e}")
             return {"success": False, "error": e}            
 
     def delete_alert_definition(self, user, alert_id):
-        namespace = f"{self.__get_current_namespace()}-{user}"
+        namespace = self.user_namespace(user)
         try:            
-            alerts = self.__load_json_from_configmap(self.ALERTS_CONFIGMAP, "alerts", namespace)            
-            cleaned_alerts = [item for item in alerts if item.get("id") != alert_id]
-            self.__save_json_to_configmap(cleaned_alerts, self.ALERTS_CONFIGMAP, "alerts", namespace)
+            self.__json_store.update(
+                self.ALERTS_CONFIGMAP, "alerts", namespace,
+                lambda alerts: [item for item in alerts if item.get("id") != alert_id],
+                default=[])
             return {"success": True}
-        except client.exception.ApiException as e: 
+        except client.exceptions.ApiException as e: 
             return {"success": False, "error": e}
 
     def get_alert_definitions(self, user):
-        namespace = f"{self.__get_current_namespace()}-{user}"
-        alerts = self.__load_json_from_configmap(self.ALERTS_CONFIGMAP, "alerts", namespace)
+        namespace = self.user_namespace(user)
+        alerts = self.__json_store.read(self.ALERTS_CONFIGMAP, "alerts", namespace, default=[])
         return alerts
     
     def retrieve_hostname_from_service_id(self, user, id):
-        namespace = f"{self.__get_current_namespace()}-{user}"
+        namespace = self.user_namespace(user)
         return f"{id}.{namespace}.svc"
 
     def get_users_json(self):
-        namespace = self.__get_current_namespace()
-        users = self.__load_json_from_configmap(self.USERS_CONFIGMAP, "users", namespace)
+        namespace = self.namespace
+        users = self.__json_store.read(self.USERS_CONFIGMAP, "users", namespace, default=[])
         return users
     
     def update_users_json(self, users):
-        namespace = self.__get_current_namespace()
-        print(users)
-        self.__save_json_to_configmap(users, self.USERS_CONFIGMAP, "users", namespace)
+        self.update_users(lambda _: users)
 
-    def __load_operations(self) -> Dict[str, Any]:
-        namespace = self.__get_current_namespace()
-        operations = self.__load_json_from_configmap(self.OPERATIONS_CONFIGMAP, "operations", namespace)
-        if isinstance(operations, dict):
-            return operations
-        return {}
+    def update_users(self, mutate: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Applies mutate(users) to the user registry with compare-and-swap, retrying on conflict."""
+        namespace = self.namespace
+        return self.__json_store.update(self.USERS_CONFIGMAP, "users", namespace, mutate, default=[])
 
-    def __save_operations(self, operations: Dict[str, Any]):
-        namespace = self.__get_current_namespace()
-        self.__save_json_to_configmap(operations, self.OPERATIONS_CONFIGMAP, "operations", namespace)
+    def release_user(self, user):
+        """Stops watching the namespace of a deleted user."""
+        namespace = self.user_namespace(user)
+        self.__json_store.evict(namespace)
+        self.__simulation_cache.evict(namespace)
+        self.__agent_pods.evict(namespace)
 
     def create_operation(self, operation_type: str, metadata: Dict[str, Any] | None = None) -> str:
-        operations = self.__load_operations()
         operation = new_operation(operation_type, metadata)
-        operations[operation["id"]] = operation
-        self.__save_operations(operations)
+        self.__operation_store.create(operation)
         return operation["id"]
 
     def get_operation(self, operation_id: str) -> Dict[str, Any] | None:
-        return self.__load_operations().get(operation_id)
+        return self.__operation_store.get(operation_id)
 
     def update_operation(
         self,
@@ -1095,22 +1285,31 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
         result: Any = None,
         metadata: Dict[str, Any] | None = None,
     ):
-        operations = self.__load_operations()
-        operation = operations.get(operation_id)
-        if operation is None:
-            raise KeyError(f"Operation '{operation_id}' not found")
-        if status is not None:
-            operation["status"] = status
-        if error is not None:
-            operation["error"] = error
-        if result is not None:
-            operation["result"] = result
-        if metadata is not None:
-            operation["metadata"] = metadata
-        operation["updatedAt"] = utc_now_iso()
-        operations[operation_id] = operation
-        self.__save_operations(operations)
+        self.__operation_store.update(
+            operation_id,
+            lambda operation: apply_operation_update(operation, status, error, result, metadata),
+        )
         
+    def add_operation_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        """
+        Calls listener(operation) whenever an operation is created or updated,
+        by this replica or, through the watch, by another one.
+        """
+        def on_configmap(event_type, configmap):
+            if event_type == "DELETED":
+                return
+            operation = ConfigMapOperationStore.operation_from_configmap(configmap)
+            if operation is not None:
+                listener(operation)
+
+        self.__operations_informer.add_listener(on_configmap)
+
+    def compact_operations(self, policy) -> int:
+        expired = policy.select_expired(self.__operation_store.list())
+        for operation_id in expired:
+            self.__operation_store.delete(operation_id)
+        return len(expired)
+
     def __wait_for_job_completion(self, batch_v1, job_name, timeout=300, interval=5):
         """Waits for the specified Job to either Complete or Fail."""
         print(f"Polling for Job '{job_name}' status (Interval: {interval}s, Timeout: {timeout}s)...")
@@ -1120,7 +1319,7 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
             time.sleep(interval)
             
             try:
-                job = batch_v1.read_namespaced_job_status(name=job_name, namespace=self.__get_current_namespace())
+                job = batch_v1.read_namespaced_job_status(name=job_name, namespace=self.namespace)
             except ApiException as e:
                 print(f"Error reading Job status: {e}")
                 return False
@@ -1148,7 +1347,7 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
             )
             return True
 
-        namespace = self.__get_current_namespace()
+        namespace = self.namespace
         try:
             with user_sync_lease(self.__coordination_v1_api, namespace):
                 return self.__run_sync_users_job()
@@ -1184,7 +1383,7 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
                         "containers": [
                         {
                             "name": "ansible",
-                            "image": f"image-registry.openshift-image-registry.svc:5000/{self.__get_current_namespace()}/obs-sync-users",
+                            "image": f"image-registry.openshift-image-registry.svc:5000/{self.namespace}/obs-sync-users",
                             "command": ["ansible-playbook",  "/runner/playbook-sync-users.yml"],
                             "env": [
                             {
@@ -1256,7 +1455,7 @@ class OpenShiftClusterConnector(ClusterConnectorInterface):
             }
         }
         
-        api_response = self.__batch_v1_api.create_namespaced_job(namespace=self.__get_current_namespace(), body=job_manifest_body)
+        api_response = self.__batch_v1_api.create_namespaced_job(namespace=self.namespace, body=job_manifest_body)
         job_name = api_response.metadata.name
         
         # Wait for job completion
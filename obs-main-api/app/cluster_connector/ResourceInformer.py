@@ -0,0 +1,168 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from kubernetes import watch  # type: ignore
+from kubernetes.client.rest import ApiException  # type: ignore
+
+
+# Watch requests are re-issued from the last seen resourceVersion after
+# this window, which also bounds how long stop() takes.
+WATCH_WINDOW_SECONDS = 60
+RETRY_DELAY_SECONDS = 5
+
+Listener = Callable[[str, Any], None]
+
+
+def _resource_version(obj) -> str | None:
+    try:
+        return obj.metadata.resource_version
+    except AttributeError:
+        return None
+
+
+class ResourceInformer:
+    """
+    Keeps an in-memory copy of the namespaced objects returned by a list
+    function (e.g. CoreV1Api.list_namespaced_config_map) for a label
+    selector: one list, then a watch resumed from the last resourceVersion,
+    relisting when the watch expires (410) or fails.
+
+    Writers call upsert()/remove() with the objects returned by the API, so
+    the cache reflects local writes right away (write-through); the watch
+    brings in the writes of other replicas. resourceVersions are opaque and
+    cannot be ordered, so a change is only skipped when it carries the
+    resourceVersion already cached (e.g. the watch echoing a local write).
+
+    Listeners get (event_type, obj) for every change, outside the lock.
+    """
+
+    def __init__(
+        self,
+        list_function,
+        namespace: str,
+        label_selector: str,
+        name: str = "",
+        watch_factory=watch.Watch,
+    ):
+        self._list_function = list_function
+        self._namespace = namespace
+        self._label_selector = label_selector
+        self._name = name or label_selector
+        self._watch_factory = watch_factory
+        self._lock = threading.Lock()
+        self._objects: Dict[str, Any] = {}
+        self._listeners: List[Listener] = []
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._watch = None
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name=f"informer-{self._name}", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        w = self._watch
+        if w is not None:
+            w.stop()
+
+    def wait_for_sync(self, timeout: float) -> bool:
+        return self._synced.wait(timeout)
+
+    @property
+    def synced(self) -> bool:
+        return self._synced.is_set()
+
+    def add_listener(self, listener: Listener):
+        self._listeners.append(listener)
+
+    def get(self, name: str):
+        with self._lock:
+            return self._objects.get(name)
+
+    def list(self) -> List[Any]:
+        with self._lock:
+            return list(self._objects.values())
+
+    def upsert(self, obj):
+        if self._apply("MODIFIED", obj):
+            self._notify("MODIFIED", obj)
+
+    def remove(self, name: str):
+        with self._lock:
+            obj = self._objects.pop(name, None)
+        if obj is not None:
+            self._notify("DELETED", obj)
+
+    def _apply(self, event_type: str, obj) -> bool:
+        """Applies one change to the cache. Returns False if it was already cached."""
+        name = obj.metadata.name
+        with self._lock:
+            if event_type == "DELETED":
+                return self._objects.pop(name, None) is not None
+            current = self._objects.get(name)
+            if current is not None:
+                current_version = _resource_version(current)
+                if current_version is not None and current_version == _resource_version(obj):
+                    return False
+            self._objects[name] = obj
+            return True
+
+    def _notify(self, event_type: str, obj):
+        for listener in self._listeners:
+            try:
+                listener(event_type, obj)
+            except Exception as e:
+                print(f"WARNING[informer]: Listener of {self._name} failed: {e}")
+
+    def _relist(self) -> str:
+        result = self._list_function(self._namespace, label_selector=self._label_selector)
+        listed = {obj.metadata.name: obj for obj in result.items}
+        with self._lock:
+            removed = [obj for name, obj in self._objects.items() if name not in listed]
+            for obj in removed:
+                del self._objects[obj.metadata.name]
+        for obj in removed:
+            self._notify("DELETED", obj)
+        for obj in listed.values():
+            if self._apply("MODIFIED", obj):
+                self._notify("MODIFIED", obj)
+        self._synced.set()
+        return result.metadata.resource_version
+
+    def _run(self):
+        resource_version = None
+        while not self._stopped.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._relist()
+                self._watch = self._watch_factory()
+                for event in self._watch.stream(
+                        self._list_function,
+                        namespace=self._namespace,
+                        label_selector=self._label_selector,
+                        resource_version=resource_version,
+                        timeout_seconds=WATCH_WINDOW_SECONDS):
+                    obj = event["object"]
+                    if event["type"] == "ERROR":
+                        # Usually "resourceVersion too old": start over.
+                        resource_version = None
+                        break
+                    resource_version = obj.metadata.resource_version
+                    if event["type"] in ("ADDED", "MODIFIED", "DELETED") and self._apply(event["type"], obj):
+                        self._notify(event["type"], obj)
+                    if self._stopped.is_set():
+                        break
+            except ApiException as e:
+                if e.status != 410:
+                    print(f"WARNING[informer]: Watch of {self._name} failed: {e.status} {e.reason}")
+                    self._stopped.wait(RETRY_DELAY_SECONDS)
+                resource_version = None
+            except Exception as e:
+                print(f"WARNING[informer]: Watch of {self._name} failed: {e}")
+                self._stopped.wait(RETRY_DELAY_SECONDS)
+                resource_version = None
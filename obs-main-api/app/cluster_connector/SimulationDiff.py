@@ -0,0 +1,53 @@
+from typing import Any, Dict, List
+
+
+# Agent fields rendered into the Deployment manifest (image, annotation and
+# the TARGETS env). A change in any of them means the Deployment is updated.
+DEPLOYMENT_FIELDS = ("type", "nextHop")
+
+
+class SimulationDiff:
+    """
+    Difference between the stored simulation agents and a new submission,
+    by agent id:
+
+    - created:   agents only in the new submission.
+    - updated:   agents in both whose Deployment fields changed.
+    - deleted:   agents only in the stored simulation.
+    - unchanged: agents in both with the same Deployment fields.
+    """
+
+    def __init__(self, stored_agents: List[Dict[str, Any]], new_agents: List[Dict[str, Any]]):
+        stored_by_id = {agent["id"]: agent for agent in stored_agents}
+        new_ids = {agent["id"] for agent in new_agents}
+
+        self.created: List[Dict[str, Any]] = []
+        self.updated: List[Dict[str, Any]] = []
+        self.unchanged: List[Dict[str, Any]] = []
+        for agent in new_agents:
+            stored = stored_by_id.get(agent["id"])
+            if stored is None:
+                self.created.append(agent)
+            elif self.__deployment_fields(stored) != self.__deployment_fields(agent):
+                self.updated.append(agent)
+            else:
+                self.unchanged.append(agent)
+        self.deleted: List[Dict[str, Any]] = [
+            agent for agent in stored_agents if agent["id"] not in new_ids
+        ]
+
+    @staticmethod
+    def __deployment_fields(agent: Dict[str, Any]):
+        return tuple(
+            tuple(agent.get(field) or []) if field == "nextHop" else agent.get(field)
+            for field in DEPLOYMENT_FIELDS
+        )
+
+    def is_empty(self) -> bool:
+        return not (self.created or self.updated or self.deleted)
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.created)} to create, {len(self.updated)} to update, "
+            f"{len(self.deleted)} to delete, {len(self.unchanged)} unchanged"
+        )
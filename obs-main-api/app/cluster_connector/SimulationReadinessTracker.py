@@ -0,0 +1,179 @@
+import threading
+import time
+from typing import Dict, Iterable, Set
+
+from kubernetes import watch  # type: ignore
+from kubernetes.client.rest import ApiException  # type: ignore
+
+
+AGENT_LABEL_SELECTOR = "observability-demo-framework=agent"
+# Each watch request is bounded so the watcher threads wind down shortly
+# after the tracker is done, even when the namespace is quiet.
+WATCH_WINDOW_SECONDS = 10
+# A failed watch is restarted after this delay, doubled on every failure.
+RETRY_DELAY_SECONDS = 0.5
+MAX_RETRY_DELAY_SECONDS = 5
+
+
+class SimulationReadinessTracker:
+    """
+    Tracks the readiness of a set of agent Deployments and Services with one
+    namespace-wide, label-filtered watch per kind, instead of one watch or
+    polling loop per agent.
+
+    After wait(), 'service_ips' maps each Service that got a cluster IP to it,
+    and 'ready_deployments' holds the Deployments whose rollout completed.
+    """
+
+    def __init__(self, apps_v1_api, core_v1_api, namespace: str, names: Iterable[str], watch_factory=watch.Watch):
+        self._apps_v1_api = apps_v1_api
+        self._core_v1_api = core_v1_api
+        self._namespace = namespace
+        self._names: Set[str] = set(names)
+        self._watch_factory = watch_factory
+        self._condition = threading.Condition()
+        self._done = False
+        self._error: Exception | None = None
+        self._last_failure: str | None = None
+        self.service_ips: Dict[str, str] = {}
+        self.ready_deployments: Set[str] = set()
+
+    def wait(self, timeout: float) -> bool:
+        """Blocks until every Deployment and Service is ready or 'timeout' expires."""
+        if not self._names:
+            return True
+        deadline = time.monotonic() + timeout
+        watchers = [
+            threading.Thread(
+                target=self._watch,
+                args=(self._apps_v1_api.list_namespaced_deployment, self._on_deployment, self.ready_deployments, deadline),
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._watch,
+                args=(self._core_v1_api.list_namespaced_service, self._on_service, self.service_ips, deadline),
+                daemon=True,
+            ),
+        ]
+        for watcher in watchers:
+            watcher.start()
+
+        with self._condition:
+            while not self._all_ready() and self._error is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            self._done = True
+            ready = self._all_ready()
+            error = self._error
+            last_failure = self._last_failure
+
+        if error is not None and not ready:
+            raise error
+        if not ready:
+            pending_services = sorted(self._names - set(self.service_ips))
+            pending_deployments = sorted(self._names - self.ready_deployments)
+            print(
+                f"Timeout after {timeout}s waiting for agents in '{self._namespace}'. "
+                f"Services without IP: {pending_services}. Deployments not ready: {pending_deployments}"
+                + (f". Last watch failure: {last_failure}" if last_failure else "")
+            )
+        return ready
+
+    def _all_ready(self) -> bool:
+        return self._names <= self.ready_deployments and self._names <= set(self.service_ips)
+
+    def _watch(self, list_function, on_event, state, deadline: float):
+        retry_delay = RETRY_DELAY_SECONDS
+        while True:
+            with self._condition:
+                if self._done:
+                    return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            w = self._watch_factory()
+            failure = None
+            try:
+                # A fresh watch starts with an ADDED event per existing object,
+                # so no separate list call is needed.
+                for event in w.stream(
+                        list_function,
+                        namespace=self._namespace,
+                        label_selector=AGENT_LABEL_SELECTOR,
+                        timeout_seconds=max(1, int(min(remaining, WATCH_WINDOW_SECONDS)))):
+                    if event["type"] == "ERROR":
+                        # The object is a Status dict, e.g. "resourceVersion too old".
+                        failure = f"watch error event: {event['object']}"
+                        w.stop()
+                        break
+                    with self._condition:
+                        on_event(event["type"], event["object"])
+                        self._condition.notify_all()
+                        if self._done or self._all_ready():
+                            w.stop()
+                            return
+                    retry_delay = RETRY_DELAY_SECONDS
+            except ApiException as e:
+                # No status means the request never got an answer (e.g. a
+                # dropped connection): retry it like a server error.
+                if e.status is not None and e.status != 410 and e.status < 500:
+                    # Not transient (e.g. 403): report it instead of waiting for the deadline.
+                    print(f"Exception when watching agents in '{self._namespace}': {e.status} {e.reason}")
+                    with self._condition:
+                        self._error = e
+                        self._condition.notify_all()
+                    return
+                failure = f"{e.status} {e.reason}"
+            except Exception as e:
+                failure = f"{type(e).__name__}: {e}"
+            if failure is None:
+                continue
+            print(f"WARNING: Watch of agents in '{self._namespace}' failed, restarting in {retry_delay}s: {failure}")
+            with self._condition:
+                self._last_failure = failure
+                # The restarted watch lists every object again; forget what
+                # was seen so objects deleted in between are not kept.
+                state.clear()
+                if not self._done:
+                    self._condition.wait(min(retry_delay, max(0, deadline - time.monotonic())))
+            retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY_SECONDS)
+
+    def _on_deployment(self, event_type: str, deployment):
+        name = deployment.metadata.name
+        if name not in self._names:
+            return
+        if event_type != "DELETED" and self._is_deployment_ready(deployment):
+            if name not in self.ready_deployments:
+                print(f"All pods for deployment '{name}' are ready.")
+            self.ready_deployments.add(name)
+        else:
+            self.ready_deployments.discard(name)
+
+    def _on_service(self, event_type: str, service):
+        name = service.metadata.name
+        if name not in self._names:
+            return
+        service_ip = service.spec.cluster_ip if service.spec else None
+        if event_type != "DELETED" and service_ip and service_ip != "None":
+            if name not in self.service_ips:
+                print(f"Service {name} IP: {service_ip}")
+            self.service_ips[name] = service_ip
+        else:
+            self.service_ips.pop(name, None)
+
+    @staticmethod
+    def _is_deployment_ready(deployment) -> bool:
+        # Same rule as 'oc rollout status': the latest spec was observed and
+        # every replica runs the new template and is ready.
+        spec_replicas = deployment.spec.replicas if deployment.spec.replicas is not None else 1
+        status = deployment.status
+        if status is None:
+            return False
+        return (
+            (status.observed_generation or 0) >= (deployment.metadata.generation or 0)
+            and (status.updated_replicas or 0) >= spec_replicas
+            and (status.replicas or 0) <= (status.updated_replicas or 0)
+            and (status.ready_replicas or 0) >= spec_replicas
+        )
@@ -0,0 +1,181 @@
+import base64
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+from kubernetes import watch  # type: ignore
+from kubernetes.client.rest import ApiException  # type: ignore
+
+from cluster_connector.ResourceInformer import ResourceInformer
+from cluster_connector.NamespaceInformers import (
+    NamespaceInformers,
+    DEFAULT_MAX_NAMESPACES,
+    DEFAULT_IDLE_SECONDS,
+)
+from cluster_connector.SimulationStateCodec import SimulationStateCodec
+
+
+STORAGE_LABEL_SELECTOR = "observability-demo-framework=storage"
+SIMULATION_SECRET = "obs-demo-fw-state"
+SIMULATION_KEY = "simulation"
+DEFAULT_SYNC_TIMEOUT_SECONDS = 5.0
+DEFAULT_MISSING_TTL_SECONDS = 30.0
+
+
+class SimulationStateCache:
+    """
+    Parsed simulations of the obs-demo-fw-state secrets, keyed by namespace
+    and secret resourceVersion.
+
+    A namespace with a stored simulation gets a ResourceInformer on its
+    storage secrets, so a read costs no API call, and the secret is only
+    decoded again when its resourceVersion changes. The informers are
+    bounded and stopped when idle (see NamespaceInformers). A namespace
+    without a simulation is not watched: it is read once and remembered as
+    missing for 'missing_ttl_seconds', or until a simulation is saved there.
+    Callers get a deep copy they are free to modify.
+    """
+
+    def __init__(
+        self,
+        core_v1_api,
+        sync_timeout_seconds: float = DEFAULT_SYNC_TIMEOUT_SECONDS,
+        max_namespaces: int = DEFAULT_MAX_NAMESPACES,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        missing_ttl_seconds: float = DEFAULT_MISSING_TTL_SECONDS,
+        watch_factory=watch.Watch,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._core_v1_api = core_v1_api
+        self._watch_factory = watch_factory
+        self._sync_timeout_seconds = sync_timeout_seconds
+        self._missing_ttl_seconds = missing_ttl_seconds
+        self._max_missing = max(1, max_namespaces)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._informers = NamespaceInformers(
+            self.__create_informer,
+            max_namespaces=max_namespaces,
+            idle_seconds=idle_seconds,
+            on_evict=lambda namespace, informer: self.__drop_parsed(namespace),
+            clock=clock,
+        )
+        self._parsed: Dict[str, Tuple[str, Dict[str, Any], bytes]] = {}
+        # namespace -> when it was found without a simulation, oldest first.
+        self._missing: "OrderedDict[str, float]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __create_informer(self, namespace: str) -> ResourceInformer:
+        return ResourceInformer(
+            self._core_v1_api.list_namespaced_secret,
+            namespace,
+            STORAGE_LABEL_SELECTOR,
+            name=f"simulation-{namespace}",
+            watch_factory=self._watch_factory,
+        )
+
+    def __drop_parsed(self, namespace: str):
+        with self._lock:
+            self._parsed.pop(namespace, None)
+
+    def __known_missing(self, namespace: str) -> bool:
+        with self._lock:
+            found_at = self._missing.get(namespace)
+            if found_at is None:
+                return False
+            if self._clock() - found_at < self._missing_ttl_seconds:
+                return True
+            del self._missing[namespace]
+            return False
+
+    def __remember_missing(self, namespace: str):
+        with self._lock:
+            self._missing[namespace] = self._clock()
+            self._missing.move_to_end(namespace)
+            while len(self._missing) > self._max_missing:
+                self._missing.popitem(last=False)
+
+    def __get_secret(self, namespace: str):
+        try:
+            return self._core_v1_api.read_namespaced_secret(SIMULATION_SECRET, namespace)
+        except ApiException as e:
+            if e.status == 404:
+                return None
+            raise
+
+    def _read_secret(self, namespace: str):
+        informer = self._informers.peek(namespace)
+        if informer is None:
+            if self.__known_missing(namespace):
+                with self._lock:
+                    self._hits += 1
+                return None
+            with self._lock:
+                self._misses += 1
+            secret = self.__get_secret(namespace)
+            if secret is None:
+                self.__remember_missing(namespace)
+                return None
+            # The namespace has a simulation: watch it from now on.
+            self._informers.get(namespace)
+            return secret
+        # Refreshes the namespace's last use.
+        informer = self._informers.get(namespace)
+        if informer.wait_for_sync(self._sync_timeout_seconds):
+            with self._lock:
+                self._hits += 1
+            return informer.get(SIMULATION_SECRET)
+        with self._lock:
+            self._misses += 1
+        return self.__get_secret(namespace)
+
+    def read(self, namespace: str) -> Tuple[Dict[str, Any] | None, bytes | None]:
+        """
+        Returns (simulation, stored state) of a namespace, or (None, None) if
+        it has no stored simulation.
+        """
+        secret = self._read_secret(namespace)
+        if secret is None:
+            return None, None
+        if not secret.data or SIMULATION_KEY not in secret.data:
+            raise RuntimeError(f"Secret '{SIMULATION_SECRET}' does not contain '{SIMULATION_KEY}' key.")
+        resource_version = secret.metadata.resource_version
+        with self._lock:
+            entry = self._parsed.get(namespace)
+        if entry is None or entry[0] != resource_version:
+            state = base64.b64decode(secret.data[SIMULATION_KEY])
+            entry = (resource_version, SimulationStateCodec.decode(state), state)
+            with self._lock:
+                self._parsed[namespace] = entry
+        return copy.deepcopy(entry[1]), entry[2]
+
+    def put(self, namespace: str, secret):
+        """Write-through of a secret returned by a create or replace call."""
+        with self._lock:
+            self._missing.pop(namespace, None)
+        informer = self._informers.peek(namespace)
+        if informer is not None:
+            informer.upsert(secret)
+
+    def evict(self, namespace: str):
+        """Forgets a namespace whose simulation was deleted and stops watching it."""
+        self._informers.evict(namespace)
+        with self._lock:
+            self._parsed.pop(namespace, None)
+            self._missing.pop(namespace, None)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._informers.stats()
+        with self._lock:
+            stats.update({
+                "hits": self._hits,
+                "misses": self._misses,
+                "knownMissing": len(self._missing),
+            })
+        return stats
+
+    def close(self):
+        self._informers.close()
@@ -0,0 +1,51 @@
+import gzip
+import json
+from typing import Any, Dict
+
+# Version header of the compressed format. Anything else is read as the
+# original, uncompressed JSON document.
+FORMAT_HEADER = b"obs-demo-fw-state/2\n"
+LAYOUT_ELEMENT_FIELDS = ("group", "data", "position")
+# Filled in when the simulation is read; never stored.
+TRANSIENT_AGENT_FIELDS = ("metrics", "metricsError", "pod", "podPhase")
+USER_FIELDS = ("username", "monitoringType")
+
+
+class SimulationStateCodec:
+    """
+    Serializes the simulation kept in the obs-demo-fw-state secret: the
+    layout, the agents and the user's monitoring stack, without the fields
+    computed on every read, as gzip-compressed JSON behind a version header.
+    """
+
+    @staticmethod
+    def compact(simulation: Dict[str, Any]) -> Dict[str, Any]:
+        user = simulation.get("user") or {}
+        return {
+            "layout": [
+                {field: element[field] for field in LAYOUT_ELEMENT_FIELDS if field in element}
+                for element in simulation.get("layout") or []
+            ],
+            "agents": [
+                {field: value for field, value in agent.items() if field not in TRANSIENT_AGENT_FIELDS}
+                for agent in simulation.get("agents") or []
+            ],
+            "user": {field: user[field] for field in USER_FIELDS if field in user},
+        }
+
+    @staticmethod
+    def encode(simulation: Dict[str, Any]) -> bytes:
+        document = json.dumps(SimulationStateCodec.compact(simulation), separators=(",", ":"))
+        # mtime=0 keeps the output stable, so an unchanged simulation
+        # produces an identical secret.
+        return FORMAT_HEADER + gzip.compress(document.encode("utf-8"), mtime=0)
+
+    @staticmethod
+    def decode(data: bytes) -> Dict[str, Any]:
+        if data.startswith(FORMAT_HEADER):
+            return json.loads(gzip.decompress(data[len(FORMAT_HEADER):]))
+        return json.loads(data.decode("utf-8"))
+
+    @staticmethod
+    def is_legacy(data: bytes) -> bool:
+        return not data.startswith(FORMAT_HEADER)
@@ -1,17 +1,20 @@
 from agent_manager.OpenShiftAgentManager         import OpenShiftAgentManager
+from agent_manager.AsyncOpenShiftAgentManager    import AsyncOpenShiftAgentManager
 from agent_manager.MockAgentManager              import MockAgentManager
+from agent_manager.AgentMetricsCache             import AgentMetricsCache, DEFAULT_AGENT_METRICS_CACHE_TTL_SECONDS
 
 from cluster_connector.OpenShiftClusterConnector import OpenShiftClusterConnector
 from cluster_connector.MockClusterConnector      import MockClusterConnector
 
 from fastapi                 import FastAPI, HTTPException, Request, Depends, status, Response  # type: ignore
-from fastapi.responses       import JSONResponse                                                # type: ignore
+from fastapi.responses       import JSONResponse, StreamingResponse                             # type: ignore
 from fastapi.middleware.cors import CORSMiddleware                                              # type: ignore
 from fastapi.security        import HTTPBearer                                                  # type: ignore
 
 from jose                 import jwt                                                            # type: ignore
 from jose.exceptions      import JWTError                                                       # type: ignore
 
+from contextlib import asynccontextmanager
 from typing import Dict, Any
 from utils  import JSONUtils
 from pprint import pprint
@@ -19,16 +22,45 @@ from pprint import pprint
 import os
 import asyncio
 import inspect
-import requests                                                                                 # type: ignore
 
 from agent_manager.OpenShiftAgentManager import AgentRequestError
 
 from validators import validate_username
+from agent_metrics import collect_agent_metrics
+from alert_index import attach_alerts_to_metrics
+from auth.jwks_cache import (
+    JwksCache,
+    JwksFetchError,
+    DEFAULT_JWKS_CACHE_TTL_SECONDS,
+    DEFAULT_JWKS_NEGATIVE_TTL_SECONDS,
+)
+from auth.token_cache import VerifiedTokenCache, DEFAULT_TOKEN_CACHE_MAX_ENTRIES
 from operations.operation_tasks import (
     run_user_create,
     run_user_delete,
     run_simulation_create,
     run_simulation_delete,
+    bulk_simulation_delete,
+    DEFAULT_BULK_TEARDOWN_CONCURRENCY,
+)
+from operations.operation_scheduler import (
+    OperationScheduler,
+    SchedulerClosedError,
+    DEFAULT_POOL,
+    DEFAULT_OPERATION_WORKERS,
+    DEFAULT_OPERATION_DRAIN_TIMEOUT_SECONDS,
+)
+from operations.operation_events import (
+    OperationEventBroker,
+    stream_operation_events,
+    DEFAULT_MAX_STREAM_SECONDS,
+)
+from operations.operation_retention import (
+    OperationCompactor,
+    OperationRetentionPolicy,
+    DEFAULT_OPERATION_MAX_AGE_SECONDS,
+    DEFAULT_OPERATION_MAX_PER_USER,
+    DEFAULT_OPERATION_COMPACTION_INTERVAL_SECONDS,
 )
 
 #RESPONSE CODES HERE: https://github.com/Kludex/starlette/blob/main/starlette/status.py
@@ -46,6 +78,9 @@ def is_using_fake_agent_manager():
         return False
     else:
         return value == 'mock'
+
+def is_using_async_agent_manager():
+    return os.environ.get('AGENT_MANAGER') == 'async'
     
 def get_keycloak_issuer():
     value = os.environ.get('KEYCLOAK_ISSUER')
@@ -61,14 +96,102 @@ def get_keycloak_certificates_url():
     else:
         return value
 
+def get_jwks_cache_ttl_seconds():
+    return int(os.environ.get('JWKS_CACHE_TTL_SECONDS', DEFAULT_JWKS_CACHE_TTL_SECONDS))
+
+def get_jwks_negative_cache_ttl_seconds():
+    return int(os.environ.get('JWKS_NEGATIVE_CACHE_TTL_SECONDS', DEFAULT_JWKS_NEGATIVE_TTL_SECONDS))
+
+def get_token_cache_max_entries():
+    return int(os.environ.get('TOKEN_CACHE_MAX_ENTRIES', DEFAULT_TOKEN_CACHE_MAX_ENTRIES))
+
+def get_agent_metrics_concurrency():
+    return int(os.environ.get('AGENT_METRICS_CONCURRENCY', 10))
+
+def get_agent_metrics_deadline_seconds():
+    return float(os.environ.get('AGENT_METRICS_DEADLINE_SECONDS', 5))
+
+def get_agent_metrics_cache_ttl_seconds():
+    return float(os.environ.get('AGENT_METRICS_CACHE_TTL_SECONDS', DEFAULT_AGENT_METRICS_CACHE_TTL_SECONDS))
+
+def get_bulk_teardown_concurrency():
+    return int(os.environ.get('BULK_TEARDOWN_CONCURRENCY', DEFAULT_BULK_TEARDOWN_CONCURRENCY))
+
+def get_operation_max_age_seconds():
+    return int(os.environ.get('OPERATION_MAX_AGE_SECONDS', DEFAULT_OPERATION_MAX_AGE_SECONDS))
+
+def get_operation_max_per_user():
+    return int(os.environ.get('OPERATION_MAX_PER_USER', DEFAULT_OPERATION_MAX_PER_USER))
+
+def get_operation_compaction_interval_seconds():
+    return float(os.environ.get('OPERATION_COMPACTION_INTERVAL_SECONDS', DEFAULT_OPERATION_COMPACTION_INTERVAL_SECONDS))
+
+def get_operation_workers():
+    return int(os.environ.get('OPERATION_WORKERS', DEFAULT_OPERATION_WORKERS))
+
+def get_operation_drain_timeout_seconds():
+    return float(os.environ.get('OPERATION_DRAIN_TIMEOUT_SECONDS', DEFAULT_OPERATION_DRAIN_TIMEOUT_SECONDS))
+
+def get_operation_stream_max_seconds():
+    return float(os.environ.get('OPERATION_STREAM_MAX_SECONDS', DEFAULT_MAX_STREAM_SECONDS))
+
 # Keycloak Configuration
 KEYCLOAK_ISSUER = get_keycloak_issuer()
 KEYCLOAK_AUDIENCE = "account"
 KEYCLOAK_CERTS_URL = get_keycloak_certificates_url()
 print(f"... IdP issuer endpoint: {KEYCLOAK_ISSUER}")
 
+jwks_cache = JwksCache(
+    KEYCLOAK_CERTS_URL,
+    ttl_seconds=get_jwks_cache_ttl_seconds(),
+    negative_ttl_seconds=get_jwks_negative_cache_ttl_seconds(),
+)
+token_cache = VerifiedTokenCache(max_entries=get_token_cache_max_entries())
+
+# Agent metrics fan-out
+AGENT_METRICS_CONCURRENCY = get_agent_metrics_concurrency()
+AGENT_METRICS_DEADLINE_SECONDS = get_agent_metrics_deadline_seconds()
+agent_metrics_cache = AgentMetricsCache(ttl_seconds=get_agent_metrics_cache_ttl_seconds())
+
+BULK_TEARDOWN_CONCURRENCY = get_bulk_teardown_concurrency()
+
+# Background operations: bounded, and serialized per user. Bulk teardowns
+# get their own pool of BULK_TEARDOWN_CONCURRENCY workers, so a large
+# teardown neither starves other users' operations nor waits behind them.
+TEARDOWN_POOL = "teardown"
+operation_scheduler = OperationScheduler(
+    max_workers=get_operation_workers(),
+    pools={TEARDOWN_POOL: BULK_TEARDOWN_CONCURRENCY},
+)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    operation_events.bind(asyncio.get_running_loop())
+    operation_compactor.start()
+    yield
+    abandoned = await operation_scheduler.drain(timeout=get_operation_drain_timeout_seconds())
+    for operation_id in abandoned:
+        # Otherwise they stay pending or running and their clients never see an end.
+        try:
+            await asyncio.to_thread(
+                cluster_connector.update_operation,
+                operation_id,
+                status="failed",
+                error="The API shut down before the operation finished",
+            )
+        except Exception as exc:
+            print(f"WARNING[operations]: Could not mark {operation_id} as failed: {exc}")
+    await operation_compactor.stop()
+    close_cluster_connector = getattr(cluster_connector, "close", None)
+    if close_cluster_connector is not None:
+        close_cluster_connector()
+    await jwks_cache.aclose()
+    close_agent_manager = getattr(agent_manager, "aclose", None)
+    if close_agent_manager is not None:
+        await close_agent_manager()
+
 #TODO: Improve security. CORS 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 origins = [
 #    "http://localhost:3000",
     "*"
@@ -86,8 +209,22 @@ if is_using_fake_cluster_connector():
 else:
     cluster_connector = OpenShiftClusterConnector()    
 
+operation_events = OperationEventBroker()
+cluster_connector.add_operation_listener(operation_events.publish)
+
+operation_compactor = OperationCompactor(
+    cluster_connector,
+    OperationRetentionPolicy(
+        max_age_seconds=get_operation_max_age_seconds(),
+        max_per_user=get_operation_max_per_user(),
+    ),
+    interval_seconds=get_operation_compaction_interval_seconds(),
+)
+
 if is_using_fake_agent_manager():
     agent_manager = MockAgentManager()
+elif is_using_async_agent_manager():
+    agent_manager = AsyncOpenShiftAgentManager()
 else:
     agent_manager = OpenShiftAgentManager()
 
@@ -104,24 +241,21 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 # Security Dependency
 security = HTTPBearer()
 
-# Fetch Keycloak Public Keys
-def get_public_key(kid: str):
+# Fetch Keycloak Public Keys (cached, see auth/jwks_cache.py)
+async def get_public_key(kid: str):
     try:
         #TODO: Needs to improve certificate handling. 
-        response = requests.get(KEYCLOAK_CERTS_URL)
-        response.raise_for_status()
-        jwks = response.json()
-        for key in jwks["keys"]:
-            if key["kid"] == kid:
-                # Return the key directly (RSA public key in JSON Web Key format)
-                return key
-    except requests.RequestException as e:
+        key = await jwks_cache.get_key(kid)
+    except JwksFetchError as e:
         __print_exception(e)
         raise HTTPException(status_code=500, detail=f"Error fetching public keys: {e}")
-    raise HTTPException(status_code=401, detail="Public key not found")
+    if key is None:
+        raise HTTPException(status_code=401, detail="Public key not found")
+    # Return the key directly (RSA public key in JSON Web Key format)
+    return key
 
 # Decode and Verify JWT
-def decode_token(token: str) -> Dict:
+async def decode_token(token: str) -> Dict:
     try:
         # Get the unverified header to extract 'kid'
         unverified_header = jwt.get_unverified_header(token)
@@ -130,10 +264,12 @@ def decode_token(token: str) -> Dict:
             raise HTTPException(status_code=401, detail="Token header missing 'kid'")
         
         # Fetch the public key from Keycloak using 'kid'
-        public_key = get_public_key(kid)
+        public_key = await get_public_key(kid)
 
-        # Decode the token using the public key
-        payload = jwt.decode(
+        # Decode the token using the public key. RSA verification is CPU work,
+        # keep it off the event loop.
+        payload = await asyncio.to_thread(
+            jwt.decode,
             token,
             public_key,  # This is now the public key directly, no need for from_jwk
             algorithms=["RS256"],
@@ -149,14 +285,35 @@ def decode_token(token: str) -> Dict:
         raise HTTPException(status_code=401, detail=f"Error decoding token: {e}")
 
 # Dependency for Secured Endpoints
-def get_current_user(authorization: str = Depends(security)):
+async def get_current_user(authorization: str = Depends(security)):
     try:
         token = authorization.credentials
-        return decode_token(token)["preferred_username"]
+        # Hot path: the same access token is sent on every poll.
+        username = token_cache.get(token)
+        if username is not None:
+            return username
+        payload = await decode_token(token)
+        username = payload["preferred_username"]
+        if "exp" in payload:
+            token_cache.put(token, username, payload["exp"])
+        return username
     except Exception as e:
         __print_exception(e)
         raise HTTPException(status_code=401, detail=f"Unauthorized: {e}")
 
+@app.get("/api/v1/stats")
+def get_stats(current_user: dict = Depends(get_current_user)):
+    if current_user != "admin":
+        raise HTTPException(status_code=403, detail="Only the admin can read the API stats")
+    return {
+        "tokenCache": token_cache.stats(),
+        "agentMetricsCache": agent_metrics_cache.stats(),
+        "operationRetention": operation_compactor.stats(),
+        "operationStreams": operation_events.stats(),
+        "operationScheduler": operation_scheduler.stats(),
+        "simulationStorage": cluster_connector.get_simulation_storage_stats(),
+    }
+
 @app.get("/api/v1/escotilla")
 async def get_escotilla_info(current_user: dict = Depends(get_current_user)):
     #TODO: Improve server error handling (balance mock and cluster)
@@ -175,47 +332,70 @@ def add_next_hop_to_agent(name, agent):
         # If the key doesn't exist, create a new list with the string
         agent["nextHop"] = [name]
 
+async def _call_agent_manager(method, *args, **kwargs):
+    """Runs an agent manager call without blocking the event loop."""
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    result = await asyncio.to_thread(method, *args, **kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+async def _fetch_agent_metrics(semaphore: asyncio.Semaphore, user_id: str, agent_id: str, hostname: str):
+    async def load():
+        async with semaphore:
+            return await _call_agent_manager(agent_manager.get_agent_metrics, user_id, hostname)
+    # Pollers of the same simulation share one scrape per agent.
+    return await agent_metrics_cache.get(user_id, agent_id, load)
+
+async def _collect_agent_metrics(user_id: str, user: str, agents: list[dict[str, Any]]):
+    await collect_agent_metrics(
+        agents,
+        lambda semaphore, item: _fetch_agent_metrics(
+            semaphore,
+            user_id,
+            item["id"],
+            cluster_connector.retrieve_hostname_from_service_id(user, item["id"])),
+        AGENT_METRICS_CONCURRENCY,
+        AGENT_METRICS_DEADLINE_SECONDS,
+    )
+
+def _require_valid_user(user_id: str):
+    # Path user ids name a namespace and a watch of it: reject anything that
+    # cannot be a user before it reaches the cluster connector.
+    error = validate_username(user_id)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+
+def _user_queue_key(user_id: str) -> str:
+    # Simulation paths may still carry the legacy namespace prefix; user and
+    # simulation operations of the same user must share one queue.
+    return user_id.removeprefix("obs-demo-")
+
+def _schedule_operation(queue_key: str, operation_id: str, task, *args, pool: str = DEFAULT_POOL):
+    try:
+        operation_scheduler.submit(queue_key, operation_id, task, *args, pool=pool)
+    except SchedulerClosedError as exc:
+        cluster_connector.update_operation(operation_id, status="failed", error=str(exc))
+        raise HTTPException(status_code=503, detail=str(exc))
+
 @app.get("/api/v1/users/{user_id}/simulation")
 async def get_simulation(user_id: str, current_user: dict = Depends(get_current_user)
 ):
     print(f"Received user from path: {user_id}")
     #TODO: REMOVE GNAPA: 
     user = user_id.removeprefix("obs-demo-")
-    # Get the simulation definition from storage    
-    simulation = cluster_connector.retrieve_simulation(user)    
+    _require_valid_user(user)
+    # Get the simulation definition from storage, off the event loop: the
+    # first read of a namespace waits for its informers to sync.
+    simulation = await asyncio.to_thread(cluster_connector.retrieve_simulation, user)
     if simulation == {}:        
         raise HTTPException(status_code=404, detail="Simulation not found")    
     # Update agent metrics     
-    for item in simulation["agents"]:
-        id = item["id"]
-        metrics = agent_manager.get_agent_metrics(
-            user_id, 
-            cluster_connector.retrieve_hostname_from_service_id(user, id))
-        for metric in metrics:
-            metric["alerts"] = []
-        print(f"Pod: {item['pod']}. Metrics: {metrics}")        
-        item["metrics"] = metrics
+    await _collect_agent_metrics(user_id, user, simulation["agents"])
     # Update alerts of the metrics.
-    alerts = cluster_connector.get_alert_definitions(user) 
-    for alert in alerts:
-        if alert["scope"] != "metricAgent":
-            continue
-        agent_matches = [agent for agent in simulation["agents"] if agent["id"] == alert["definition"]["agent"]]
-        agent = agent_matches[0] if agent_matches else None
-        if agent is None: 
-            print(f"WARNING[alerts]: Agent {alert['definition']['agent']} Not found")
-            continue
-        metric_matches = [metric for metric in agent["metrics"] if metric["name"] == alert["definition"]["metric"]]
-        metric = metric_matches[0] if metric_matches else None
-        if metric is None or metric is []: 
-            print(f"WARNING[alerts]: Metric {alert['definition']['metric']} for the agent {agent['id']} not found")
-            continue
-        # Check if the alert is already present.
-        alert_matches_in_metric = [item for item in metric.get("alerts", []) if item["name"] == alert["name"]]
-        alert_match = alert_matches_in_metric[0] if alert_matches_in_metric and len(alert_matches_in_metric) > 0 else None
-        # If not, add to the definitions
-        if alert_match is None:
-            metric.setdefault("alerts", []).append(alert)
+    alerts = await asyncio.to_thread(cluster_connector.get_alert_definitions, user)
+    attach_alerts_to_metrics(simulation["agents"], alerts)
     
     return simulation
 
@@ -225,11 +405,12 @@ async def create_simulation(
     payload: Dict[str, Any],
     current_user: dict = Depends(get_current_user),
 ):
+    _require_valid_user(_user_queue_key(user_id))
     operation_id = cluster_connector.create_operation(
         "simulation-create",
         {"userId": user_id},
     )
-    asyncio.create_task(run_simulation_create(cluster_connector, operation_id, user_id, payload))
+    _schedule_operation(_user_queue_key(user_id), operation_id, run_simulation_create, cluster_connector, operation_id, user_id, payload)
     return {"operationId": operation_id, "status": "pending"}
 
 @app.delete("/api/v1/users/{user_id}/simulation", status_code=status.HTTP_202_ACCEPTED)
@@ -237,25 +418,66 @@ async def delete_simulation(
     user_id: str,
     current_user: dict = Depends(get_current_user),
 ):
+    _require_valid_user(_user_queue_key(user_id))
     operation_id = cluster_connector.create_operation(
         "simulation-delete",
         {"userId": user_id},
     )
-    asyncio.create_task(run_simulation_delete(cluster_connector, operation_id, user_id, agent_manager))
+    agent_metrics_cache.invalidate(user_id)
+    _schedule_operation(_user_queue_key(user_id), operation_id, run_simulation_delete, cluster_connector, operation_id, user_id, agent_manager)
     return {"operationId": operation_id, "status": "pending"}
 
+@app.post("/api/v1/simulations/teardown", status_code=status.HTTP_202_ACCEPTED)
+async def teardown_simulations(
+    payload: Dict[str, Any],
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    Deletes the simulations of several users in one operation. The payload is
+    either {"users": ["user1", ...]} or {"all": true}.
+    """
+    if current_user != "admin":
+        raise HTTPException(status_code=403, detail="Only the admin can tear down simulations in bulk")
+    if payload.get("all"):
+        users = await asyncio.to_thread(cluster_connector.get_users_json)
+        user_ids = [user.get("username") for user in users if user.get("username")]
+    else:
+        user_ids = payload.get("users")
+        if not isinstance(user_ids, list) or not user_ids:
+            raise HTTPException(status_code=400, detail="Provide a non-empty 'users' list or 'all': true")
+        for user_id in user_ids:
+            error = validate_username(user_id) if isinstance(user_id, str) else "Username must be a string."
+            if error:
+                raise HTTPException(status_code=400, detail=f"Invalid user {user_id!r}: {error}")
+        user_ids = [user_id.strip() for user_id in user_ids]
+    # Preserve order, drop duplicates
+    user_ids = list(dict.fromkeys(user_ids))
+
+    operation_id = cluster_connector.create_operation(
+        "simulation-bulk-delete",
+        {"users": user_ids},
+    )
+    for user_id in user_ids:
+        agent_metrics_cache.invalidate(user_id)
+    # One job per user, on that user's queue, so a teardown waits for the
+    # user's pending create or delete instead of racing it.
+    teardown = bulk_simulation_delete(cluster_connector, operation_id, user_ids, agent_manager)
+    for user_id in user_ids:
+        _schedule_operation(_user_queue_key(user_id), operation_id, teardown, user_id, pool=TEARDOWN_POOL)
+    return {"operationId": operation_id, "status": "pending", "users": user_ids}
+
 @app.post("/api/v1/users/{user_id}/simulation/kick/{agent_id}")
 async def agent_kick(user_id, agent_id: str, payload: dict[str, Any], current_user: dict = Depends(get_current_user)):    
     agent_dns = payload['dns']
     print(f"DNS: {agent_dns}")
     kick_initial_count = payload['count']    
-    return agent_manager.kick(user_id, agent_id, agent_dns, kick_initial_count)
+    return await _call_agent_manager(agent_manager.kick, user_id, agent_id, agent_dns, kick_initial_count)
 
 async def _invoke_set_agent_metrics(method: str, user_id: str, payload: dict[str, Any]):
-    result = agent_manager.set_agent_metrics(method, user_id, payload=payload)
-    if inspect.isawaitable(result):
-        result = await result
-    return result
+    try:
+        return await _call_agent_manager(agent_manager.set_agent_metrics, method, user_id, payload=payload)
+    finally:
+        agent_metrics_cache.invalidate(user_id, payload.get("id"))
 
 @app.post("/api/v1/users/{user_id}/simulation/metrics")
 async def create_agent_metric(user_id: str, payload: dict[str, Any], current_user: dict = Depends(get_current_user)):
@@ -352,6 +574,7 @@ def __get_alert_group(alert_data):
     
 @app.post("/api/v1/users/{user_id}/simulation/alerts")
 async def create_alert(user_id: str, payload: dict[str, Any], current_user: dict = Depends(get_current_user)):
+    _require_valid_user(user_id)
     print("Creating alert: ")   
     
     #Create the alert in the cluster
@@ -373,7 +596,8 @@ async def create_alert(user_id: str, payload: dict[str, Any], current_user: dict
     summary = __get_alert_summary(payload)  
     expression = __get_alert_expression(payload)
         
-    result = cluster_connector.create_alert_resource(user_id, stack, alert_id, alert_name, severity, group, expression, summary)
+    result = await asyncio.to_thread(
+        cluster_connector.create_alert_resource, user_id, stack, alert_id, alert_name, severity, group, expression, summary)
     if result is None: 
         raise HTTPException(status_code=400, detail="Error creating resource in the cluster. See logs for more information.")
     print("-----")
@@ -384,7 +608,7 @@ async def create_alert(user_id: str, payload: dict[str, Any], current_user: dict
     #TODO: Error handling (HTTP 400, 409, 422)
     payload['id'] = alert_id
     payload['name'] = alert_name
-    cluster_connector.save_alert_definition(user_id, payload)
+    await asyncio.to_thread(cluster_connector.save_alert_definition, user_id, payload)
 
     response_data = {
         "id": alert_id,
@@ -426,6 +650,7 @@ def __print_exception(e):
 
 @app.delete("/api/v1/users/{user_id}/simulation/alerts/{alert_id}")
 def delete_alert(user_id, alert_id: str, current_user: dict = Depends(get_current_user)):
+    _require_valid_user(user_id)
     alert_name=alert_id
     print(f"Delete alert: {alert_name}")
     
@@ -448,6 +673,7 @@ def delete_alert(user_id, alert_id: str, current_user: dict = Depends(get_curren
 
 @app.get("/api/v1/users/{user_id}/simulation/alerts")
 def get_alerts(user_id: str, current_user: dict = Depends(get_current_user)):
+    _require_valid_user(user_id)
     alerts = []
     alert_data=cluster_connector.get_alert_definitions(user_id)
     for alert in alert_data:
@@ -474,6 +700,24 @@ def get_operation_status(operation_id: str, current_user: dict = Depends(get_cur
         raise HTTPException(status_code=404, detail="Operation not found")
     return operation
 
+@app.get("/api/v1/operations/{operation_id}/events")
+async def get_operation_events(operation_id: str, current_user: dict = Depends(get_current_user)):
+    """Server-sent events with the operation state, until it succeeds or fails."""
+    operation = await asyncio.to_thread(cluster_connector.get_operation, operation_id)
+    if operation is None:
+        raise HTTPException(status_code=404, detail="Operation not found")
+    return StreamingResponse(
+        stream_operation_events(
+            operation_events,
+            cluster_connector,
+            operation_id,
+            operation,
+            max_stream_seconds=get_operation_stream_max_seconds(),
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @app.post("/api/v1/users", status_code=status.HTTP_202_ACCEPTED)
 async def post_user(
     user_payload: dict[str, Any],
@@ -487,7 +731,8 @@ async def post_user(
         "user-create",
         {"username": user_payload.get("username")},
     )
-    asyncio.create_task(run_user_create(cluster_connector, operation_id, user_payload))
+    _schedule_operation(
+        _user_queue_key(user_payload["username"]), operation_id, run_user_create, cluster_connector, operation_id, user_payload)
     return {"operationId": operation_id, "status": "pending"}
 
 @app.delete("/api/v1/users/{user_id}", status_code=status.HTTP_202_ACCEPTED)
@@ -502,5 +747,5 @@ async def delete_user(
         "user-delete",
         {"username": user_id},
     )
-    asyncio.create_task(run_user_delete(cluster_connector, operation_id, user_id))
+    _schedule_operation(_user_queue_key(user_id), operation_id, run_user_delete, cluster_connector, operation_id, user_id)
     return {"operationId": operation_id, "status": "pending"}
\ No newline at end of file
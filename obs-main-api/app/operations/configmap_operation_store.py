@@ -0,0 +1,159 @@
+import json
+from typing import Any, Callable, Dict
+
+from kubernetes import client  # type: ignore
+from kubernetes.client.rest import ApiException  # type: ignore
+
+from validators import USERNAME_PATTERN
+
+
+OPERATION_CONFIGMAP_PREFIX = "obs-demo-fwk-op-"
+OPERATION_DATA_KEY = "operation"
+OPERATION_LABEL = "observability-demo-framework=operation"
+TYPE_LABEL = "obs-demo-fwk/operation-type"
+STATUS_LABEL = "obs-demo-fwk/operation-status"
+USER_LABEL = "obs-demo-fwk/operation-user"
+DEFAULT_MAX_UPDATE_ATTEMPTS = 5
+
+
+class OperationConflictError(RuntimeError):
+    pass
+
+
+class ConfigMapOperationStore:
+    """
+    Stores each operation in its own small labeled ConfigMap, so reading or
+    updating one operation never touches the others. Updates are
+    compare-and-swap on the ConfigMap resourceVersion and are retried on
+    conflict.
+
+    With an informer (a ResourceInformer over the operation ConfigMaps),
+    reads are served from memory and every write goes through to it, so a
+    status transition costs one API call.
+    """
+
+    def __init__(
+        self,
+        core_v1_api: client.CoreV1Api,
+        namespace: str,
+        max_update_attempts: int = DEFAULT_MAX_UPDATE_ATTEMPTS,
+        informer=None,
+    ):
+        self._core_v1_api = core_v1_api
+        self._namespace = namespace
+        self._max_update_attempts = max_update_attempts
+        self._informer = informer
+
+    @staticmethod
+    def configmap_name(operation_id: str) -> str:
+        return f"{OPERATION_CONFIGMAP_PREFIX}{operation_id}"
+
+    @staticmethod
+    def _labels(operation: Dict[str, Any]) -> Dict[str, str]:
+        labels = {
+            "observability-demo-framework": "operation",
+            TYPE_LABEL: operation["type"],
+            STATUS_LABEL: operation["status"],
+        }
+        metadata = operation.get("metadata") or {}
+        user = metadata.get("userId") or metadata.get("username")
+        if isinstance(user, str) and USERNAME_PATTERN.fullmatch(user):
+            labels[USER_LABEL] = user
+        return labels
+
+    def _body(self, operation: Dict[str, Any], resource_version: str | None = None) -> client.V1ConfigMap:
+        return client.V1ConfigMap(
+            metadata=client.V1ObjectMeta(
+                name=self.configmap_name(operation["id"]),
+                namespace=self._namespace,
+                labels=self._labels(operation),
+                resource_version=resource_version,
+            ),
+            data={OPERATION_DATA_KEY: json.dumps(operation)},
+        )
+
+    @staticmethod
+    def operation_from_configmap(configmap) -> Dict[str, Any] | None:
+        data = configmap.data or {}
+        if OPERATION_DATA_KEY not in data:
+            return None
+        return json.loads(data[OPERATION_DATA_KEY])
+
+    def create(self, operation: Dict[str, Any]):
+        created = self._core_v1_api.create_namespaced_config_map(self._namespace, self._body(operation))
+        if self._informer is not None:
+            self._informer.upsert(created)
+
+    def _read(self, operation_id: str, cached: bool = True):
+        if cached and self._informer is not None and self._informer.synced:
+            configmap = self._informer.get(self.configmap_name(operation_id))
+            if configmap is not None:
+                return configmap
+            # Possibly created by another replica and not watched yet.
+        try:
+            return self._core_v1_api.read_namespaced_config_map(
+                self.configmap_name(operation_id), self._namespace)
+        except ApiException as exc:
+            if exc.status == 404:
+                return None
+            raise
+
+    def get(self, operation_id: str) -> Dict[str, Any] | None:
+        configmap = self._read(operation_id)
+        if configmap is None:
+            return None
+        return self.operation_from_configmap(configmap)
+
+    def update(self, operation_id: str, mutate: Callable[[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Applies mutate(operation) and writes the result only if the operation
+        has not changed since it was read; otherwise it is re-read and
+        mutate is applied again.
+        """
+        cached = True
+        for _ in range(self._max_update_attempts):
+            configmap = self._read(operation_id, cached)
+            operation = None if configmap is None else self.operation_from_configmap(configmap)
+            if operation is None:
+                raise KeyError(f"Operation '{operation_id}' not found")
+            operation = mutate(operation)
+            try:
+                replaced = self._core_v1_api.replace_namespaced_config_map(
+                    self.configmap_name(operation_id),
+                    self._namespace,
+                    self._body(operation, configmap.metadata.resource_version),
+                )
+                if self._informer is not None:
+                    self._informer.upsert(replaced)
+                return operation
+            except ApiException as exc:
+                if exc.status != 409:
+                    raise
+                print(f"Conflict updating operation {operation_id}, retrying.")
+                # The cached copy is behind; read the latest from the API.
+                cached = False
+        raise OperationConflictError(
+            f"Could not update operation '{operation_id}' after {self._max_update_attempts} attempts"
+        )
+
+    def delete(self, operation_id: str):
+        try:
+            self._core_v1_api.delete_namespaced_config_map(self.configmap_name(operation_id), self._namespace)
+        except ApiException as exc:
+            if exc.status != 404:
+                raise
+        if self._informer is not None:
+            self._informer.remove(self.configmap_name(operation_id))
+
+    def list(self, label_selector: str | None = None) -> list[Dict[str, Any]]:
+        if not label_selector and self._informer is not None and self._informer.synced:
+            items = self._informer.list()
+        else:
+            selector = OPERATION_LABEL if not label_selector else f"{OPERATION_LABEL},{label_selector}"
+            items = self._core_v1_api.list_namespaced_config_map(self._namespace, label_selector=selector).items
+        operations = []
+        for configmap in items:
+            operation = self.operation_from_configmap(configmap)
+            if operation is not None:
+                operations.append(operation)
+        return operations
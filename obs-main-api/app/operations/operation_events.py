@@ -0,0 +1,105 @@
+import asyncio
+import json
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Set
+
+TERMINAL_STATUSES = frozenset({"succeeded", "failed"})
+DEFAULT_KEEPALIVE_SECONDS = 15.0
+DEFAULT_MAX_STREAM_SECONDS = 300.0
+SUBSCRIBER_QUEUE_SIZE = 64
+
+
+class OperationEventBroker:
+    """
+    Fans operation changes out to the streams watching them. publish() may be
+    called from any thread (operation tasks, informer watch threads); events
+    are handed to the subscribers' queues on the event loop bound with bind().
+    """
+
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    def bind(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+
+    def publish(self, operation: Dict[str, Any]):
+        operation_id = operation.get("id")
+        with self._lock:
+            queues = list(self._subscribers.get(operation_id, ()))
+        if not queues or self._loop is None or self._loop.is_closed():
+            return
+        for queue in queues:
+            self._loop.call_soon_threadsafe(self._offer, queue, operation)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, operation: Dict[str, Any]):
+        if queue.full():
+            # A slow client only needs the latest state.
+            queue.get_nowait()
+        queue.put_nowait(operation)
+
+    @contextmanager
+    def subscribe(self, operation_id: str) -> Iterator[asyncio.Queue]:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.setdefault(operation_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            with self._lock:
+                queues = self._subscribers.get(operation_id)
+                if queues is not None:
+                    queues.discard(queue)
+                    if not queues:
+                        del self._subscribers[operation_id]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "operations": len(self._subscribers),
+                "subscribers": sum(len(queues) for queues in self._subscribers.values()),
+            }
+
+
+def format_sse(operation: Dict[str, Any]) -> str:
+    return f"event: operation\ndata: {json.dumps(operation)}\n\n"
+
+
+async def stream_operation_events(
+    broker: OperationEventBroker,
+    cluster_connector,
+    operation_id: str,
+    initial: Dict[str, Any],
+    keepalive_seconds: float = DEFAULT_KEEPALIVE_SECONDS,
+    max_stream_seconds: float = DEFAULT_MAX_STREAM_SECONDS,
+):
+    """
+    Yields the operation as server-sent events: its current state, then each
+    change until it succeeds or fails. Comment lines keep idle connections
+    open through proxies. After 'max_stream_seconds' the stream ends without
+    a terminal state, and clients fall back to polling.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_stream_seconds
+    with broker.subscribe(operation_id) as queue:
+        # Re-read after subscribing so a change in between is not lost.
+        operation = await asyncio.to_thread(cluster_connector.get_operation, operation_id) or initial
+        last_update = operation.get("updatedAt")
+        yield format_sse(operation)
+        while operation.get("status") not in TERMINAL_STATUSES:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                yield ": stream time limit reached\n\n"
+                return
+            try:
+                operation = await asyncio.wait_for(queue.get(), timeout=min(keepalive_seconds, remaining))
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if operation.get("updatedAt") == last_update:
+                continue
+            last_update = operation.get("updatedAt")
+            yield format_sse(operation)
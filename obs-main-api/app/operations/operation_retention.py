@@ -0,0 +1,128 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List
+
+from operations.operation_store import utc_now_iso
+
+
+DEFAULT_OPERATION_MAX_AGE_SECONDS = 7 * 24 * 3600
+DEFAULT_OPERATION_MAX_PER_USER = 50
+DEFAULT_OPERATION_COMPACTION_INTERVAL_SECONDS = 600
+ACTIVE_STATUSES = frozenset({"pending", "running"})
+
+
+def _operation_user(operation: Dict[str, Any]) -> str:
+    metadata = operation.get("metadata") or {}
+    return metadata.get("userId") or metadata.get("username") or ""
+
+
+def _updated_at(operation: Dict[str, Any]) -> datetime:
+    try:
+        updated_at = datetime.fromisoformat(operation.get("updatedAt") or operation["createdAt"])
+    except (KeyError, TypeError, ValueError):
+        return datetime.min.replace(tzinfo=timezone.utc)
+    # Timestamps are written in UTC; older records may lack the offset.
+    return updated_at if updated_at.tzinfo else updated_at.replace(tzinfo=timezone.utc)
+
+
+class OperationRetentionPolicy:
+    """
+    Decides which finished operations can be dropped: those last updated more
+    than 'max_age_seconds' ago, and, per user, all but the newest
+    'max_per_user'. Pending and running operations are always kept.
+    A limit of 0 disables that rule.
+    """
+
+    def __init__(
+        self,
+        max_age_seconds: int = DEFAULT_OPERATION_MAX_AGE_SECONDS,
+        max_per_user: int = DEFAULT_OPERATION_MAX_PER_USER,
+    ):
+        self.max_age_seconds = max_age_seconds
+        self.max_per_user = max_per_user
+
+    def select_expired(self, operations: Iterable[Dict[str, Any]], now: datetime | None = None) -> List[str]:
+        now = now or datetime.now(timezone.utc)
+        expired: List[str] = []
+        by_user: Dict[str, List[Dict[str, Any]]] = {}
+        for operation in operations:
+            if operation.get("status") in ACTIVE_STATUSES:
+                continue
+            if self.max_age_seconds > 0 and (now - _updated_at(operation)).total_seconds() > self.max_age_seconds:
+                expired.append(operation["id"])
+            else:
+                by_user.setdefault(_operation_user(operation), []).append(operation)
+        if self.max_per_user > 0:
+            for user_operations in by_user.values():
+                user_operations.sort(key=_updated_at, reverse=True)
+                expired.extend(operation["id"] for operation in user_operations[self.max_per_user:])
+        return expired
+
+
+class OperationCompactor:
+    """
+    Background task that periodically asks the cluster connector to prune
+    the operations selected by the retention policy.
+    """
+
+    def __init__(
+        self,
+        cluster_connector,
+        policy: OperationRetentionPolicy,
+        interval_seconds: float = DEFAULT_OPERATION_COMPACTION_INTERVAL_SECONDS,
+    ):
+        self._cluster_connector = cluster_connector
+        self._policy = policy
+        self._interval_seconds = interval_seconds
+        self._task: asyncio.Task | None = None
+        self._runs = 0
+        self._pruned_total = 0
+        self._pruned_last_run = 0
+        self._last_run_at: str | None = None
+        self._last_error: str | None = None
+
+    async def compact(self) -> int:
+        try:
+            pruned = await asyncio.to_thread(self._cluster_connector.compact_operations, self._policy)
+            self._last_error = None
+        except Exception as exc:
+            print(f"WARNING[operations]: Operation compaction failed: {exc}")
+            self._last_error = str(exc)
+            pruned = 0
+        self._runs += 1
+        self._pruned_last_run = pruned
+        self._pruned_total += pruned
+        self._last_run_at = utc_now_iso()
+        if pruned:
+            print(f"... Pruned {pruned} operations.")
+        return pruned
+
+    async def __run(self):
+        while True:
+            await self.compact()
+            await asyncio.sleep(self._interval_seconds)
+
+    def start(self):
+        if self._task is None and self._interval_seconds > 0:
+            self._task = asyncio.create_task(self.__run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "maxAgeSeconds": self._policy.max_age_seconds,
+            "maxPerUser": self._policy.max_per_user,
+            "runs": self._runs,
+            "prunedTotal": self._pruned_total,
+            "prunedLastRun": self._pruned_last_run,
+            "lastRunAt": self._last_run_at,
+            "lastError": self._last_error,
+        }
@@ -0,0 +1,141 @@
+import asyncio
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Set, Tuple
+
+DEFAULT_OPERATION_WORKERS = 4
+DEFAULT_OPERATION_DRAIN_TIMEOUT_SECONDS = 30.0
+DEFAULT_POOL = "default"
+
+OperationJob = Tuple[str, Callable[..., Awaitable[Any]], tuple, str]
+
+
+class SchedulerClosedError(RuntimeError):
+    pass
+
+
+class OperationScheduler:
+    """
+    Runs operation tasks in the background with at most 'max_workers' of them
+    in flight. Tasks submitted under the same key (a user) run one after the
+    other in submission order, so two operations on the same simulation never
+    overlap. References to every running task are kept until it finishes.
+
+    'pools' adds named worker pools with their own limit, e.g. for bulk work
+    that must not take every default worker; a task runs in the pool it was
+    submitted to, still in its key's order.
+
+    Each task belongs to an operation id; drain() returns the operations whose
+    task was cancelled or never started, so they can be marked as failed.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_OPERATION_WORKERS, pools: Dict[str, int] | None = None):
+        self._max_workers = max(1, max_workers)
+        self._pool_sizes = {DEFAULT_POOL: self._max_workers}
+        for name, size in (pools or {}).items():
+            self._pool_sizes[name] = max(1, size)
+        self._semaphores = {name: asyncio.Semaphore(size) for name, size in self._pool_sizes.items()}
+        self._pool_running = {name: 0 for name in self._pool_sizes}
+        self._queues: Dict[str, Deque[OperationJob]] = {}
+        self._runners: Dict[str, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._closed = False
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._max_queued = 0
+        self._abandoned: List[str] = []
+
+    def submit(
+        self,
+        key: str,
+        operation_id: str,
+        function: Callable[..., Awaitable[Any]],
+        *args,
+        pool: str = DEFAULT_POOL,
+    ):
+        if self._closed:
+            raise SchedulerClosedError("The API is shutting down; operation not accepted")
+        if pool not in self._semaphores:
+            raise ValueError(f"Unknown worker pool '{pool}'")
+        queue = self._queues.setdefault(key, deque())
+        queue.append((operation_id, function, args, pool))
+        self._max_queued = max(self._max_queued, self.queued())
+        if key not in self._runners:
+            runner = asyncio.create_task(self.__run(key))
+            self._runners[key] = runner
+            self._tasks.add(runner)
+            runner.add_done_callback(self._tasks.discard)
+
+    async def __run(self, key: str):
+        queue = self._queues[key]
+        current = None
+        try:
+            while queue:
+                pool = queue[0][3]
+                async with self._semaphores[pool]:
+                    # Only this runner consumes the queue, so the job stays
+                    # counted as queued until a worker is free.
+                    current, function, args, _ = queue.popleft()
+                    self._running += 1
+                    self._pool_running[pool] += 1
+                    try:
+                        await function(*args)
+                        self._completed += 1
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as exc:
+                        self._failed += 1
+                        print(f"WARNING[operations]: Task {function.__name__} for {key} failed: {exc}")
+                    finally:
+                        self._running -= 1
+                        self._pool_running[pool] -= 1
+                    current = None
+        except asyncio.CancelledError:
+            # The job in progress, if any, and the ones behind it.
+            if current is not None:
+                self._abandoned.append(current)
+            self._abandoned.extend(operation_id for operation_id, _, _, _ in queue)
+            queue.clear()
+            raise
+        finally:
+            del self._runners[key]
+            if not queue:
+                del self._queues[key]
+
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    async def drain(self, timeout: float = DEFAULT_OPERATION_DRAIN_TIMEOUT_SECONDS) -> List[str]:
+        """
+        Stops accepting tasks and waits for the queued ones; cancels what is
+        left after 'timeout'. Returns the ids of the operations whose task was
+        cancelled or never ran.
+        """
+        self._closed = True
+        tasks = set(self._tasks)
+        if not tasks:
+            return []
+        print(f"... Draining {len(tasks)} operation queues ({self.queued()} queued, {self._running} running).")
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            print(f"WARNING[operations]: Cancelled {len(pending)} operation queues after {timeout}s.")
+            await asyncio.gather(*pending, return_exceptions=True)
+        # A bulk operation has one task per user: report it once.
+        return list(dict.fromkeys(self._abandoned))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "maxWorkers": self._max_workers,
+            "running": self._running,
+            "queued": self.queued(),
+            "maxQueued": self._max_queued,
+            "keys": len(self._queues),
+            "completed": self._completed,
+            "failed": self._failed,
+            "pools": {
+                name: {"maxWorkers": size, "running": self._pool_running[name]}
+                for name, size in self._pool_sizes.items()
+            },
+        }
@@ -19,3 +19,22 @@ def new_operation(operation_type: str, metadata: Optional[Dict[str, Any]] = None
         "createdAt": now,
         "updatedAt": now,
     }
+
+
+def apply_operation_update(
+    operation: Dict[str, Any],
+    status: Optional[str] = None,
+    error: Optional[str] = None,
+    result: Any = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    if status is not None:
+        operation["status"] = status
+    if error is not None:
+        operation["error"] = error
+    if result is not None:
+        operation["result"] = result
+    if metadata is not None:
+        operation["metadata"] = metadata
+    operation["updatedAt"] = utc_now_iso()
+    return operation
@@ -1,10 +1,18 @@
 import asyncio
 import inspect
-from typing import Any, Dict
+import threading
+import time
+from typing import Any, Dict, List
+
+PROGRESS_MIN_INTERVAL_SECONDS = 1.0
+DEFAULT_BULK_TEARDOWN_CONCURRENCY = 5
 
 
 async def _invoke_agent_delete_metrics(agent_manager, user_id: str):
-    result = agent_manager.delete_metrics_definitions(user_id)
+    if inspect.iscoroutinefunction(agent_manager.delete_metrics_definitions):
+        await agent_manager.delete_metrics_definitions(user_id)
+        return
+    result = await asyncio.to_thread(agent_manager.delete_metrics_definitions, user_id)
     if inspect.isawaitable(result):
         await result
 
@@ -16,24 +24,54 @@ def _set_running(cluster_connector, operation_id: str, message: str):
     cluster_connector.update_operation(operation_id, status="running", metadata=metadata)
 
 
+def _progress_reporter(cluster_connector, operation_id: str):
+    """
+    Returns a thread-safe progress(completed, total, message) callback that
+    records progress in the operation message, at most once per
+    PROGRESS_MIN_INTERVAL_SECONDS (the final step is always recorded).
+    """
+    lock = threading.Lock()
+    last_report = [0.0]
+
+    def report(completed: int, total: int, message: str):
+        with lock:
+            now = time.monotonic()
+            if completed < total and now - last_report[0] < PROGRESS_MIN_INTERVAL_SECONDS:
+                return
+            last_report[0] = now
+            try:
+                _set_running(cluster_connector, operation_id, f"{message} ({completed}/{total})")
+            except Exception as exc:
+                print(f"WARNING[operations]: Could not record progress of {operation_id}: {exc}")
+
+    return report
+
+
+def _without_user(username: str):
+    def mutate(users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [user for user in users if user.get("username") != username]
+    return mutate
+
+
+def _with_users(records: List[Dict[str, Any]]):
+    def mutate(users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        present = {user.get("username") for user in users}
+        return users + [record for record in records if record.get("username") not in present]
+    return mutate
+
+
 async def run_user_create(cluster_connector, operation_id: str, user_payload: Dict[str, Any]):
     username = user_payload.get("username")
     try:
         _set_running(cluster_connector, operation_id, "Updating user registry and syncing with Keycloak")
-        users = cluster_connector.get_users_json()
-        users.append(user_payload)
-        cluster_connector.update_users_json(users)
+        await asyncio.to_thread(cluster_connector.update_users, lambda users: users + [user_payload])
 
         success = await asyncio.to_thread(cluster_connector.sync_users)
         if success:
             cluster_connector.update_operation(operation_id, status="succeeded")
             return
 
-        users = [
-            user for user in cluster_connector.get_users_json()
-            if user.get("username") != username
-        ]
-        cluster_connector.update_users_json(users)
+        await asyncio.to_thread(cluster_connector.update_users, _without_user(username))
         cluster_connector.update_operation(
             operation_id,
             status="failed",
@@ -41,32 +79,34 @@ async def run_user_create(cluster_connector, operation_id: str, user_payload: Di
         )
     except Exception as exc:
         try:
-            users = [
-                user for user in cluster_connector.get_users_json()
-                if user.get("username") != username
-            ]
-            cluster_connector.update_users_json(users)
+            await asyncio.to_thread(cluster_connector.update_users, _without_user(username))
         except Exception:
             pass
         cluster_connector.update_operation(operation_id, status="failed", error=str(exc))
 
 
 async def run_user_delete(cluster_connector, operation_id: str, user_id: str):
-    previous_users = cluster_connector.get_users_json()
+    # User operations run on each user's own queue, so another user's create
+    # or delete may change the registry meanwhile: a failed delete adds back
+    # the removed records instead of restoring a snapshot.
+    removed_users: List[Dict[str, Any]] = []
+
+    def remove(users: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Recomputed on every compare-and-swap attempt.
+        removed_users[:] = [user for user in users if user.get("username") == user_id]
+        return _without_user(user_id)(users)
+
     try:
         _set_running(cluster_connector, operation_id, "Removing user and syncing with Keycloak")
-        new_users_list = [
-            user for user in previous_users
-            if user.get("username") != user_id
-        ]
-        cluster_connector.update_users_json(new_users_list)
+        await asyncio.to_thread(cluster_connector.update_users, remove)
 
         success = await asyncio.to_thread(cluster_connector.sync_users)
         if success:
+            await asyncio.to_thread(cluster_connector.release_user, user_id)
             cluster_connector.update_operation(operation_id, status="succeeded")
             return
 
-        cluster_connector.update_users_json(previous_users)
+        await asyncio.to_thread(cluster_connector.update_users, _with_users(removed_users))
         cluster_connector.update_operation(
             operation_id,
             status="failed",
@@ -74,7 +114,8 @@ async def run_user_delete(cluster_connector, operation_id: str, user_id: str):
         )
     except Exception as exc:
         try:
-            cluster_connector.update_users_json(previous_users)
+            if removed_users:
+                await asyncio.to_thread(cluster_connector.update_users, _with_users(removed_users))
         except Exception:
             pass
         cluster_connector.update_operation(operation_id, status="failed", error=str(exc))
@@ -93,6 +134,7 @@ async def run_simulation_create(
             user_id,
             payload["agents"],
             payload["user"]["monitoringType"],
+            _progress_reporter(cluster_connector, operation_id),
         )
         cluster_connector.save_simulation(user_id, payload)
         cluster_connector.update_operation(
@@ -112,3 +154,56 @@ async def run_simulation_delete(cluster_connector, operation_id: str, user_id: s
         cluster_connector.update_operation(operation_id, status="succeeded")
     except Exception as exc:
         cluster_connector.update_operation(operation_id, status="failed", error=str(exc))
+
+
+def bulk_simulation_delete(
+    cluster_connector,
+    operation_id: str,
+    user_ids: List[str],
+    agent_manager,
+):
+    """
+    Returns a teardown(user_id) task deleting one simulation of a bulk
+    operation. Each user's teardown is meant to be scheduled on that user's
+    queue, so it never overlaps a create or delete of the same simulation.
+    How many run at once is the scheduler's teardown pool size. Every user is
+    attempted, and the last teardown to finish completes the operation with the users
+    whose simulation was deleted and the error of each failure.
+    """
+    progress = _progress_reporter(cluster_connector, operation_id)
+    total = len(user_ids)
+    deleted: List[str] = []
+    failed: Dict[str, str] = {}
+    started = [False]
+
+    def complete():
+        result = {"deleted": sorted(deleted), "failed": failed}
+        try:
+            if failed:
+                cluster_connector.update_operation(
+                    operation_id,
+                    status="failed",
+                    result=result,
+                    error=f"Failed to delete {len(failed)} of {total} simulations: {', '.join(sorted(failed))}",
+                )
+            else:
+                cluster_connector.update_operation(operation_id, status="succeeded", result=result)
+        except Exception as exc:
+            print(f"WARNING[operations]: Could not complete {operation_id}: {exc}")
+
+    async def teardown(user_id: str):
+        try:
+            if not started[0]:
+                started[0] = True
+                _set_running(cluster_connector, operation_id, f"Deleting simulations (0/{total})")
+            await asyncio.to_thread(cluster_connector.delete_simulation, user_id)
+            await _invoke_agent_delete_metrics(agent_manager, user_id)
+            deleted.append(user_id)
+        except Exception as exc:
+            print(f"WARNING[operations]: Teardown of {user_id} failed: {exc}")
+            failed[user_id] = str(exc)
+        progress(len(deleted) + len(failed), total, "Deleting simulations")
+        if len(deleted) + len(failed) == total:
+            complete()
+
+    return teardown
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the alert-to-metric join done by GET /api/v1/users/{user_id}/simulation.
+
+Compares the previous nested-scan join with alert_index.attach_alerts_to_metrics
+on synthetic simulations and checks both produce the same result.
+
+Usage: python3 obs-main-api/scripts/bench-alert-join.py
+"""
+import copy
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "app")))
+
+from alert_index import attach_alerts_to_metrics  # noqa: E402
+
+METRICS_PER_AGENT = 10
+SIZES = [(25, 125), (50, 250), (100, 500), (200, 1000)]
+
+
+def nested_scan_join(agents, alerts):
+    """The join as it was written inline in get_simulation."""
+    for alert in alerts:
+        if alert["scope"] != "metricAgent":
+            continue
+        agent_matches = [agent for agent in agents if agent["id"] == alert["definition"]["agent"]]
+        agent = agent_matches[0] if agent_matches else None
+        if agent is None:
+            continue
+        metric_matches = [metric for metric in agent["metrics"] if metric["name"] == alert["definition"]["metric"]]
+        metric = metric_matches[0] if metric_matches else None
+        if metric is None:
+            continue
+        alert_matches_in_metric = [item for item in metric.get("alerts", []) if item["name"] == alert["name"]]
+        if not alert_matches_in_metric:
+            metric.setdefault("alerts", []).append(alert)
+
+
+def build_simulation(agent_count, alert_count):
+    agents = [
+        {
+            "id": f"agent-{a}",
+            "metrics": [{"name": f"metric_{m}", "value": m, "alerts": []} for m in range(METRICS_PER_AGENT)],
+        }
+        for a in range(agent_count)
+    ]
+    alerts = []
+    for i in range(alert_count):
+        agent_id = f"agent-{(i * 7) % agent_count}"
+        metric_name = f"metric_{i % METRICS_PER_AGENT}"
+        alerts.append({
+            "name": f"{agent_id}_{metric_name}_{i % 3}",
+            "scope": "metricAgent",
+            "definition": {"agent": agent_id, "metric": metric_name},
+        })
+    return agents, alerts
+
+
+def time_join(join, agents, alerts, number):
+    copies = [copy.deepcopy(agents) for _ in range(number)]
+    it = iter(copies)
+    return timeit.timeit(lambda: join(next(it), alerts), number=number) / number
+
+
+def main():
+    print(f"{'agents':>7} {'alerts':>7} {'nested scan (ms)':>17} {'indexed (ms)':>13} {'speedup':>8}")
+    for agent_count, alert_count in SIZES:
+        agents, alerts = build_simulation(agent_count, alert_count)
+
+        expected, actual = copy.deepcopy(agents), copy.deepcopy(agents)
+        nested_scan_join(expected, alerts)
+        attach_alerts_to_metrics(actual, alerts)
+        assert expected == actual, "indexed join differs from the nested scan"
+
+        nested = time_join(nested_scan_join, agents, alerts, number=20)
+        indexed = time_join(attach_alerts_to_metrics, agents, alerts, number=20)
+        print(f"{agent_count:>7} {alert_count:>7} {nested * 1000:>17.3f} {indexed * 1000:>13.3f} {nested / indexed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The API modules import each other from the app directory (e.g.
+# "from cluster_connector.X import X"), as they do when uvicorn runs there.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
@@ -0,0 +1,138 @@
+"""In-memory stand-in for the parts of CoreV1Api the stores use."""
+import copy
+import itertools
+import threading
+
+from kubernetes import client  # type: ignore
+from kubernetes.client.rest import ApiException  # type: ignore
+
+
+def _as_config_map(body):
+    if not isinstance(body, dict):
+        return body
+    metadata = body["metadata"]
+    return client.V1ConfigMap(
+        metadata=client.V1ObjectMeta(
+            name=metadata["name"],
+            namespace=metadata.get("namespace"),
+            labels=metadata.get("labels"),
+            resource_version=metadata.get("resourceVersion"),
+        ),
+        data=body.get("data"),
+    )
+
+
+class IdleWatch:
+    """A watch on which nothing happens until it is stopped."""
+
+    def __init__(self):
+        self._stopped = threading.Event()
+
+    def stream(self, list_function, **kwargs):
+        self._stopped.wait(kwargs.get("timeout_seconds") or 60)
+        return iter(())
+
+    def stop(self):
+        self._stopped.set()
+
+
+class FakeCoreV1Api:
+    def __init__(self):
+        self.config_maps = {}
+        self.secrets = {}
+        self.secret_reads = 0
+        self.pods = {}
+        self.pod_list_calls = 0
+        self.replace_calls = 0
+        self.list_calls = 0
+        # Called with (name, namespace) before each replace, e.g. to
+        # simulate a concurrent writer.
+        self.before_replace = None
+        self._versions = itertools.count(1)
+
+    def _stamp(self, body):
+        body = copy.deepcopy(body)
+        body.metadata.resource_version = str(next(self._versions))
+        return body
+
+    def create_namespaced_config_map(self, namespace, body):
+        body = _as_config_map(body)
+        key = (namespace, body.metadata.name)
+        if key in self.config_maps:
+            raise ApiException(status=409, reason="AlreadyExists")
+        self.config_maps[key] = self._stamp(body)
+        return copy.deepcopy(self.config_maps[key])
+
+    def read_namespaced_config_map(self, name, namespace):
+        if (namespace, name) not in self.config_maps:
+            raise ApiException(status=404, reason="NotFound")
+        return copy.deepcopy(self.config_maps[(namespace, name)])
+
+    def replace_namespaced_config_map(self, name, namespace, body):
+        body = _as_config_map(body)
+        self.replace_calls += 1
+        if self.before_replace is not None:
+            self.before_replace(name, namespace)
+        current = self.config_maps.get((namespace, name))
+        if current is None:
+            raise ApiException(status=404, reason="NotFound")
+        if body.metadata.resource_version not in (None, current.metadata.resource_version):
+            raise ApiException(status=409, reason="Conflict")
+        self.config_maps[(namespace, name)] = self._stamp(body)
+        return copy.deepcopy(self.config_maps[(namespace, name)])
+
+    def delete_namespaced_config_map(self, name, namespace):
+        if self.config_maps.pop((namespace, name), None) is None:
+            raise ApiException(status=404, reason="NotFound")
+
+    def list_namespaced_config_map(self, namespace, label_selector=None, **kwargs):
+        self.list_calls += 1
+        wanted = dict(term.split("=", 1) for term in label_selector.split(",")) if label_selector else {}
+        items = [
+            copy.deepcopy(config_map)
+            for (config_map_namespace, _), config_map in sorted(self.config_maps.items())
+            if config_map_namespace == namespace
+            and all((config_map.metadata.labels or {}).get(k) == v for k, v in wanted.items())
+        ]
+        return client.V1ConfigMapList(items=items, metadata=client.V1ListMeta(resource_version=str(next(self._versions))))
+
+    def create_namespaced_secret(self, namespace, body):
+        key = (namespace, body.metadata.name)
+        if key in self.secrets:
+            raise ApiException(status=409, reason="AlreadyExists")
+        self.secrets[key] = self._stamp(body)
+        return copy.deepcopy(self.secrets[key])
+
+    def replace_namespaced_secret(self, name, namespace, body):
+        if (namespace, name) not in self.secrets:
+            raise ApiException(status=404, reason="NotFound")
+        self.secrets[(namespace, name)] = self._stamp(body)
+        return copy.deepcopy(self.secrets[(namespace, name)])
+
+    def read_namespaced_secret(self, name, namespace):
+        self.secret_reads += 1
+        if (namespace, name) not in self.secrets:
+            raise ApiException(status=404, reason="NotFound")
+        return copy.deepcopy(self.secrets[(namespace, name)])
+
+    def list_namespaced_secret(self, namespace, label_selector=None, **kwargs):
+        self.list_calls += 1
+        items = [
+            copy.deepcopy(secret)
+            for (secret_namespace, _), secret in sorted(self.secrets.items())
+            if secret_namespace == namespace
+        ]
+        return client.V1SecretList(items=items, metadata=client.V1ListMeta(resource_version=str(next(self._versions))))
+
+    def list_namespaced_pod(self, namespace, label_selector=None, **kwargs):
+        self.pod_list_calls += 1
+        items = [
+            copy.deepcopy(pod)
+            for (pod_namespace, _), pod in sorted(self.pods.items())
+            if pod_namespace == namespace
+        ]
+        return client.V1PodList(items=items, metadata=client.V1ListMeta(resource_version=str(next(self._versions))))
+
+    def touch(self, name, namespace):
+        """Bumps the resourceVersion, as an update from another replica would."""
+        self.config_maps[(namespace, name)] = self._stamp(self.config_maps[(namespace, name)])
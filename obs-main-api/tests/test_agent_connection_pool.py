@@ -0,0 +1,113 @@
+import http.client
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from agent_manager.AgentConnectionPool import AgentConnectionPool
+
+
+class AgentHandler(BaseHTTPRequestHandler):
+    # Keep-alive responses, but the socket is dropped after each request
+    # without a "Connection: close" header, like an agent whose idle
+    # keep-alive timer fired between two calls.
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._answer()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._answer()
+
+    def _answer(self):
+        self.server.requests.append(self.command)
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.close_connection = self.server.drop_after_response
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def agent():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AgentHandler)
+    server.requests = []
+    server.drop_after_response = True
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def pool_for(agent):
+    return AgentConnectionPool(port=agent.server_address[1], idle_timeout_seconds=30)
+
+
+def test_reuses_keep_alive_connections(agent):
+    agent.drop_after_response = False
+    pool = pool_for(agent)
+
+    pool.request("127.0.0.1", "GET", "/metrics")
+    first = pool._idle["127.0.0.1"][-1][0]
+    pool.request("127.0.0.1", "GET", "/metrics")
+
+    assert pool._idle["127.0.0.1"][-1][0] is first
+    assert agent.requests == ["GET", "GET"]
+    pool.close()
+
+
+def test_get_on_a_stale_socket_is_retried(agent):
+    pool = pool_for(agent)
+    pool.request("127.0.0.1", "GET", "/metrics")
+    time.sleep(0.05)
+
+    status, data = pool.request("127.0.0.1", "GET", "/metrics")
+
+    assert (status, data) == (200, b"[]")
+    assert agent.requests == ["GET", "GET"]
+    pool.close()
+
+
+def test_post_on_a_stale_socket_is_not_retried(agent):
+    pool = pool_for(agent)
+    pool.request("127.0.0.1", "POST", "/operations/order")
+    time.sleep(0.05)
+
+    # Without a body the request goes out in one write that succeeds, so the
+    # agent may have acted on it before the socket failed.
+    with pytest.raises((http.client.RemoteDisconnected, ConnectionResetError)):
+        pool.request("127.0.0.1", "POST", "/operations/order")
+
+    assert agent.requests == ["POST"]
+    pool.close()
+
+
+def test_host_slots_are_pruned_once_the_host_is_idle(agent):
+    agent.drop_after_response = False
+    pool = AgentConnectionPool(port=agent.server_address[1], idle_timeout_seconds=0)
+
+    pool.request("127.0.0.1", "GET", "/metrics")
+    assert "127.0.0.1" in pool._host_slots
+    time.sleep(0.01)
+    pool.evict_idle()
+
+    assert pool._host_slots == {}
+    assert pool._host_users == {}
+    assert pool._idle == {}
+
+
+def test_host_slot_is_released_when_the_request_fails():
+    pool = AgentConnectionPool(port=1)
+
+    with pytest.raises(OSError):
+        pool.request("127.0.0.1", "GET", "/metrics")
+
+    assert pool._host_slots == {}
+    assert pool._host_users == {}
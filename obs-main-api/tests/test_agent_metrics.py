@@ -0,0 +1,86 @@
+import asyncio
+
+from agent_metrics import collect_agent_metrics
+
+
+def run(agents, fetch, concurrency=4, deadline_seconds=1.0):
+    asyncio.run(collect_agent_metrics(agents, fetch, concurrency, deadline_seconds))
+    return {agent["id"]: agent for agent in agents}
+
+
+def test_stores_metrics_with_empty_alert_lists():
+    async def fetch(semaphore, item):
+        return [{"name": f"{item['id']}_requests"}]
+
+    agents = run([{"id": "a"}, {"id": "b"}], fetch)
+
+    assert agents["a"]["metrics"] == [{"name": "a_requests", "alerts": []}]
+    assert agents["b"]["metrics"] == [{"name": "b_requests", "alerts": []}]
+    assert "metricsError" not in agents["a"]
+
+
+def test_failed_agent_is_marked_and_others_are_kept():
+    async def fetch(semaphore, item):
+        if item["id"] == "broken":
+            raise RuntimeError("connection refused")
+        return [{"name": "ok"}]
+
+    agents = run([{"id": "ok"}, {"id": "broken"}], fetch)
+
+    assert agents["ok"]["metrics"] == [{"name": "ok", "alerts": []}]
+    assert agents["broken"]["metrics"] == []
+    assert agents["broken"]["metricsError"] == "connection refused"
+
+
+def test_error_without_message_uses_the_exception_type():
+    async def fetch(semaphore, item):
+        raise TimeoutError()
+
+    agents = run([{"id": "a"}], fetch)
+
+    assert agents["a"]["metricsError"] == "TimeoutError"
+
+
+def test_deadline_returns_partial_results():
+    cancelled = []
+
+    async def fetch(semaphore, item):
+        if item["id"] == "slow":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(item["id"])
+                raise
+        return [{"name": item["id"]}]
+
+    agents = run([{"id": "fast"}, {"id": "slow"}], fetch, deadline_seconds=0.05)
+
+    assert agents["fast"]["metrics"] == [{"name": "fast", "alerts": []}]
+    assert agents["slow"]["metrics"] == []
+    assert agents["slow"]["metricsError"] == "Timed out fetching agent metrics"
+    assert cancelled == ["slow"]
+
+
+def test_concurrency_is_bounded_by_the_semaphore():
+    running = 0
+    peak = 0
+
+    async def fetch(semaphore, item):
+        nonlocal running, peak
+        async with semaphore:
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+        return []
+
+    run([{"id": str(i)} for i in range(8)], fetch, concurrency=2)
+
+    assert peak == 2
+
+
+def test_no_agents_is_a_no_op():
+    async def fetch(semaphore, item):
+        raise AssertionError("no agent to fetch")
+
+    assert run([], fetch) == {}
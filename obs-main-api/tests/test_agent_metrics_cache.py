@@ -0,0 +1,102 @@
+import asyncio
+
+from agent_manager.AgentMetricsCache import AgentMetricsCache
+
+
+class Scrapes:
+    def __init__(self):
+        self.calls = 0
+        self.release = None
+
+    async def load(self):
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        return [{"name": "requests", "value": self.calls}]
+
+
+def test_concurrent_gets_share_one_scrape():
+    async def scenario():
+        cache = AgentMetricsCache(ttl_seconds=10)
+        scrapes = Scrapes()
+        scrapes.release = asyncio.Event()
+        waiters = [asyncio.create_task(cache.get("user", "a", scrapes.load)) for _ in range(5)]
+        await asyncio.sleep(0)
+        scrapes.release.set()
+        return cache, scrapes, await asyncio.gather(*waiters)
+
+    cache, scrapes, results = asyncio.run(scenario())
+
+    assert scrapes.calls == 1
+    assert all(result == [{"name": "requests", "value": 1}] for result in results)
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_results_are_reused_within_the_ttl():
+    async def scenario():
+        cache = AgentMetricsCache(ttl_seconds=10)
+        scrapes = Scrapes()
+        await cache.get("user", "a", scrapes.load)
+        await cache.get("user", "a", scrapes.load)
+        return cache, scrapes
+
+    cache, scrapes = asyncio.run(scenario())
+
+    assert scrapes.calls == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_zero_ttl_only_coalesces():
+    async def scenario():
+        cache = AgentMetricsCache(ttl_seconds=0)
+        scrapes = Scrapes()
+        await cache.get("user", "a", scrapes.load)
+        await cache.get("user", "a", scrapes.load)
+        return scrapes
+
+    assert asyncio.run(scenario()).calls == 2
+
+
+def test_invalidate_detaches_the_scrape_in_flight():
+    async def scenario():
+        cache = AgentMetricsCache(ttl_seconds=10)
+        scrapes = Scrapes()
+        scrapes.release = asyncio.Event()
+        stale = asyncio.create_task(cache.get("user", "a", scrapes.load))
+        await asyncio.sleep(0)
+        cache.invalidate("user", "a")
+        scrapes.release.set()
+        await stale
+        # The stale scrape must neither be cached nor shared after invalidate().
+        fresh = await cache.get("user", "a", scrapes.load)
+        return scrapes, fresh
+
+    scrapes, fresh = asyncio.run(scenario())
+
+    assert scrapes.calls == 2
+    assert fresh == [{"name": "requests", "value": 2}]
+
+
+def test_invalidate_without_agent_drops_every_agent_of_the_user():
+    async def scenario():
+        cache = AgentMetricsCache(ttl_seconds=10)
+        scrapes = Scrapes()
+        for agent_id in ("a", "b"):
+            await cache.get("user", agent_id, scrapes.load)
+        await cache.get("other", "a", scrapes.load)
+        cache.invalidate("user")
+        return cache
+
+    assert asyncio.run(scenario()).stats()["size"] == 1
+
+
+def test_callers_get_their_own_copy():
+    async def scenario():
+        cache = AgentMetricsCache(ttl_seconds=10)
+        scrapes = Scrapes()
+        first = await cache.get("user", "a", scrapes.load)
+        first[0]["alerts"] = ["decorated"]
+        return await cache.get("user", "a", scrapes.load)
+
+    assert "alerts" not in asyncio.run(scenario())[0]
@@ -0,0 +1,106 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from kubernetes import client  # type: ignore
+
+from cluster_connector.AgentPodIndex import AgentPod, AgentPodIndex, _rank
+from fake_kubernetes import FakeCoreV1Api, IdleWatch
+
+
+CREATED = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def pod(name, app="agent-a", minutes=0, ready=True, phase="Running", deleting=False):
+    return client.V1Pod(
+        metadata=client.V1ObjectMeta(
+            name=name,
+            labels={"app": app, "observability-demo-framework": "agent"},
+            creation_timestamp=CREATED + timedelta(minutes=minutes),
+            deletion_timestamp=CREATED if deleting else None,
+        ),
+        status=client.V1PodStatus(
+            phase=phase,
+            conditions=[client.V1PodCondition(type="Ready", status="True" if ready else "False")],
+        ),
+    )
+
+
+def add_pods(api, namespace, *pods):
+    for item in pods:
+        api.pods[(namespace, item.metadata.name)] = item
+
+
+def test_rank_prefers_pods_not_being_deleted():
+    deleting = pod("a-1", minutes=5, deleting=True)
+    kept = pod("a-2", ready=False)
+
+    assert max([deleting, kept], key=_rank) is kept
+
+
+def test_rank_prefers_ready_pods_then_the_newest():
+    old_ready = pod("a-1")
+    new_starting = pod("a-2", minutes=5, ready=False, phase="Pending")
+    new_ready = pod("a-3", minutes=3)
+
+    assert max([old_ready, new_starting], key=_rank) is old_ready
+    assert max([old_ready, new_starting, new_ready], key=_rank) is new_ready
+
+
+def test_rank_handles_pods_without_creation_timestamp():
+    unknown = pod("a-1")
+    unknown.metadata.creation_timestamp = None
+
+    assert max([unknown, pod("a-2")], key=_rank).metadata.name == "a-2"
+
+
+def test_pods_are_served_from_the_watched_index():
+    api = FakeCoreV1Api()
+    add_pods(api, "ns-a", pod("a-1"), pod("a-2", minutes=1, deleting=True), pod("b-1", app="agent-b", phase="Pending"))
+    index = AgentPodIndex(api, sync_timeout_seconds=2, watch_factory=IdleWatch)
+
+    first = index.pods("ns-a")
+    second = index.pods("ns-a")
+    index.close()
+
+    assert first == {"agent-a": AgentPod("a-1", "Running"), "agent-b": AgentPod("b-1", "Pending")}
+    assert second == first
+    assert api.pod_list_calls == 1
+
+
+def test_unsynced_index_falls_back_to_one_list():
+    release = threading.Event()
+
+    class SlowListApi(FakeCoreV1Api):
+        def list_namespaced_pod(self, namespace, label_selector=None, **kwargs):
+            if self.pod_list_calls == 0:
+                # The informer's initial list hangs.
+                self.pod_list_calls += 1
+                release.wait(5)
+            return super().list_namespaced_pod(namespace, label_selector=label_selector, **kwargs)
+
+    api = SlowListApi()
+    add_pods(api, "ns-a", pod("a-1"), pod("a-2", minutes=1, ready=False))
+    index = AgentPodIndex(api, sync_timeout_seconds=0.1, watch_factory=IdleWatch)
+
+    pods = index.pods("ns-a")
+    release.set()
+    index.close()
+
+    assert pods == {"agent-a": AgentPod("a-1", "Running")}
+
+
+def test_evicted_namespace_is_listed_again():
+    api = FakeCoreV1Api()
+    add_pods(api, "ns-a", pod("a-1"))
+    index = AgentPodIndex(api, sync_timeout_seconds=2, watch_factory=IdleWatch, max_namespaces=1)
+
+    index.pods("ns-a")
+    index.pods("ns-b")
+    # Let a late event of the stopped ns-a informer arrive, if any.
+    time.sleep(0.05)
+    pods = index.pods("ns-a")
+    index.close()
+
+    assert pods == {"agent-a": AgentPod("a-1", "Running")}
+    assert api.pod_list_calls == 3
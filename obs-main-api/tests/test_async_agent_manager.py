@@ -0,0 +1,51 @@
+import asyncio
+
+import httpx  # type: ignore
+import pytest
+
+from agent_manager.AsyncOpenShiftAgentManager import AsyncOpenShiftAgentManager
+from agent_manager.OpenShiftAgentManager import AgentRequestError
+
+
+def manager_answering(handler):
+    manager = AsyncOpenShiftAgentManager()
+    asyncio.run(manager.aclose())
+    manager._AsyncOpenShiftAgentManager__client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return manager
+
+
+def test_get_agent_metrics_returns_the_decoded_list():
+    manager = manager_answering(lambda request: httpx.Response(200, json=[{"name": "requests"}]))
+
+    assert asyncio.run(manager.get_agent_metrics("user", "10.0.0.1")) == [{"name": "requests"}]
+
+
+def test_get_agent_metrics_error_status_raises_agent_request_error():
+    manager = manager_answering(lambda request: httpx.Response(503, text="starting"))
+
+    with pytest.raises(AgentRequestError) as error:
+        asyncio.run(manager.get_agent_metrics("user", "10.0.0.1"))
+
+    assert error.value.status == 503
+    assert error.value.message == "starting"
+
+
+def test_kick_error_status_raises_agent_request_error():
+    manager = manager_answering(lambda request: httpx.Response(500, text="boom"))
+
+    with pytest.raises(AgentRequestError):
+        asyncio.run(manager.kick("user", "agent", "10.0.0.1", 1))
+
+
+def test_set_agent_communication_path_posts_the_next_hop():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(201)
+
+    manager = manager_answering(handler)
+    asyncio.run(manager.set_agent_communication_path("user", "10.0.0.1", "10.0.0.2"))
+
+    assert requests[0].method == "POST"
+    assert str(requests[0].url) == "http://10.0.0.1:8080/agents/10.0.0.2"
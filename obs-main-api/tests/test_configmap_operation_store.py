@@ -0,0 +1,84 @@
+import pytest
+
+from operations.configmap_operation_store import ConfigMapOperationStore, OperationConflictError
+from fake_kubernetes import FakeCoreV1Api
+
+
+def operation(operation_id="op1", **fields):
+    return {"id": operation_id, "type": "simulation-create", "status": "pending",
+            "metadata": {"userId": "alice"}, **fields}
+
+
+def test_create_get_and_labels():
+    api = FakeCoreV1Api()
+    store = ConfigMapOperationStore(api, "api")
+
+    store.create(operation())
+
+    assert store.get("op1")["status"] == "pending"
+    labels = api.config_maps[("api", "obs-demo-fwk-op-op1")].metadata.labels
+    assert labels["obs-demo-fwk/operation-user"] == "alice"
+    assert labels["obs-demo-fwk/operation-status"] == "pending"
+    assert store.get("missing") is None
+
+
+def test_update_retries_on_conflict_and_reapplies_the_mutation():
+    api = FakeCoreV1Api()
+    store = ConfigMapOperationStore(api, "api")
+    store.create(operation(progress=[]))
+    writes = []
+
+    def concurrent_writer(name, namespace):
+        # Another replica appends its own progress between our read and write.
+        if api.replace_calls == 1:
+            config_map = api.config_maps[(namespace, name)]
+            config_map.data["operation"] = config_map.data["operation"].replace('"progress": []', '"progress": ["other"]')
+            api.touch(name, namespace)
+
+    api.before_replace = concurrent_writer
+
+    def mutate(current):
+        writes.append(list(current["progress"]))
+        current["progress"].append("ours")
+        current["status"] = "running"
+        return current
+
+    updated = store.update("op1", mutate)
+
+    assert writes == [[], ["other"]]
+    assert updated["progress"] == ["other", "ours"]
+    assert store.get("op1")["progress"] == ["other", "ours"]
+    assert api.config_maps[("api", "obs-demo-fwk-op-op1")].metadata.labels["obs-demo-fwk/operation-status"] == "running"
+
+
+def test_update_gives_up_after_max_attempts():
+    api = FakeCoreV1Api()
+    store = ConfigMapOperationStore(api, "api", max_update_attempts=3)
+    store.create(operation())
+    api.before_replace = api.touch
+
+    with pytest.raises(OperationConflictError):
+        store.update("op1", lambda current: current)
+
+    assert api.replace_calls == 3
+
+
+def test_update_of_a_missing_operation_raises_key_error():
+    store = ConfigMapOperationStore(FakeCoreV1Api(), "api")
+
+    with pytest.raises(KeyError):
+        store.update("missing", lambda current: current)
+
+
+def test_list_filters_by_label_and_delete_ignores_missing():
+    api = FakeCoreV1Api()
+    store = ConfigMapOperationStore(api, "api")
+    store.create(operation("op1"))
+    store.create(operation("op2", status="completed"))
+
+    completed = store.list("obs-demo-fwk/operation-status=completed")
+    store.delete("op1")
+    store.delete("op1")
+
+    assert [item["id"] for item in completed] == ["op2"]
+    assert [item["id"] for item in store.list()] == ["op2"]
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from cluster_connector.JsonConfigMapStore import ConfigMapConflictError, JsonConfigMapStore
+from fake_kubernetes import FakeCoreV1Api, IdleWatch
+
+
+def store_for(api, **kwargs):
+    return JsonConfigMapStore(api, sync_timeout_seconds=2, watch_factory=IdleWatch, **kwargs)
+
+
+def test_read_is_served_from_the_namespace_informer():
+    api = FakeCoreV1Api()
+    store = store_for(api)
+    store.update("alerts", "alerts", "ns-a", lambda alerts: alerts + [{"id": "a1"}], default=[])
+
+    first = store.read("alerts", "alerts", "ns-a", default=[])
+    first.append({"id": "mutated"})
+    second = store.read("alerts", "alerts", "ns-a", default=[])
+    store.close()
+
+    assert second == [{"id": "a1"}]
+    assert api.list_calls == 1
+
+
+def test_informers_are_bounded_per_namespace():
+    api = FakeCoreV1Api()
+    store = store_for(api, max_namespaces=2)
+
+    for namespace in ("ns-a", "ns-b", "ns-c"):
+        store.read("alerts", "alerts", namespace, default=[])
+    stats = store.stats()
+    store.close()
+
+    assert stats["namespaces"] == 2
+    assert stats["evicted"] == 1
+
+
+def test_missing_config_map_reads_as_the_default():
+    store = store_for(FakeCoreV1Api())
+
+    assert store.read("alerts", "alerts", "ns-a", default=[]) == []
+    store.close()
+
+
+def test_update_retries_a_conflict_against_a_fresh_read():
+    api = FakeCoreV1Api()
+    store = store_for(api)
+    store.update("users", "users", "api", lambda users: users + [{"username": "alice"}], default=[])
+
+    def concurrent_writer(name, namespace):
+        # Another replica adds bob between our read and our write.
+        if api.replace_calls == 1:
+            config_map = api.config_maps[(namespace, name)]
+            config_map.data["users"] = json.dumps([{"username": "alice"}, {"username": "bob"}])
+            api.touch(name, namespace)
+
+    api.before_replace = concurrent_writer
+    seen = []
+
+    def add_carol(users):
+        seen.append([user["username"] for user in users])
+        return users + [{"username": "carol"}]
+
+    written = store.update("users", "users", "api", add_carol, default=[])
+    store.close()
+
+    assert seen == [["alice"], ["alice", "bob"]]
+    assert [user["username"] for user in written] == ["alice", "bob", "carol"]
+    stored = json.loads(api.config_maps[("api", "users")].data["users"])
+    assert [user["username"] for user in stored] == ["alice", "bob", "carol"]
+
+
+def test_update_gives_up_after_max_attempts():
+    api = FakeCoreV1Api()
+    store = store_for(api, max_update_attempts=2)
+    store.update("users", "users", "api", lambda users: users + [{"username": "alice"}], default=[])
+    api.before_replace = api.touch
+
+    with pytest.raises(ConfigMapConflictError):
+        store.update("users", "users", "api", lambda users: users, default=[])
+    store.close()
+
+    assert api.replace_calls == 2
+
+
+def test_update_keeps_the_other_keys_of_the_config_map():
+    api = FakeCoreV1Api()
+    store = store_for(api)
+    store.update("storage", "alerts", "ns-a", lambda alerts: ["a1"], default=[])
+    store.update("storage", "notes", "ns-a", lambda notes: {"n": 1}, default={})
+    store.close()
+
+    assert set(api.config_maps[("ns-a", "storage")].data) == {"alerts", "notes"}
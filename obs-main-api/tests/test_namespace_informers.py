@@ -0,0 +1,103 @@
+from cluster_connector.NamespaceInformers import NamespaceInformers
+
+
+class FakeInformer:
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self.started = False
+        self.stopped = False
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.stopped = True
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def informers(max_namespaces=3, idle_seconds=100.0):
+    clock = Clock()
+    evicted = []
+    pool = NamespaceInformers(
+        FakeInformer,
+        max_namespaces=max_namespaces,
+        idle_seconds=idle_seconds,
+        on_evict=lambda namespace, informer: evicted.append(namespace),
+        clock=clock,
+    )
+    return pool, clock, evicted
+
+
+def test_creates_and_starts_one_informer_per_namespace():
+    pool, _, _ = informers()
+
+    first = pool.get("ns-a")
+
+    assert first.started
+    assert pool.get("ns-a") is first
+    assert pool.peek("ns-b") is None
+    assert pool.stats()["created"] == 1
+
+
+def test_least_recently_used_namespace_is_evicted_to_make_room():
+    pool, clock, evicted = informers(max_namespaces=2)
+    a = pool.get("ns-a")
+    clock.now = 1
+    b = pool.get("ns-b")
+    clock.now = 2
+    pool.get("ns-a")
+    clock.now = 3
+
+    pool.get("ns-c")
+
+    assert evicted == ["ns-b"]
+    assert b.stopped and not a.stopped
+    assert pool.peek("ns-b") is None
+    assert pool.stats()["namespaces"] == 2
+
+
+def test_idle_namespaces_are_stopped_on_the_next_access():
+    pool, clock, evicted = informers(idle_seconds=10)
+    idle = pool.get("ns-a")
+    clock.now = 5
+    pool.get("ns-b")
+    clock.now = 12
+
+    pool.get("ns-b")
+
+    assert evicted == ["ns-a"]
+    assert idle.stopped
+    assert pool.get("ns-a") is not idle
+
+
+def test_peek_does_not_refresh_the_idle_timer():
+    pool, clock, evicted = informers(idle_seconds=10)
+    pool.get("ns-a")
+    clock.now = 8
+    pool.peek("ns-a")
+    clock.now = 11
+
+    pool.get("ns-b")
+
+    assert evicted == ["ns-a"]
+
+
+def test_evict_and_close_stop_informers():
+    pool, _, evicted = informers()
+    a = pool.get("ns-a")
+    b = pool.get("ns-b")
+
+    pool.evict("ns-a")
+    pool.evict("ns-missing")
+    pool.close()
+
+    assert a.stopped and b.stopped
+    assert evicted == ["ns-a", "ns-b"]
+    assert pool.stats()["namespaces"] == 0
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import threading
+
+from operations.operation_events import OperationEventBroker, SUBSCRIBER_QUEUE_SIZE, stream_operation_events
+
+
+def operation(status, updated_at, operation_id="op1"):
+    return {"id": operation_id, "status": status, "updatedAt": updated_at}
+
+
+class FakeConnector:
+    def __init__(self, current):
+        self.current = current
+
+    def get_operation(self, operation_id):
+        return self.current
+
+
+def test_publish_reaches_subscribers_of_that_operation_only():
+    async def scenario():
+        broker = OperationEventBroker()
+        broker.bind(asyncio.get_running_loop())
+        with broker.subscribe("op1") as first, broker.subscribe("op1") as second, broker.subscribe("op2") as other:
+            # Published from a worker thread, as operation tasks do.
+            thread = threading.Thread(target=broker.publish, args=(operation("running", "t1"),))
+            thread.start()
+            thread.join()
+            received = [await asyncio.wait_for(queue.get(), 1) for queue in (first, second)]
+            return received, other.qsize()
+
+    received, other_size = asyncio.run(scenario())
+
+    assert [event["status"] for event in received] == ["running", "running"]
+    assert other_size == 0
+
+
+def test_full_queue_keeps_the_latest_state():
+    async def scenario():
+        broker = OperationEventBroker()
+        broker.bind(asyncio.get_running_loop())
+        with broker.subscribe("op1") as queue:
+            for index in range(SUBSCRIBER_QUEUE_SIZE + 3):
+                broker.publish(operation("running", f"t{index}"))
+            await asyncio.sleep(0)
+            events = [queue.get_nowait() for _ in range(queue.qsize())]
+        return events
+
+    events = asyncio.run(scenario())
+
+    assert len(events) == SUBSCRIBER_QUEUE_SIZE
+    assert events[-1]["updatedAt"] == f"t{SUBSCRIBER_QUEUE_SIZE + 2}"
+
+
+def test_unsubscribe_cleans_up_and_publish_without_loop_is_a_no_op():
+    broker = OperationEventBroker()
+    broker.publish(operation("running", "t1"))
+
+    async def scenario():
+        broker.bind(asyncio.get_running_loop())
+        with broker.subscribe("op1"):
+            assert broker.stats() == {"operations": 1, "subscribers": 1}
+        return broker.stats()
+
+    assert asyncio.run(scenario()) == {"operations": 0, "subscribers": 0}
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+def data(chunk):
+    return json.loads(chunk.split("data: ", 1)[1])
+
+
+def test_stream_sends_changes_until_a_terminal_status():
+    async def scenario():
+        broker = OperationEventBroker()
+        broker.bind(asyncio.get_running_loop())
+        connector = FakeConnector(operation("pending", "t0"))
+        stream = asyncio.ensure_future(collect(stream_operation_events(
+            broker, connector, "op1", operation("pending", "t0"), keepalive_seconds=5, max_stream_seconds=5)))
+        await asyncio.sleep(0.05)
+        broker.publish(operation("running", "t1"))
+        broker.publish(operation("running", "t1"))
+        broker.publish(operation("succeeded", "t2"))
+        return await asyncio.wait_for(stream, 2)
+
+    chunks = asyncio.run(scenario())
+
+    assert [data(chunk)["status"] for chunk in chunks] == ["pending", "running", "succeeded"]
+
+
+def test_stream_sends_keep_alives_and_ends_at_the_time_limit():
+    async def scenario():
+        broker = OperationEventBroker()
+        broker.bind(asyncio.get_running_loop())
+        connector = FakeConnector(None)
+        return await collect(stream_operation_events(
+            broker, connector, "op1", operation("running", "t0"), keepalive_seconds=0.02, max_stream_seconds=0.1))
+
+    chunks = asyncio.run(scenario())
+
+    assert data(chunks[0])["status"] == "running"
+    assert ": keep-alive\n\n" in chunks
+    assert chunks[-1] == ": stream time limit reached\n\n"
+
+
+def test_stream_of_a_finished_operation_sends_one_event():
+    async def scenario():
+        broker = OperationEventBroker()
+        broker.bind(asyncio.get_running_loop())
+        connector = FakeConnector(operation("failed", "t3"))
+        return await collect(stream_operation_events(broker, connector, "op1", operation("running", "t0")))
+
+    chunks = asyncio.run(scenario())
+
+    assert len(chunks) == 1
+    assert data(chunks[0])["status"] == "failed"
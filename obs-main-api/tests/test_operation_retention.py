@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, timezone
+
+from operations.operation_retention import OperationRetentionPolicy
+
+
+NOW = datetime(2025, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def operation(operation_id, age_seconds, status="completed", user="alice"):
+    updated_at = (NOW - timedelta(seconds=age_seconds)).isoformat()
+    return {"id": operation_id, "status": status, "createdAt": updated_at, "updatedAt": updated_at,
+            "metadata": {"userId": user}}
+
+
+def test_expires_finished_operations_older_than_max_age():
+    policy = OperationRetentionPolicy(max_age_seconds=3600, max_per_user=0)
+    operations = [operation("old", 7200), operation("recent", 60)]
+
+    assert policy.select_expired(operations, now=NOW) == ["old"]
+
+
+def test_active_operations_are_always_kept():
+    policy = OperationRetentionPolicy(max_age_seconds=3600, max_per_user=1)
+    operations = [operation("pending", 7200, status="pending"), operation("running", 7200, status="running"),
+                  operation("a", 10), operation("b", 20)]
+
+    assert policy.select_expired(operations, now=NOW) == ["b"]
+
+
+def test_keeps_the_newest_operations_per_user():
+    policy = OperationRetentionPolicy(max_age_seconds=0, max_per_user=2)
+    operations = [operation("a1", 30), operation("a2", 10), operation("a3", 20),
+                  operation("b1", 50, user="bob"), operation("b2", 40, user="bob")]
+
+    assert policy.select_expired(operations, now=NOW) == ["a1"]
+
+
+def test_unparseable_timestamps_count_as_oldest():
+    policy = OperationRetentionPolicy(max_age_seconds=3600, max_per_user=0)
+    broken = {"id": "broken", "status": "failed", "updatedAt": "yesterday"}
+
+    assert policy.select_expired([broken], now=NOW) == ["broken"]
+
+
+def test_timestamps_without_offset_are_read_as_utc():
+    policy = OperationRetentionPolicy(max_age_seconds=3600, max_per_user=1)
+    naive = operation("naive", 60)
+    naive["updatedAt"] = (NOW - timedelta(seconds=60)).replace(tzinfo=None).isoformat()
+
+    assert policy.select_expired([naive, operation("aware", 30)], now=NOW) == ["naive"]
+
+
+def test_zero_limits_disable_pruning():
+    policy = OperationRetentionPolicy(max_age_seconds=0, max_per_user=0)
+
+    assert policy.select_expired([operation("a", 10**9)], now=NOW) == []
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from operations.operation_scheduler import OperationScheduler, SchedulerClosedError
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+        self.running = 0
+        self.peak = 0
+
+    async def job(self, name, delay=0.01):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        self.events.append(("start", name))
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.running -= 1
+        self.events.append(("end", name))
+
+
+def test_jobs_of_a_key_run_in_submission_order_without_overlap():
+    async def scenario():
+        scheduler = OperationScheduler(max_workers=4)
+        recorder = Recorder()
+        for name in ("create", "delete", "create-again"):
+            scheduler.submit("alice", name, recorder.job, name)
+        assert await scheduler.drain(timeout=2) == []
+        return recorder
+
+    recorder = asyncio.run(scenario())
+
+    assert recorder.events == [
+        ("start", "create"), ("end", "create"),
+        ("start", "delete"), ("end", "delete"),
+        ("start", "create-again"), ("end", "create-again"),
+    ]
+
+
+def test_global_limit_bounds_jobs_across_keys():
+    async def scenario():
+        scheduler = OperationScheduler(max_workers=2)
+        recorder = Recorder()
+        for user in ("a", "b", "c", "d", "e"):
+            scheduler.submit(user, user, recorder.job, user)
+        await asyncio.sleep(0)
+        stats = scheduler.stats()
+        await scheduler.drain(timeout=2)
+        return recorder, stats, scheduler.stats()
+
+    recorder, during, after = asyncio.run(scenario())
+
+    assert recorder.peak == 2
+    assert during["keys"] == 5
+    assert after["completed"] == 5
+    assert after["queued"] == 0 and after["keys"] == 0
+
+
+def test_named_pool_has_its_own_capacity():
+    async def scenario():
+        scheduler = OperationScheduler(max_workers=1, pools={"teardown": 2})
+        recorder = Recorder()
+        for user in ("a", "b", "c"):
+            scheduler.submit(user, f"bulk-{user}", recorder.job, f"bulk-{user}", 0.05, pool="teardown")
+        scheduler.submit("d", "create-d", recorder.job, "create-d", 0.05)
+        await asyncio.sleep(0.02)
+        stats = scheduler.stats()
+        await scheduler.drain(timeout=2)
+        return stats
+
+    stats = asyncio.run(scenario())
+
+    # Two teardowns and the default-pool job run together.
+    assert stats["pools"]["teardown"] == {"maxWorkers": 2, "running": 2}
+    assert stats["pools"]["default"] == {"maxWorkers": 1, "running": 1}
+    assert stats["queued"] == 1
+
+
+def test_unknown_pool_is_rejected():
+    async def scenario():
+        OperationScheduler().submit("a", "op", Recorder().job, "op", pool="missing")
+
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
+
+
+def test_failing_job_does_not_stop_the_queue():
+    async def scenario():
+        scheduler = OperationScheduler()
+        recorder = Recorder()
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        scheduler.submit("a", "broken", broken)
+        scheduler.submit("a", "next", recorder.job, "next")
+        await scheduler.drain(timeout=2)
+        return recorder, scheduler.stats()
+
+    recorder, stats = asyncio.run(scenario())
+
+    assert recorder.events == [("start", "next"), ("end", "next")]
+    assert stats["failed"] == 1 and stats["completed"] == 1
+
+
+def test_drain_cancels_and_reports_unfinished_operations():
+    async def scenario():
+        scheduler = OperationScheduler(max_workers=1)
+        recorder = Recorder()
+        scheduler.submit("a", "slow", recorder.job, "slow", 10)
+        scheduler.submit("a", "queued", recorder.job, "queued")
+        scheduler.submit("b", "waiting", recorder.job, "waiting")
+        await asyncio.sleep(0)
+        abandoned = await scheduler.drain(timeout=0.05)
+        with pytest.raises(SchedulerClosedError):
+            scheduler.submit("c", "late", recorder.job, "late")
+        return abandoned
+
+    assert sorted(asyncio.run(scenario())) == ["queued", "slow", "waiting"]
+
+
+def test_drain_reports_a_bulk_operation_once():
+    async def scenario():
+        scheduler = OperationScheduler(max_workers=1)
+        recorder = Recorder()
+        for user in ("a", "b", "c"):
+            scheduler.submit(user, "bulk", recorder.job, user, 10)
+        await asyncio.sleep(0)
+        return await scheduler.drain(timeout=0.01)
+
+    assert asyncio.run(scenario()) == ["bulk"]
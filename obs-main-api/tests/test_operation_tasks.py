@@ -0,0 +1,86 @@
+import asyncio
+
+from operations.operation_tasks import bulk_simulation_delete, run_user_delete
+
+
+class FakeAgentManager:
+    def delete_metrics_definitions(self, user_id):
+        pass
+
+
+class FakeConnector:
+    def __init__(self, users):
+        self.users = users
+        self.operations = {}
+        self.sync_result = True
+        self.on_sync = None
+        self.deleted = []
+        self.released = []
+        self.fail_delete = set()
+
+    def get_users_json(self):
+        return [dict(user) for user in self.users]
+
+    def update_users(self, mutate):
+        self.users = [dict(user) for user in mutate(self.get_users_json())]
+
+    def sync_users(self):
+        if self.on_sync is not None:
+            self.on_sync()
+        return self.sync_result
+
+    def release_user(self, user_id):
+        self.released.append(user_id)
+
+    def get_operation(self, operation_id):
+        return self.operations.get(operation_id, {})
+
+    def update_operation(self, operation_id, **fields):
+        self.operations.setdefault(operation_id, {}).update(fields)
+
+    def delete_simulation(self, user_id):
+        if user_id in self.fail_delete:
+            raise RuntimeError("namespace stuck")
+        self.deleted.append(user_id)
+
+
+def usernames(connector):
+    return [user["username"] for user in connector.users]
+
+
+def test_failed_user_delete_keeps_registry_changes_made_meanwhile():
+    connector = FakeConnector([{"username": "alice"}, {"username": "bob"}])
+    connector.sync_result = False
+    # Another user's create lands while Keycloak is being synced.
+    connector.on_sync = lambda: connector.users.append({"username": "carol"})
+
+    asyncio.run(run_user_delete(connector, "op1", "alice"))
+
+    assert sorted(usernames(connector)) == ["alice", "bob", "carol"]
+    assert connector.operations["op1"]["status"] == "failed"
+
+
+def test_user_delete_removes_the_user():
+    connector = FakeConnector([{"username": "alice"}, {"username": "bob"}])
+
+    asyncio.run(run_user_delete(connector, "op1", "alice"))
+
+    assert usernames(connector) == ["bob"]
+    assert connector.released == ["alice"]
+    assert connector.operations["op1"]["status"] == "succeeded"
+
+
+def test_bulk_teardown_completes_after_the_last_user():
+    connector = FakeConnector([])
+    connector.fail_delete = {"bob"}
+    teardown = bulk_simulation_delete(connector, "op1", ["alice", "bob"], FakeAgentManager())
+
+    async def scenario():
+        await teardown("alice")
+        assert connector.operations["op1"]["status"] == "running"
+        await teardown("bob")
+
+    asyncio.run(scenario())
+
+    assert connector.operations["op1"]["status"] == "failed"
+    assert connector.operations["op1"]["result"] == {"deleted": ["alice"], "failed": {"bob": "namespace stuck"}}
@@ -0,0 +1,131 @@
+import queue
+import threading
+import time
+
+from kubernetes import client  # type: ignore
+
+from cluster_connector.ResourceInformer import ResourceInformer
+
+
+def config_map(name, resource_version, value="v"):
+    return client.V1ConfigMap(
+        metadata=client.V1ObjectMeta(name=name, resource_version=resource_version), data={"value": value})
+
+
+def wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+class FakeCluster:
+    """A list function plus a watch fed from a queue; None ends a stream."""
+
+    def __init__(self, objects):
+        self.objects = list(objects)
+        self.lists = 0
+        self.events = queue.Queue()
+        self.watch_resource_versions = []
+
+    def list_function(self, namespace, label_selector=None, **kwargs):
+        self.lists += 1
+        return client.V1ConfigMapList(items=list(self.objects), metadata=client.V1ListMeta(resource_version=f"list-{self.lists}"))
+
+    def watch(self):
+        cluster = self
+        stopped = threading.Event()
+
+        class FakeWatch:
+            def stream(self, list_function, resource_version=None, **kwargs):
+                cluster.watch_resource_versions.append(resource_version)
+                while not stopped.is_set():
+                    try:
+                        event = cluster.events.get(timeout=0.01)
+                    except queue.Empty:
+                        continue
+                    if event is None:
+                        return
+                    yield event
+
+            def stop(self):
+                stopped.set()
+
+        return FakeWatch()
+
+
+def started_informer(cluster):
+    informer = ResourceInformer(cluster.list_function, "api", "app=test", watch_factory=cluster.watch)
+    seen = []
+    informer.add_listener(lambda event_type, obj: seen.append((event_type, obj.metadata.name, obj.metadata.resource_version)))
+    informer.start()
+    assert informer.wait_for_sync(2)
+    return informer, seen
+
+
+def test_lists_then_applies_watch_events():
+    cluster = FakeCluster([config_map("a", "1")])
+    informer, seen = started_informer(cluster)
+
+    cluster.events.put({"type": "ADDED", "object": config_map("b", "2")})
+    cluster.events.put({"type": "MODIFIED", "object": config_map("a", "3", "changed")})
+    cluster.events.put({"type": "DELETED", "object": config_map("b", "4")})
+    wait_until(lambda: len(seen) == 4)
+    informer.stop()
+
+    assert informer.get("a").data["value"] == "changed"
+    assert informer.get("b") is None
+    assert seen == [("MODIFIED", "a", "1"), ("ADDED", "b", "2"), ("MODIFIED", "a", "3"), ("DELETED", "b", "4")]
+    assert cluster.watch_resource_versions == ["list-1"]
+
+
+def test_only_the_cached_resource_version_is_skipped():
+    cluster = FakeCluster([config_map("a", "20")])
+    informer, seen = started_informer(cluster)
+
+    # Echo of the version already cached: skipped.
+    cluster.events.put({"type": "MODIFIED", "object": config_map("a", "20")})
+    # resourceVersions are opaque: a "smaller" one is still a newer write.
+    cluster.events.put({"type": "MODIFIED", "object": config_map("a", "3", "newer")})
+    wait_until(lambda: len(seen) == 2)
+    informer.stop()
+
+    assert informer.get("a").data["value"] == "newer"
+    assert seen == [("MODIFIED", "a", "20"), ("MODIFIED", "a", "3")]
+
+
+def test_error_event_relists_and_drops_objects_deleted_meanwhile():
+    cluster = FakeCluster([config_map("a", "1"), config_map("b", "2")])
+    informer, seen = started_informer(cluster)
+
+    cluster.objects = [config_map("b", "5")]
+    cluster.events.put({"type": "ERROR", "object": {"code": 410}})
+    wait_until(lambda: cluster.lists == 2 and informer.get("b").metadata.resource_version == "5")
+    informer.stop()
+
+    assert informer.get("a") is None
+    assert ("DELETED", "a", "1") in seen
+
+
+def test_write_through_updates_the_cache_without_the_watch():
+    cluster = FakeCluster([])
+    informer, seen = started_informer(cluster)
+
+    informer.upsert(config_map("a", "7"))
+    informer.upsert(config_map("a", "7"))
+    informer.remove("a")
+    informer.remove("a")
+    informer.stop()
+
+    assert informer.list() == []
+    assert seen == [("MODIFIED", "a", "7"), ("DELETED", "a", "7")]
+
+
+def test_stop_ends_the_watch_thread():
+    cluster = FakeCluster([])
+    informer, _ = started_informer(cluster)
+
+    informer.stop()
+    informer._thread.join(timeout=2)
+
+    assert not informer._thread.is_alive()
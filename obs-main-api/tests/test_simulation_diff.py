@@ -0,0 +1,65 @@
+from cluster_connector.SimulationDiff import SimulationDiff
+
+
+def agent(agent_id, agent_type="NodeJS", next_hop=None, **fields):
+    return {"id": agent_id, "type": agent_type, "nextHop": next_hop or [], **fields}
+
+
+def ids(agents):
+    return sorted(agent["id"] for agent in agents)
+
+
+def test_classifies_created_updated_deleted_and_unchanged():
+    stored = [agent("a"), agent("b"), agent("c")]
+    new = [agent("a"), agent("b", agent_type="Java"), agent("d")]
+
+    diff = SimulationDiff(stored, new)
+
+    assert ids(diff.created) == ["d"]
+    assert ids(diff.updated) == ["b"]
+    assert ids(diff.deleted) == ["c"]
+    assert ids(diff.unchanged) == ["a"]
+    assert not diff.is_empty()
+
+
+def test_next_hop_change_updates_the_agent():
+    stored = [agent("a", next_hop=["b"]), agent("b")]
+    new = [agent("a", next_hop=["b", "c"]), agent("b"), agent("c")]
+
+    diff = SimulationDiff(stored, new)
+
+    assert ids(diff.updated) == ["a"]
+    assert ids(diff.created) == ["c"]
+    assert ids(diff.unchanged) == ["b"]
+
+
+def test_next_hop_order_is_significant():
+    diff = SimulationDiff([agent("a", next_hop=["b", "c"])], [agent("a", next_hop=["c", "b"])])
+
+    assert ids(diff.updated) == ["a"]
+
+
+def test_missing_and_empty_next_hop_are_equal():
+    stored = [{"id": "a", "type": "NodeJS"}]
+    new = [agent("a", next_hop=[])]
+
+    diff = SimulationDiff(stored, new)
+
+    assert ids(diff.unchanged) == ["a"]
+    assert diff.is_empty()
+
+
+def test_fields_outside_the_deployment_are_ignored():
+    stored = [agent("a", metrics={"requests": 1}, pod="a-123")]
+    new = [agent("a", metrics={"requests": 5})]
+
+    assert SimulationDiff(stored, new).is_empty()
+
+
+def test_identical_simulations_produce_an_empty_diff():
+    agents = [agent("a", next_hop=["b"]), agent("b")]
+
+    diff = SimulationDiff(agents, [dict(a) for a in agents])
+
+    assert diff.is_empty()
+    assert str(diff) == "0 to create, 0 to update, 0 to delete, 2 unchanged"
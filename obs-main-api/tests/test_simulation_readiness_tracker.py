@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+
+import pytest
+from kubernetes.client.rest import ApiException  # type: ignore
+
+import cluster_connector.SimulationReadinessTracker as tracker_module
+from cluster_connector.SimulationReadinessTracker import SimulationReadinessTracker
+
+
+def deployment(name, ready=True):
+    replicas = 1 if ready else 0
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, generation=1),
+        spec=SimpleNamespace(replicas=1),
+        status=SimpleNamespace(
+            observed_generation=1, updated_replicas=replicas, replicas=1, ready_replicas=replicas),
+    )
+
+
+def service(name, ip="10.0.0.1"):
+    return SimpleNamespace(metadata=SimpleNamespace(name=name), spec=SimpleNamespace(cluster_ip=ip))
+
+
+class FakeApis:
+    """Plays one scripted stream per watch request, per kind."""
+
+    def __init__(self, deployments, services):
+        self.scripts = {self.list_namespaced_deployment: list(deployments), self.list_namespaced_service: list(services)}
+        self.requests = {self.list_namespaced_deployment: 0, self.list_namespaced_service: 0}
+
+    def list_namespaced_deployment(self, **kwargs):
+        raise AssertionError("only used through the watch")
+
+    def list_namespaced_service(self, **kwargs):
+        raise AssertionError("only used through the watch")
+
+    def watch(self):
+        apis = self
+
+        class FakeWatch:
+            def stream(self, list_function, **kwargs):
+                apis.requests[list_function] += 1
+                script = apis.scripts[list_function]
+                step = script.pop(0) if script else []
+                if isinstance(step, Exception):
+                    raise step
+                yield from step
+
+            def stop(self):
+                pass
+
+        return FakeWatch()
+
+
+def tracker_for(apis, names):
+    return SimulationReadinessTracker(apis, apis, "user", names, watch_factory=apis.watch)
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(tracker_module, "RETRY_DELAY_SECONDS", 0.01)
+
+
+def test_ready_once_every_deployment_and_service_is_ready():
+    apis = FakeApis(
+        deployments=[[
+            {"type": "ADDED", "object": deployment("a", ready=False)},
+            {"type": "MODIFIED", "object": deployment("a")},
+            {"type": "ADDED", "object": deployment("b")},
+            {"type": "ADDED", "object": deployment("unrelated", ready=False)},
+        ]],
+        services=[[
+            {"type": "ADDED", "object": service("a", "10.0.0.1")},
+            {"type": "ADDED", "object": service("b", "10.0.0.2")},
+        ]],
+    )
+    tracker = tracker_for(apis, ["a", "b"])
+
+    assert tracker.wait(timeout=5)
+    assert tracker.ready_deployments == {"a", "b"}
+    assert tracker.service_ips == {"a": "10.0.0.1", "b": "10.0.0.2"}
+
+
+def test_api_exception_without_status_is_retried():
+    apis = FakeApis(
+        deployments=[ApiException(status=None, reason="connection dropped"), [{"type": "ADDED", "object": deployment("a")}]],
+        services=[[{"type": "ADDED", "object": service("a")}]],
+    )
+
+    assert tracker_for(apis, ["a"]).wait(timeout=5)
+    assert apis.requests[apis.list_namespaced_deployment] == 2
+
+
+def test_error_event_and_connection_reset_restart_the_watch():
+    apis = FakeApis(
+        deployments=[
+            [{"type": "ERROR", "object": {"code": 410, "message": "too old resource version"}}],
+            ConnectionResetError("reset by peer"),
+            [{"type": "ADDED", "object": deployment("a")}],
+        ],
+        services=[[{"type": "ADDED", "object": service("a")}]],
+    )
+
+    assert tracker_for(apis, ["a"]).wait(timeout=5)
+    assert apis.requests[apis.list_namespaced_deployment] == 3
+
+
+def test_client_error_is_raised_without_waiting_for_the_deadline():
+    apis = FakeApis(deployments=[ApiException(status=403, reason="Forbidden")], services=[])
+
+    with pytest.raises(ApiException):
+        tracker_for(apis, ["a"]).wait(timeout=30)
+
+
+def test_times_out_when_an_agent_never_becomes_ready():
+    apis = FakeApis(
+        deployments=[[{"type": "ADDED", "object": deployment("a", ready=False)}]],
+        services=[[{"type": "ADDED", "object": service("a")}]],
+    )
+    tracker = tracker_for(apis, ["a"])
+
+    assert not tracker.wait(timeout=1)
+    assert tracker.ready_deployments == set()
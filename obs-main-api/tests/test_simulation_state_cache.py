@@ -0,0 +1,108 @@
+import base64
+
+from kubernetes import client  # type: ignore
+
+from cluster_connector.SimulationStateCache import SIMULATION_SECRET, SimulationStateCache
+from cluster_connector.SimulationStateCodec import SimulationStateCodec
+from fake_kubernetes import FakeCoreV1Api, IdleWatch
+
+
+SIMULATION = {"agents": [{"id": "a1", "name": "Agent 1"}], "services": [], "user": {"monitoringType": "otel"}}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def secret_for(simulation):
+    state = SimulationStateCodec.encode(simulation)
+    return client.V1Secret(
+        metadata=client.V1ObjectMeta(name=SIMULATION_SECRET, labels={"observability-demo-framework": "storage"}),
+        data={"simulation": base64.b64encode(state).decode("utf-8")},
+    )
+
+
+def cache_for(api, **kwargs):
+    return SimulationStateCache(api, sync_timeout_seconds=2, watch_factory=IdleWatch, **kwargs)
+
+
+def test_stored_simulation_is_then_served_from_the_informer():
+    api = FakeCoreV1Api()
+    api.create_namespaced_secret("ns-a", secret_for(SIMULATION))
+    cache = cache_for(api)
+
+    first, _ = cache.read("ns-a")
+    first["agents"].append({"id": "mutated"})
+    second, _ = cache.read("ns-a")
+    third, _ = cache.read("ns-a")
+    cache.close()
+
+    assert third == SimulationStateCodec.decode(SimulationStateCodec.encode(SIMULATION))
+    assert second == third
+    assert api.secret_reads == 1
+    assert api.list_calls == 1
+
+
+def test_namespace_without_a_simulation_is_not_watched():
+    api = FakeCoreV1Api()
+    clock = Clock()
+    cache = cache_for(api, missing_ttl_seconds=30, clock=clock)
+
+    assert cache.read("ns-a") == (None, None)
+    assert cache.read("ns-a") == (None, None)
+    stats = cache.stats()
+    clock.now = 31
+    cache.read("ns-a")
+    cache.close()
+
+    assert stats["namespaces"] == 0
+    assert stats["knownMissing"] == 1
+    assert api.list_calls == 0
+    assert api.secret_reads == 2
+
+
+def test_saved_simulation_clears_the_missing_entry():
+    api = FakeCoreV1Api()
+    cache = cache_for(api)
+    assert cache.read("ns-a") == (None, None)
+
+    cache.put("ns-a", api.create_namespaced_secret("ns-a", secret_for(SIMULATION)))
+    simulation, _ = cache.read("ns-a")
+    cache.close()
+
+    assert simulation["agents"][0]["id"] == "a1"
+
+
+def test_informers_are_bounded_per_namespace():
+    api = FakeCoreV1Api()
+    for namespace in ("ns-a", "ns-b", "ns-c"):
+        api.create_namespaced_secret(namespace, secret_for(SIMULATION))
+    cache = cache_for(api, max_namespaces=2)
+
+    for namespace in ("ns-a", "ns-b", "ns-c"):
+        cache.read(namespace)
+    stats = cache.stats()
+    cache.close()
+
+    assert stats["namespaces"] == 2
+    assert stats["evicted"] == 1
+
+
+def test_evict_forgets_a_deleted_simulation():
+    api = FakeCoreV1Api()
+    api.create_namespaced_secret("ns-a", secret_for(SIMULATION))
+    cache = cache_for(api)
+    cache.read("ns-a")
+
+    del api.secrets[("ns-a", SIMULATION_SECRET)]
+    cache.evict("ns-a")
+    result = cache.read("ns-a")
+    stats = cache.stats()
+    cache.close()
+
+    assert result == (None, None)
+    assert stats["namespaces"] == 0
@@ -0,0 +1,55 @@
+import gzip
+import json
+
+from cluster_connector.SimulationStateCodec import FORMAT_HEADER, SimulationStateCodec
+
+
+def simulation():
+    return {
+        "layout": [
+            {"group": "nodes", "data": {"id": "a"}, "position": {"x": 1, "y": 2}, "selected": True},
+        ],
+        "agents": [
+            {"id": "a", "type": "NodeJS", "nextHop": ["b"], "metrics": {"requests": 3}, "pod": "a-1", "podPhase": "Running"},
+            {"id": "b", "type": "Java", "nextHop": [], "metricsError": "timeout"},
+        ],
+        "user": {"username": "alice", "monitoringType": "coo", "password": "secret"},
+    }
+
+
+def test_round_trip_keeps_the_stored_fields_only():
+    decoded = SimulationStateCodec.decode(SimulationStateCodec.encode(simulation()))
+
+    assert decoded == {
+        "layout": [{"group": "nodes", "data": {"id": "a"}, "position": {"x": 1, "y": 2}}],
+        "agents": [
+            {"id": "a", "type": "NodeJS", "nextHop": ["b"]},
+            {"id": "b", "type": "Java", "nextHop": []},
+        ],
+        "user": {"username": "alice", "monitoringType": "coo"},
+    }
+
+
+def test_encoded_state_is_gzip_behind_the_header():
+    data = SimulationStateCodec.encode(simulation())
+
+    assert data.startswith(FORMAT_HEADER)
+    assert not SimulationStateCodec.is_legacy(data)
+    assert json.loads(gzip.decompress(data[len(FORMAT_HEADER):])) == SimulationStateCodec.compact(simulation())
+
+
+def test_encoding_is_deterministic():
+    assert SimulationStateCodec.encode(simulation()) == SimulationStateCodec.encode(simulation())
+
+
+def test_legacy_plain_json_is_decoded_as_is():
+    legacy = json.dumps(simulation()).encode("utf-8")
+
+    assert SimulationStateCodec.is_legacy(legacy)
+    assert SimulationStateCodec.decode(legacy) == simulation()
+
+
+def test_missing_sections_are_stored_empty():
+    decoded = SimulationStateCodec.decode(SimulationStateCodec.encode({"agents": [{"id": "a"}]}))
+
+    assert decoded == {"layout": [], "agents": [{"id": "a"}], "user": {}}